@@ -140,6 +140,21 @@ catch {
   # Bu hata kritik değil, devam et
 }
 
+# Veri dosyalarını minify et ve .gz/.br kardeşlerini üret
+Write-Warning "Veri dosyaları sıkıştırılıyor..."
+try {
+  python scripts/compress-data.py --dir (Join-Path $TargetPath "data")
+  if ($LASTEXITCODE -eq 0) {
+    Write-Success "Veri dosyaları sıkıştırıldı"
+  } else {
+    Write-Warning "Veri sıkıştırma başarısız (çıkış kodu: $LASTEXITCODE), ham dosyalar yayınlanacak"
+  }
+}
+catch {
+  Write-Warning "Veri sıkıştırma çalıştırılamadı: $($_.Exception.Message)"
+  # Bu hata kritik değil, devam et
+}
+
 # Özet bilgiler
 Write-Info "═══════════════════════════════════════"
 Write-Success "Deploy işlemi tamamlandı!"
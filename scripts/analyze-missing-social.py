@@ -3,43 +3,36 @@
 Şirket JSON dosyalarındaki eksik sosyal medya linklerini analiz eder
 """
 
-import json
-import os
-from pathlib import Path
 from collections import defaultdict
 
-def load_company_json(file_path):
-    """JSON dosyasını yükle"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"❌ Hata ({file_path}): {e}")
-        return None
-
-def check_missing_social_links(company_data):
-    """Eksik sosyal medya linklerini kontrol et"""
-    social_platforms = ['linkedin', 'x', 'instagram', 'facebook', 'youtube', 'github']
-    missing = []
-
-    # Social alanını kontrol et
-    social = company_data.get('social', {})
-    if not social:
-        social = {}
-
-    for platform in social_platforms:
-        link = social.get(platform)
-        if not link or not str(link).strip():
-            missing.append(platform)
-
-    return missing
-
-def analyze_all_companies(data_dir):
+from company_corpus import company_summary, load_companies
+
+def iter_company_summaries(data_dir, use_index=True):
+    """(slug, isim, web, eksik platformlar) dörtlülerini ve toplam dosya sayısını döner
+
+    use_index=True ise kalıcı indeks kullanılır; sadece değişen dosyalar parse edilir.
+    İki yol da satırları company_summary ile üretir.
+    """
+    if use_index:
+        from company_index import CompanyIndex
+        with CompanyIndex(data_dir) as index:
+            refresh_stats = index.refresh(verbose=True)
+            summaries = [
+                company_summary(row['slug'], row['name'], row['web'],
+                                row['missing_social'].split(',') if row['missing_social'] else [])
+                for row in index.summaries()
+            ]
+        return summaries, refresh_stats['total']
+
+    corpus = load_companies(data_dir)
+    return [record.summary for record in corpus], corpus.file_count
+
+def analyze_all_companies(data_dir, use_index=True):
     """Tüm şirketleri analiz et"""
-    company_files = list(Path(data_dir).glob('*.json'))
+    summaries, total = iter_company_summaries(data_dir, use_index=use_index)
 
     stats = {
-        'total': len(company_files),
+        'total': total,
         'with_missing': 0,
         'platform_stats': defaultdict(int),
         'companies_by_missing': defaultdict(list)
@@ -47,20 +40,12 @@ def analyze_all_companies(data_dir):
 
     missing_details = []
 
-    for file_path in sorted(company_files):
-        company_data = load_company_json(file_path)
-        if not company_data:
-            continue
-
-        missing = check_missing_social_links(company_data)
-
+    for slug, company_name, web, missing in summaries:
         if missing:
             stats['with_missing'] += 1
-            company_name = company_data.get('name', file_path.stem)
-            web = company_data.get('contact', {}).get('web', 'N/A')
 
             missing_details.append({
-                'file': file_path.stem,
+                'file': slug,
                 'name': company_name,
                 'web': web,
                 'missing': missing,
@@ -71,7 +56,7 @@ def analyze_all_companies(data_dir):
                 stats['platform_stats'][platform] += 1
 
             # Eksik sayısına göre grupla
-            stats['companies_by_missing'][len(missing)].append(file_path.stem)
+            stats['companies_by_missing'][len(missing)].append(slug)
 
     return stats, missing_details
 
@@ -168,12 +153,14 @@ def main():
     parser.add_argument('--export', type=str, help='CSV dosyası olarak export et')
     parser.add_argument('--data-dir', type=str, default='public/data/company',
                         help='Şirket JSON dosyalarının bulunduğu dizin')
+    parser.add_argument('--no-index', action='store_true',
+                        help='Kalıcı indeksi kullanma, tüm dosyaları yeniden oku')
 
     args = parser.parse_args()
 
     print("🔍 Şirket dosyaları taranıyor...\n")
 
-    stats, missing_details = analyze_all_companies(args.data_dir)
+    stats, missing_details = analyze_all_companies(args.data_dir, use_index=not args.no_index)
     sorted_details = print_analysis(stats, missing_details)
 
     if args.export:
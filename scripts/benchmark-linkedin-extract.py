@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn extractor'leri icin golden-corpus regresyon testi ve benchmark.
+
+linkedin-responses/ altindaki HTML yanitlari her extractor'e (eski
+BeautifulSoup, tam gecis, head-only) ayri bir alt surecte verilir ve her biri
+icin sayfa/s, tepe bellek (RSS) ve alan bazinda doluluk oranlari raporlanir.
+
+Tam gecis ciktisi golden/linkedin-extract.json snapshot'i ile karsilastirilir;
+fark varsa script 1 ile cikar. Extractor ciktisi bilerek degistirildiginde
+snapshot --update-golden ile yenilenir (EXTRACTOR_VERSION da artirilmalidir).
+
+Kullanim:
+    python scripts/benchmark-linkedin-extract.py
+    python scripts/benchmark-linkedin-extract.py --limit 50 --repeat 3
+    python scripts/benchmark-linkedin-extract.py --extractors full head-only
+    python scripts/benchmark-linkedin-extract.py --update-golden
+"""
+
+import argparse
+import importlib.util
+import json
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:
+    # Windows: tepe RSS olculemez
+    resource = None
+
+from bs4 import BeautifulSoup
+
+from linkedin_extract import EXTRACTOR_VERSION, LINKEDIN_FIELDS, collect_page, extract_linkedin_info
+
+# Output encoding fix for Windows
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+SCRIPTS_DIR = Path(__file__).parent
+LINKEDIN_RESPONSES_DIR = SCRIPTS_DIR.parent / 'linkedin-responses'
+GOLDEN_FILE = SCRIPTS_DIR / 'golden' / 'linkedin-extract.json'
+
+# Head-only modda tam gecisle ayni cikan alanlar (aciklama og:description'dan gelir)
+HEAD_FIELDS = ('companyName', 'tagline', 'industry', 'followers', 'logoUrl')
+
+
+def _load_response_parser():
+    """parse-linkedin-responses.py modulunu yukler (dosya adinda tire var)"""
+    spec = importlib.util.spec_from_file_location(
+        'parse_linkedin_responses', SCRIPTS_DIR / 'parse-linkedin-responses.py'
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def legacy_extract_linkedin_info(html_content):
+    """Eski BeautifulSoup tabanli extractor (parse-linkedin-responses.py, karsilastirma icin)"""
+    info = {
+        "companyName": None,
+        "tagline": None,
+        "description": None,
+        "website": None,
+        "industry": None,
+        "companySize": None,
+        "headquarters": None,
+        "specialties": None,
+        "followers": None,
+        "logoUrl": None
+    }
+
+    try:
+        soup = BeautifulSoup(html_content, 'html.parser')
+
+        # Sirket adi - meta tag'den
+        name_meta = soup.find('meta', {'property': 'og:title'})
+        if name_meta:
+            info['companyName'] = name_meta.get('content', '').strip()
+
+        # Logo URL - og:image meta tag'den
+        logo_meta = soup.find('meta', {'property': 'og:image'})
+        if logo_meta:
+            logo_url = logo_meta.get('content', '').strip()
+            if logo_url and 'company-logo' in logo_url:
+                info['logoUrl'] = logo_url
+
+        # Tagline - h4 tag'inden (top-card-layout__second-subline)
+        tagline_tag = soup.find('h4', {'class': re.compile(r'top-card-layout__second-subline')})
+        if tagline_tag:
+            tagline_span = tagline_tag.find('span')
+            if tagline_span:
+                tagline = tagline_span.get_text().strip()
+                # HTML entities'leri temizle
+                tagline = tagline.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
+                if tagline and len(tagline) > 5:
+                    info['tagline'] = tagline
+
+        # Takipci sayisi - meta description'dan
+        desc_meta = soup.find('meta', {'property': 'og:description'})
+        if desc_meta:
+            desc = desc_meta.get('content', '').strip()
+            # Takipci sayisini ayir
+            follower_match = re.search(r'(\d+(?:[.,]\d+)?[KMB]?)\s+takipci', desc, re.IGNORECASE)
+            if follower_match:
+                info['followers'] = follower_match.group(1)
+
+        # About/Hakkinda bolumu - JSON-LD'den veya text'ten
+        scripts = soup.find_all('script', {'type': 'application/ld+json'})
+        for script in scripts:
+            try:
+                data = json.loads(script.string)
+                if isinstance(data, dict):
+                    if 'description' in data:
+                        info['description'] = data['description']
+                    if 'name' in data and not info['companyName']:
+                        info['companyName'] = data['name']
+            except:
+                pass
+
+        # Diger bilgiler - text iceriginden
+        text = soup.get_text()
+
+        # Web sitesi
+        website_match = re.search(r'Web\s*sitesi[:\s]+([^\s]+)', text, re.IGNORECASE)
+        if website_match:
+            info['website'] = website_match.group(1).strip()
+
+        # Sektor/Industry - HTML yapisindan
+        # Oncelikle h2 tag'inden (top-card-layout__headline)
+        industry_tag = soup.find('h2', {'class': re.compile(r'top-card-layout__headline')})
+        if industry_tag:
+            industry_text = industry_tag.get_text().strip()
+            if industry_text and len(industry_text) > 5 and len(industry_text) < 200:
+                info['industry'] = industry_text
+
+        # Yoksa text'ten regex ile bul
+        if not info['industry']:
+            industry_match = re.search(r'Sektor[:\s]+([^\n]+)', text, re.IGNORECASE)
+            if not industry_match:
+                industry_match = re.search(r'Industry[:\s]+([^\n]+)', text, re.IGNORECASE)
+            if industry_match:
+                industry_text = industry_match.group(1).strip()
+                if industry_text and len(industry_text) > 5 and len(industry_text) < 200:
+                    info['industry'] = industry_text
+
+        # Sirket buyuklugu
+        size_match = re.search(r'Sirket buyuklugu[:\s]+([^\n]+)', text, re.IGNORECASE)
+        if not size_match:
+            size_match = re.search(r'Company size[:\s]+([^\n]+)', text, re.IGNORECASE)
+        if size_match:
+            info['companySize'] = size_match.group(1).strip()
+
+        # Genel merkez
+        hq_match = re.search(r'Genel merkez[:\s]+([^\n]+)', text, re.IGNORECASE)
+        if not hq_match:
+            hq_match = re.search(r'Headquarters[:\s]+([^\n]+)', text, re.IGNORECASE)
+        if hq_match:
+            info['headquarters'] = hq_match.group(1).strip()
+
+        # Uzmanliklar
+        spec_match = re.search(r'Uzmanliklar[:\s]+([^\n]+)', text, re.IGNORECASE)
+        if not spec_match:
+            spec_match = re.search(r'Specialties[:\s]+([^\n]+)', text, re.IGNORECASE)
+        if spec_match:
+            info['specialties'] = spec_match.group(1).strip()
+
+    except Exception as e:
+        print(f"  [!] Parse hatasi: {e}")
+
+    return info
+
+
+def load_html_pages(limit=None):
+    """HTML sinifindaki yanitlarin body'lerini (dosya adi, html) olarak dondurur"""
+    parser = _load_response_parser()
+    pages = []
+
+    for response_file in sorted(LINKEDIN_RESPONSES_DIR.glob('*.txt')):
+        with open(response_file, 'r', encoding='utf-8') as f:
+            header = parser.read_response_header(f)
+            if header['class'] != 'html':
+                continue
+            html_content = f.read().lstrip()
+
+        if html_content:
+            pages.append((response_file.name, html_content))
+            if limit and len(pages) >= limit:
+                break
+
+    return pages
+
+
+def extract_head_only(html_content):
+    return extract_linkedin_info(html_content, head_only=True)
+
+
+# Ad -> extractor; alt surece isimle gecirilir
+EXTRACTORS = {
+    'legacy': legacy_extract_linkedin_info,
+    'full': extract_linkedin_info,
+    'head-only': extract_head_only,
+}
+
+
+def _peak_rss_mb():
+    """Surecin tepe RSS degeri (MB), olculemiyorsa None"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux KB, macOS byte dondurur
+    return peak / (1024 * 1024 if sys.platform == 'darwin' else 1024)
+
+
+def run_extractor(name, limit, repeat):
+    """Alt surecte calisir: sayfalari yukler ve extractor'u olcer
+
+    Returns:
+        dict: seconds (en iyi tur), results (dosya adi -> bilgi),
+        parsed (parse edilen ortalama sayfa orani), base_rss/peak_rss (MB)
+    """
+    extractor = EXTRACTORS[name]
+    pages = load_html_pages(limit)
+    base_rss = _peak_rss_mb()
+
+    best = None
+    results = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        results = [extractor(html_content) for _, html_content in pages]
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    parsed = None
+    if name != 'legacy' and pages:
+        head_only = name == 'head-only'
+        parsed = sum(collect_page(html_content, head_only=head_only).parsed_chars / len(html_content)
+                     for _, html_content in pages) / len(pages)
+
+    return {
+        'seconds': best,
+        'results': {file_name: info for (file_name, _), info in zip(pages, results)},
+        'parsed': parsed,
+        'base_rss': base_rss,
+        'peak_rss': _peak_rss_mb(),
+    }
+
+
+def measure(names, limit, repeat):
+    """Her extractor'u temiz bir alt surecte calistirir (RSS olcumleri birbirini etkilemesin)"""
+    measurements = {}
+    for name in names:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            measurements[name] = executor.submit(run_extractor, name, limit, repeat).result()
+    return measurements
+
+
+def load_golden(path):
+    """Golden snapshot'i okur: (extractor surumu, dosya adi -> bilgi)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        snapshot = json.load(f)
+    return snapshot['extractorVersion'], snapshot['pages']
+
+
+def write_golden(path, results):
+    """Tam gecis ciktisini golden snapshot olarak yazar"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    snapshot = {'extractorVersion': EXTRACTOR_VERSION, 'pages': results}
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(snapshot, f, ensure_ascii=False, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def _shorten(value, limit=60):
+    text = json.dumps(value, ensure_ascii=False)
+    return text[:limit] + '...' if len(text) > limit else text
+
+
+def diff_golden(golden, results, show=10):
+    """Ciktiyi golden snapshot ile karsilastirir
+
+    Returns:
+        dict: alan -> farkli sayfa sayisi (eksik/fazla sayfalar '(sayfa)' altinda)
+    """
+    differences = {}
+    shown = 0
+
+    missing = sorted(set(results) - set(golden))
+    if missing:
+        differences['(sayfa)'] = len(missing)
+        print(f"[X] Golden'da olmayan {len(missing)} sayfa: {', '.join(missing[:show])}")
+
+    for file_name in sorted(set(results) & set(golden)):
+        expected, actual = golden[file_name], results[file_name]
+        for field in LINKEDIN_FIELDS:
+            if expected.get(field) == actual.get(field):
+                continue
+            differences[field] = differences.get(field, 0) + 1
+            if shown < show:
+                shown += 1
+                print(f"[X] {file_name}: {field}")
+                print(f"      golden: {_shorten(expected.get(field))}")
+                print(f"      simdi:  {_shorten(actual.get(field))}")
+
+    if shown < sum(differences.values()):
+        print(f"    ... ve {sum(differences.values()) - shown} fark daha")
+    return differences
+
+
+def print_throughput_report(measurements, page_count):
+    """Extractor basina sure, sayfa/s, parse orani ve tepe RSS tablosu"""
+    baseline = measurements.get('legacy')
+    print(f"{'Extractor':10} {'Sure':>8} {'Sayfa/s':>9} {'Hiz':>7} {'Parse':>7} {'Tepe RSS':>9} {'Artis':>8}")
+    for name, m in measurements.items():
+        speedup = f"{baseline['seconds'] / m['seconds']:6.1f}x" if baseline else '      -'
+        parsed = f"{m['parsed'] * 100:6.1f}%" if m['parsed'] is not None else '      -'
+        if m['peak_rss'] is not None:
+            rss = f"{m['peak_rss']:6.1f} MB {m['peak_rss'] - m['base_rss']:5.1f} MB"
+        else:
+            rss = f"{'-':>9} {'-':>8}"
+        print(f"{name:10} {m['seconds']:7.2f}s {page_count / m['seconds']:9.1f} {speedup} {parsed} {rss}")
+
+
+def print_field_report(measurements, page_count, golden_differences=None):
+    """Alan bazinda extractor doluluk oranlari (ve golden farklari)"""
+    header = f"{'Alan':14}" + ''.join(f" {name:>10}" for name in measurements)
+    if golden_differences is not None:
+        header += f" {'Golden fark':>12}"
+    print(header)
+    for field in LINKEDIN_FIELDS:
+        row = f"{field:14}"
+        for m in measurements.values():
+            filled = sum(1 for info in m['results'].values() if info.get(field))
+            row += f" {filled / page_count * 100:9.1f}%"
+        if golden_differences is not None:
+            row += f" {golden_differences.get(field, 0):12}"
+        print(row)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='LinkedIn extractor golden-corpus testi ve benchmark')
+    parser.add_argument('--limit', type=int, help='En fazla bu kadar HTML sayfasi kullan')
+    parser.add_argument('--repeat', type=int, default=1, help='Her extractor icin tur sayisi (en iyisi alinir)')
+    parser.add_argument('--extractors', nargs='+', choices=list(EXTRACTORS), default=list(EXTRACTORS),
+                        help='Olculecek extractor\'ler (varsayilan: hepsi)')
+    parser.add_argument('--golden', type=Path, default=GOLDEN_FILE, help='Golden snapshot dosyasi')
+    parser.add_argument('--update-golden', action='store_true',
+                        help='Tam gecis ciktisini golden snapshot olarak kaydet')
+
+    args = parser.parse_args()
+
+    if args.update_golden and args.limit:
+        print("[!] --update-golden tum corpus ile calismalidir (--limit kullanmayin)")
+        return 1
+
+    names = list(args.extractors)
+    if 'full' not in names:
+        # Golden karsilastirmasi tam gecis ciktisi uzerinden yapilir
+        names.append('full')
+
+    measurements = measure(names, args.limit, args.repeat)
+    page_count = len(measurements['full']['results'])
+    if not page_count:
+        print(f"[!] {LINKEDIN_RESPONSES_DIR} altinda HTML yanit bulunamadi")
+        return 1
+
+    print(f"[*] {page_count} HTML sayfasi, EXTRACTOR_VERSION={EXTRACTOR_VERSION}")
+    print()
+    print_throughput_report(measurements, page_count)
+    print()
+
+    full_results = measurements['full']['results']
+    failed = False
+
+    golden_differences = None
+    if args.update_golden:
+        write_golden(args.golden, full_results)
+        print(f"[OK] Golden snapshot yazildi: {args.golden} ({page_count} sayfa)")
+        print()
+    elif args.golden.exists():
+        golden_version, golden = load_golden(args.golden)
+        if golden_version != EXTRACTOR_VERSION:
+            print(f"[!] Golden snapshot EXTRACTOR_VERSION={golden_version} ile uretilmis")
+        golden_differences = diff_golden(golden, full_results)
+        failed = failed or bool(golden_differences)
+        print()
+    else:
+        print(f"[!] Golden snapshot bulunamadi: {args.golden} (--update-golden ile olusturun)")
+        print()
+
+    print_field_report(measurements, page_count, golden_differences)
+
+    if 'head-only' in measurements:
+        # Head-only modda head/top-card alanlari tam gecisle ayni olmali
+        head_results = measurements['head-only']['results']
+        head_mismatches = 0
+        for file_name, full in full_results.items():
+            fields = [key for key in HEAD_FIELDS if full[key] != head_results[file_name][key]]
+            if fields:
+                head_mismatches += 1
+                print(f"[X] Farkli head alani: {file_name}: {', '.join(fields)}")
+        print()
+        print(f"[*] Esit head alanlari: {page_count - head_mismatches}/{page_count}")
+        failed = failed or bool(head_mismatches)
+
+    if golden_differences is not None:
+        total = sum(golden_differences.values())
+        print(f"[*] Golden: {'fark yok' if not total else f'{total} alan farkli'}")
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
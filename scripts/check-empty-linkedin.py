@@ -5,9 +5,10 @@ public/data/company klasöründeki JSON dosyalarında
 LinkedIn alanı boş olan firmaları listeler
 """
 
-import json
 from pathlib import Path
 
+from company_corpus import load_companies
+
 def check_empty_linkedin():
     """LinkedIn alanı boş olan firmaları bul"""
 
@@ -17,16 +18,16 @@ def check_empty_linkedin():
         print(f"❌ Dizin bulunamadı: {company_dir}")
         return []
 
-    json_files = sorted(company_dir.glob('*.json'))
-    print(f"🔍 {len(json_files)} şirket dosyası taranıyor...\n")
+    corpus = load_companies(company_dir, verbose=False)
+    print(f"🔍 {corpus.file_count} şirket dosyası taranıyor...\n")
 
     empty_linkedin = []
-    errors = []
+    errors = [{'file': path.stem, 'error': str(e)} for path, e in corpus.errors]
 
-    for json_file in json_files:
+    for record in corpus:
+        json_file = record.path
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = record.data
 
             # Social alanını kontrol et
             social = data.get('social')
@@ -76,7 +77,7 @@ def check_empty_linkedin():
     print("=" * 80)
     print("📊 LİNKEDİN ALANI BOŞ OLAN FİRMALAR")
     print("=" * 80)
-    print(f"\nToplam: {len(empty_linkedin)}/{len(json_files)} şirket\n")
+    print(f"\nToplam: {len(empty_linkedin)}/{corpus.file_count} şirket\n")
     print("-" * 80)
 
     # İlk 20'yi göster
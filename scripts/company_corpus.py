@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Şirket JSON dosyalarını tek geçişte yükleyen ortak modül.
+Slug, web domain ve LinkedIn slug'ına göre hazır arama tabloları sunar.
+
+Kullanım:
+    from company_corpus import load_companies
+
+    corpus = load_companies()
+    company = corpus.by_slug['innova']
+    company = corpus.find_by_domain('https://www.innova.com.tr/')
+    company = corpus.find_by_linkedin('https://tr.linkedin.com/company/innova/')
+"""
+
+import json
+from pathlib import Path
+from urllib.parse import urlparse, unquote
+
+# orjson varsa daha hızlı decode için kullan (opsiyonel)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ROOT_DIR = Path(__file__).parent.parent
+COMPANY_DATA_DIR = ROOT_DIR / 'public' / 'data' / 'company'
+CACHE_DIR = ROOT_DIR / '.cache'
+
+SOCIAL_PLATFORMS = ['linkedin', 'x', 'instagram', 'facebook', 'youtube', 'github']
+
+
+def decode_json(raw):
+    """Ham byte içeriğini JSON olarak çözer (orjson varsa onu kullanır)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def normalize_domain(url):
+    """Web adresinden karşılaştırılabilir domain çıkarır (www. ve port olmadan)"""
+    if not url or not isinstance(url, str):
+        return ''
+
+    url = url.strip()
+    if '://' not in url:
+        url = 'http://' + url
+
+    host = urlparse(url).hostname or ''
+    host = host.lower().rstrip('.')
+    if host.startswith('www.'):
+        host = host[4:]
+    return host
+
+
+def normalize_linkedin_slug(url):
+    """LinkedIn URL'sinden karşılaştırılabilir slug çıkarır
+
+    Örnekler:
+        https://linkedin.com/company/innova           -> innova
+        https://tr.linkedin.com/company/Innova/about/ -> innova
+        https://www.linkedin.com/company/164632?trk=x -> 164632
+        https://linkedin.com/in/pmteknoloji           -> in/pmteknoloji
+    """
+    if not url or not isinstance(url, str):
+        return ''
+
+    url = url.strip()
+    if '://' not in url:
+        url = 'https://' + url
+
+    parsed = urlparse(url)
+    host = (parsed.hostname or '').lower()
+    if host != 'linkedin.com' and not host.endswith('.linkedin.com'):
+        return ''
+
+    parts = [unquote(p) for p in parsed.path.split('/') if p]
+    if len(parts) < 2:
+        return ''
+
+    kind, slug = parts[0].lower(), parts[1].strip().lower()
+    if not slug:
+        return ''
+
+    if kind in ('company', 'school', 'showcase'):
+        return slug
+    if kind == 'in':
+        return f'in/{slug}'
+    return ''
+
+
+def missing_social_links(company_data):
+    """Boş olan sosyal medya platformlarının listesini döner"""
+    social = company_data.get('social') or {}
+    if not isinstance(social, dict):
+        social = {}
+
+    missing = []
+    for platform in SOCIAL_PLATFORMS:
+        link = social.get(platform)
+        if not link or not str(link).strip():
+            missing.append(platform)
+    return missing
+
+
+def company_summary(slug, name, web, missing):
+    """Rapor satırı: (slug, isim, web, eksik platformlar)
+
+    Boş isim yerine slug, boş web yerine 'N/A' gösterilir. Hem doğrudan
+    yüklenen kayıtlar (CompanyRecord.summary) hem de company_index
+    satırları bu fonksiyondan geçer; iki yolun raporu aynı kalır.
+    """
+    return slug, name or slug, web or 'N/A', list(missing)
+
+
+class CompanyRecord:
+    """Tek bir şirket dosyasının yüklenmiş hali"""
+
+    __slots__ = ('slug', 'path', 'data', 'domain', 'linkedin_slug')
+
+    def __init__(self, path, data):
+        self.slug = path.stem
+        self.path = path
+        self.data = data
+
+        contact = data.get('contact') or {}
+        social = data.get('social') or {}
+        if not isinstance(contact, dict):
+            contact = {}
+        if not isinstance(social, dict):
+            social = {}
+
+        self.domain = normalize_domain(contact.get('web'))
+        self.linkedin_slug = normalize_linkedin_slug(social.get('linkedin'))
+
+    @property
+    def name(self):
+        return self.data.get('name') or self.slug
+
+    @property
+    def web(self):
+        contact = self.data.get('contact') or {}
+        return contact.get('web', '') if isinstance(contact, dict) else ''
+
+    @property
+    def summary(self):
+        """company_summary() satırı"""
+        return company_summary(self.slug, self.data.get('name'), self.web, missing_social_links(self.data))
+
+    def __repr__(self):
+        return f'CompanyRecord({self.slug!r})'
+
+
+class CompanyCorpus:
+    """Tüm şirket kayıtları ve arama tabloları"""
+
+    def __init__(self, data_dir, records, errors):
+        self.data_dir = Path(data_dir)
+        self.records = records
+        self.errors = errors
+
+        self.by_slug = {}
+        self.by_domain = {}
+        self.by_linkedin = {}
+        # LinkedIn slug -> tüm eşleşen kayıtlar (belirsiz eşleşmeleri raporlamak için)
+        self.linkedin_matches = {}
+
+        for record in records:
+            self.by_slug[record.slug] = record
+            # Aynı domain/LinkedIn birden fazla dosyada varsa ilk dosya kazanır
+            if record.domain:
+                self.by_domain.setdefault(record.domain, record)
+            if record.linkedin_slug:
+                self.by_linkedin.setdefault(record.linkedin_slug, record)
+                self.linkedin_matches.setdefault(record.linkedin_slug, []).append(record)
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def file_count(self):
+        """Okunan (hatalılar dahil) toplam dosya sayısı"""
+        return len(self.records) + len(self.errors)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    def find_by_domain(self, url):
+        """Web adresine göre şirket kaydını bulur"""
+        return self.by_domain.get(normalize_domain(url))
+
+    def find_by_linkedin(self, url):
+        """LinkedIn URL'sine göre şirket kaydını bulur"""
+        return self.by_linkedin.get(normalize_linkedin_slug(url))
+
+    def find_all_by_linkedin(self, url):
+        """LinkedIn URL'sine eşleşen tüm şirket kayıtlarını döner"""
+        return self.linkedin_matches.get(normalize_linkedin_slug(url), [])
+
+    @property
+    def ambiguous_linkedin(self):
+        """Birden fazla şirket dosyasına eşleşen LinkedIn slug'ları"""
+        return {slug: matches for slug, matches in self.linkedin_matches.items() if len(matches) > 1}
+
+
+def load_companies(data_dir=COMPANY_DATA_DIR, verbose=True, use_index=False):
+    """Şirket klasöründeki tüm JSON dosyalarını tek geçişte yükler
+
+    Args:
+        use_index: True ise kalıcı indeksten (company_index) yükler, sadece
+            değişen dosyalar yeniden parse edilir
+
+    Returns:
+        CompanyCorpus: Kayıtlar (dosya adına göre sıralı), hatalar ve arama tabloları
+    """
+    if use_index:
+        from company_index import CompanyIndex
+        with CompanyIndex(data_dir) as index:
+            index.refresh(verbose=verbose)
+            return index.load_corpus()
+
+    data_dir = Path(data_dir)
+    records = []
+    errors = []
+
+    for path in sorted(data_dir.glob('*.json')):
+        try:
+            data = decode_json(path.read_bytes())
+        except Exception as e:
+            errors.append((path, e))
+            if verbose:
+                print(f"❌ Hata ({path}): {e}")
+            continue
+
+        if not isinstance(data, dict):
+            errors.append((path, ValueError('JSON kökü obje değil')))
+            continue
+
+        records.append(CompanyRecord(path, data))
+
+    return CompanyCorpus(data_dir, records, errors)
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Şirket JSON dosyaları için kalıcı SQLite indeksi.
+
+Her dosya yol, mtime, boyut ve içerik hash'i ile saklanır. Başlangıçta sadece
+değişen dosyalar yeniden okunur/parse edilir; raporlama script'leri türetilmiş
+alanları (isim, web, domain, LinkedIn slug, eksik sosyal linkler) doğrudan
+indeksten sorgular.
+
+Kullanım:
+    python scripts/company_index.py            # indeksi güncelle ve özet yazdır
+    python scripts/company_index.py --rebuild  # indeksi sıfırdan oluştur
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+from company_corpus import (
+    CACHE_DIR,
+    COMPANY_DATA_DIR,
+    CompanyCorpus,
+    CompanyRecord,
+    decode_json,
+    missing_social_links,
+)
+
+INDEX_FILE = CACHE_DIR / 'company-index.sqlite'
+
+# Şema değişirse artır; eski indeks otomatik olarak yeniden oluşturulur
+SCHEMA_VERSION = 1
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS companies (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha1 TEXT NOT NULL,
+    raw TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    name TEXT NOT NULL,
+    web TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    linkedin_slug TEXT NOT NULL,
+    missing_social TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS companies_domain ON companies (domain);
+CREATE INDEX IF NOT EXISTS companies_linkedin ON companies (linkedin_slug);
+'''
+
+
+class CompanyIndex:
+    """public/data/company için mtime + hash ile geçersizleştirilen indeks"""
+
+    def __init__(self, data_dir=COMPANY_DATA_DIR, db_path=INDEX_FILE):
+        self.data_dir = Path(data_dir)
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.row_factory = sqlite3.Row
+        # Son refresh'te okunamayan dosyalar: (yol, hata). Hatalı dosyalar
+        # indekse yazılmadığı için her refresh'te yeniden denenir
+        self.errors = []
+        self._ensure_schema()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def _ensure_schema(self):
+        self.conn.executescript(SCHEMA)
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'schema'").fetchone()
+        data_dir = str(self.data_dir.resolve())
+        dir_row = self.conn.execute("SELECT value FROM meta WHERE key = 'data_dir'").fetchone()
+
+        if (row is None or int(row['value']) != SCHEMA_VERSION or
+                dir_row is None or dir_row['value'] != data_dir):
+            self.clear()
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                [('schema', str(SCHEMA_VERSION)), ('data_dir', data_dir)]
+            )
+            self.conn.commit()
+
+    def clear(self):
+        """Tüm kayıtları siler (bir sonraki refresh tam yeniden oluşturur)"""
+        self.conn.execute("DELETE FROM companies")
+        self.conn.commit()
+
+    def refresh(self, verbose=False):
+        """Klasörü tarar, sadece değişen dosyaları yeniden parse eder
+
+        Okunamayan dosyalar self.errors'a (yol, hata) olarak yazılır.
+
+        Returns:
+            dict: total, unchanged, touched (mtime değişti ama içerik aynı),
+                  parsed, removed, errors sayıları
+        """
+        started = time.perf_counter()
+        stats = {'total': 0, 'unchanged': 0, 'touched': 0, 'parsed': 0, 'removed': 0, 'errors': 0}
+        self.errors = []
+
+        known = {
+            row['path']: row
+            for row in self.conn.execute("SELECT path, mtime_ns, size, sha1 FROM companies")
+        }
+        seen = set()
+
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.json') or not entry.is_file():
+                    continue
+
+                stats['total'] += 1
+                seen.add(entry.name)
+                st = entry.stat()
+                row = known.get(entry.name)
+
+                # mtime ve boyut aynıysa dosyayı hiç okuma
+                if row is not None and row['mtime_ns'] == st.st_mtime_ns and row['size'] == st.st_size:
+                    stats['unchanged'] += 1
+                    continue
+
+                raw = Path(entry.path).read_bytes()
+                sha1 = hashlib.sha1(raw).hexdigest()
+
+                # Sadece mtime değişmiş (ör. git checkout), içerik aynı
+                if row is not None and row['sha1'] == sha1:
+                    self.conn.execute(
+                        "UPDATE companies SET mtime_ns = ?, size = ? WHERE path = ?",
+                        (st.st_mtime_ns, st.st_size, entry.name)
+                    )
+                    stats['touched'] += 1
+                    continue
+
+                try:
+                    data = decode_json(raw)
+                    if not isinstance(data, dict):
+                        raise ValueError('JSON kökü obje değil')
+                except Exception as e:
+                    stats['errors'] += 1
+                    self.errors.append((Path(entry.path), e))
+                    if verbose:
+                        print(f"❌ Hata ({entry.path}): {e}")
+                    self.conn.execute("DELETE FROM companies WHERE path = ?", (entry.name,))
+                    continue
+
+                record = CompanyRecord(Path(entry.path), data)
+                self.conn.execute(
+                    '''INSERT OR REPLACE INTO companies
+                       (path, mtime_ns, size, sha1, raw, slug, name, web, domain, linkedin_slug, missing_social)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
+                    (
+                        entry.name, st.st_mtime_ns, st.st_size, sha1, raw.decode('utf-8'),
+                        record.slug, data.get('name') or '', record.web or '',
+                        record.domain, record.linkedin_slug,
+                        ','.join(missing_social_links(data)),
+                    )
+                )
+                stats['parsed'] += 1
+
+        removed = [path for path in known if path not in seen]
+        if removed:
+            self.conn.executemany("DELETE FROM companies WHERE path = ?", [(p,) for p in removed])
+            stats['removed'] = len(removed)
+
+        self.conn.commit()
+        self.errors.sort(key=lambda error: error[0])
+        stats['seconds'] = time.perf_counter() - started
+        return stats
+
+    def summaries(self):
+        """Türetilmiş alanları (ham JSON olmadan) slug sırasıyla döner"""
+        return self.conn.execute(
+            '''SELECT slug, name, web, domain, linkedin_slug, missing_social
+               FROM companies ORDER BY path'''
+        ).fetchall()
+
+    def load_corpus(self):
+        """İndeksteki ham JSON'lardan CompanyCorpus oluşturur (hatalar son refresh'ten)"""
+        records = []
+        for row in self.conn.execute("SELECT path, raw FROM companies ORDER BY path"):
+            data = decode_json(row['raw'].encode('utf-8'))
+            records.append(CompanyRecord(self.data_dir / row['path'], data))
+        return CompanyCorpus(self.data_dir, records, list(self.errors))
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Şirket JSON indeksini güncelle')
+    parser.add_argument('--data-dir', type=str, default=str(COMPANY_DATA_DIR),
+                        help='Şirket JSON dosyalarının bulunduğu dizin')
+    parser.add_argument('--rebuild', action='store_true', help='İndeksi sıfırdan oluştur')
+
+    args = parser.parse_args()
+
+    with CompanyIndex(args.data_dir) as index:
+        if args.rebuild:
+            index.clear()
+        stats = index.refresh(verbose=True)
+
+    print(f"📇 İndeks: {INDEX_FILE}")
+    print(f"   Toplam:     {stats['total']}")
+    print(f"   Değişmeyen: {stats['unchanged']}")
+    print(f"   Dokunulan:  {stats['touched']}")
+    print(f"   Parse:      {stats['parsed']}")
+    print(f"   Silinen:    {stats['removed']}")
+    print(f"   Hatalı:     {stats['errors']}")
+    print(f"   Süre:       {stats['seconds'] * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
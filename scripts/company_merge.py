@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Birden fazla zenginleştirme kaynağından (LinkedIn, sosyal link taraması, logo
+indirme) gelen alan önerilerini bellekte toplayıp her şirket dosyasını bir
+kez okuyup bir kez yazan birleştirme motoru.
+
+Öneriler (alan, değer, kural) üçlüleridir; alan 'contact.web' gibi noktalı
+yol olabilir. Kurallar:
+
+- IF_EMPTY: sadece mevcut değer boşsa (force=True ise farklıysa yazılır)
+- REPLACE:  değer farklıysa her zaman yazılır
+- LONGER:   yeni değer mevcut değerden uzunsa yazılır (ör. daha uzun about)
+- APPEND:   liste alanına, listede yoksa eklenir
+- REMOVE:   alan varsa silinir (değer kullanılmaz)
+
+Aynı alana birden fazla öneri geldiğinde öneriler geliş sırasıyla uygulanır:
+IF_EMPTY'de ilk dolu değer, LONGER'da en uzun değer, REPLACE'te son değer
+kalır.
+
+Kullanım:
+    from company_merge import IF_EMPTY, CompanyMerger
+
+    merger = CompanyMerger()
+    merger.propose(json_path, [('contact.web', 'https://innova.com.tr', IF_EMPTY)])
+    ...
+    for json_path, updates in merger.commit().items():
+        print(json_path, updates)
+"""
+
+import json
+from pathlib import Path
+
+from json_writer import write_json_if_changed, write_stats
+
+IF_EMPTY = 'if_empty'
+REPLACE = 'replace'
+LONGER = 'longer'
+APPEND = 'append'
+REMOVE = 'remove'
+
+_MISSING = object()
+
+
+def get_field(data, field):
+    """Noktalı yoldaki değeri döner, yoksa None"""
+    *parents, key = field.split('.')
+    for parent in parents:
+        data = data.get(parent)
+        if not isinstance(data, dict):
+            return None
+    return data.get(key)
+
+
+def _parent_dict(data, field):
+    """Noktalı yolun son anahtarını ve ara sözlüğü döner (eksik ara sözlükler oluşturulur)"""
+    *parents, key = field.split('.')
+    for parent in parents:
+        child = data.get(parent)
+        if not isinstance(child, dict):
+            child = data[parent] = {}
+        data = child
+    return data, key
+
+
+def apply_update(data, field, value, rule, force=False):
+    """Tek bir öneriyi kuralına göre veriye (yerinde) uygular
+
+    Returns:
+        Uygulanan değer (REMOVE için None); değişiklik yoksa _MISSING
+    """
+    if rule == REMOVE:
+        parent, key = _parent_dict(data, field)
+        if key not in parent:
+            return _MISSING
+        del parent[key]
+        return None
+
+    if not value:
+        return _MISSING
+
+    current = get_field(data, field)
+
+    if rule == APPEND:
+        items = current if isinstance(current, list) else []
+        if value in items:
+            return _MISSING
+        parent, key = _parent_dict(data, field)
+        parent[key] = items + [value]
+        return value
+
+    if value == current:
+        return _MISSING
+    if rule == IF_EMPTY and current and not force:
+        return _MISSING
+    if rule == LONGER and current and not force and len(value) <= len(current):
+        return _MISSING
+
+    parent, key = _parent_dict(data, field)
+    parent[key] = value
+    return value
+
+
+def apply_proposals(data, proposals, force=False):
+    """Önerileri sırayla veriye (yerinde) uygular
+
+    Args:
+        proposals: (alan, değer, kural) üçlüleri
+        force: IF_EMPTY ve LONGER kurallarını REPLACE gibi uygula
+
+    Returns:
+        list: (alan, yeni değer) değişiklik listesi; bos ise değişiklik yok
+    """
+    updates = []
+    for field, value, rule in proposals:
+        applied = apply_update(data, field, value, rule, force=force)
+        if applied is not _MISSING:
+            updates.append((field, applied))
+    return updates
+
+
+class CompanyMerger:
+    """Şirket dosyası -> bekleyen öneriler; commit() her dosyayı bir kez yazar"""
+
+    def __init__(self, force=False, stats=write_stats):
+        self.force = force
+        self.stats = stats
+        self.pending = {}
+        # commit() sırasında okunamayan/yazılamayan dosyalar: yol -> hata
+        self.errors = {}
+
+    def __len__(self):
+        return len(self.pending)
+
+    def propose(self, json_path, proposals):
+        """Bir şirket dosyası için önerileri sıraya ekler (dosya okunmaz)"""
+        self.pending.setdefault(Path(json_path), []).extend(proposals)
+
+    def commit(self, dry_run=False):
+        """Bekleyen önerileri uygular, değişen dosyaları atomik olarak yazar
+
+        Bir dosyadaki hata diğerlerini durdurmaz; hatalar self.errors'a yazılır.
+
+        Returns:
+            dict: dosya yolu -> (alan, yeni değer) listesi (sadece değişenler)
+        """
+        results = {}
+        for json_path, proposals in self.pending.items():
+            try:
+                with open(json_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+
+                updates = apply_proposals(data, proposals, force=self.force)
+                if not updates:
+                    continue
+
+                if not dry_run:
+                    write_json_if_changed(json_path, data, stats=self.stats)
+            except Exception as e:
+                self.errors[json_path] = e
+                continue
+            results[json_path] = updates
+
+        self.pending = {}
+        return results
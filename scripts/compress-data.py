@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Yayınlanan veri dosyaları için minify + önceden sıkıştırma aşaması.
+
+Deploy çıktısındaki (varsayılan docs/data) her dosya için:
+
+- .json dosyaları boşluksuz (minify) olarak yeniden yazılır; URL'ler
+  değişmediği için Angular tarafında değişiklik gerekmez
+- her dosyanın yanına .gz (gzip -9) ve brotli paketi kuruluysa .br
+  (quality 11) kardeşleri yazılır; gzip_static/brotli_static destekleyen
+  sunucular bunları doğrudan gönderir
+
+.txt ve .xml dosyaları ham haliyle korunur (sadece sıkıştırılır). Bir
+manifest'in {"file", "sha1"} ile sabitlediği dosyalar (company-list
+sayfaları ve arama indeksi, tax-offices il parçaları...) da minify
+edilmez; yoksa sunulan içerik manifest'teki hash'le eşleşmez. Dosyalar
+işlemci çekirdekleri arasında paralel işlenir ve içerik değişmediyse
+yeniden yazılmaz (gzip mtime=0 ile her seferinde aynı byte'ları üretir).
+Kaynağı silinmiş .gz/.br dosyaları temizlenir.
+
+public/data kaynak veridir (indent=2 kalmalı); bu script deploy sonrası
+çıktı klasöründe çalıştırılmalıdır.
+
+Kullanım:
+    python scripts/compress-data.py
+    python scripts/compress-data.py --dir docs/data --workers 4
+    python scripts/compress-data.py --no-minify
+"""
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from json_writer import write_bytes_if_changed
+
+# brotli opsiyonel: yoksa sadece .gz üretilir
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Output encoding fix for Windows
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+ROOT_DIR = Path(__file__).parent.parent
+DEFAULT_DATA_DIR = ROOT_DIR / 'docs' / 'data'
+
+COMPRESSED_SUFFIXES = ('.gz', '.br')
+MINIFY_SUFFIXES = ('.json',)
+
+
+def minify_json(content):
+    """JSON içeriğini boşluksuz serileştirir (Türkçe karakterler korunur)"""
+    data = json.loads(content.decode('utf-8'))
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def process_file(path, minify=True):
+    """Tek dosyayı minify eder ve sıkıştırılmış kardeşlerini yazar (alt süreçte çalışır)
+
+    Returns:
+        dict: path, original, minified, gzip, brotli (byte), written (yazılan dosya sayısı), error
+    """
+    path = Path(path)
+    result = {'path': str(path), 'written': 0, 'error': None}
+    try:
+        content = path.read_bytes()
+        result['original'] = len(content)
+
+        if minify and path.suffix in MINIFY_SUFFIXES:
+            content = minify_json(content)
+            result['written'] += write_bytes_if_changed(path, content)
+        result['minified'] = len(content)
+
+        compressed = gzip.compress(content, compresslevel=9, mtime=0)
+        result['gzip'] = len(compressed)
+        result['written'] += write_bytes_if_changed(path.with_name(path.name + '.gz'), compressed)
+
+        result['brotli'] = None
+        if brotli is not None:
+            compressed = brotli.compress(content, quality=11)
+            result['brotli'] = len(compressed)
+            result['written'] += write_bytes_if_changed(path.with_name(path.name + '.br'), compressed)
+    except Exception as e:
+        result['error'] = str(e)
+    return result
+
+
+def iter_pinned_names(data):
+    """JSON ağacındaki {"file": ..., "sha1": ...} kayıtlarının dosya adları"""
+    if isinstance(data, dict):
+        if isinstance(data.get('file'), str) and 'sha1' in data:
+            yield data['file']
+        for value in data.values():
+            yield from iter_pinned_names(value)
+    elif isinstance(data, list):
+        for value in data:
+            yield from iter_pinned_names(value)
+
+
+def find_pinned_files(sources):
+    """Aynı klasördeki bir manifest'in sha1 ile referans verdiği dosyalar"""
+    pinned = set()
+    for path in sources:
+        if path.suffix not in MINIFY_SUFFIXES:
+            continue
+        try:
+            data = json.loads(path.read_bytes().decode('utf-8'))
+        except ValueError:
+            continue
+        pinned.update(path.parent / name for name in iter_pinned_names(data))
+    return pinned
+
+
+def find_data_files(data_dir):
+    """Sıkıştırılacak dosyalar ve kaynağı kalmamış .gz/.br dosyaları"""
+    sources = []
+    orphans = []
+    for path in sorted(data_dir.rglob('*')):
+        if not path.is_file() or path.name.startswith('.'):
+            continue
+        if path.suffix in COMPRESSED_SUFFIXES:
+            if not path.with_suffix('').exists():
+                orphans.append(path)
+        else:
+            sources.append(path)
+    return sources, orphans
+
+
+def report_group(path, data_dir):
+    """Rapor satırı: üst klasördeki dosyalar tek tek, alt klasörler toplu"""
+    relative = path.relative_to(data_dir)
+    return relative.parts[0] + '/' if len(relative.parts) > 1 else str(relative)
+
+
+def format_size(size):
+    if size is None:
+        return '-'
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} MB"
+    return f"{size / 1024:.1f} KB"
+
+
+def print_report(results, data_dir):
+    groups = {}
+    for result in results:
+        group = groups.setdefault(report_group(Path(result['path']), data_dir), {
+            'files': 0, 'original': 0, 'minified': 0, 'gzip': 0, 'brotli': 0
+        })
+        group['files'] += 1
+        for key in ('original', 'minified', 'gzip'):
+            group[key] += result[key]
+        group['brotli'] = None if result['brotli'] is None else (group['brotli'] or 0) + result['brotli']
+
+    total = {'files': 0, 'original': 0, 'minified': 0, 'gzip': 0, 'brotli': 0}
+    for group in groups.values():
+        for key in ('files', 'original', 'minified', 'gzip'):
+            total[key] += group[key]
+        total['brotli'] = None if group['brotli'] is None else (total['brotli'] or 0) + group['brotli']
+
+    print(f"\n{'dosya':<28} {'adet':>5} {'orijinal':>10} {'minify':>10} {'gzip':>10} {'brotli':>10} {'kazanç':>7}")
+    print('-' * 86)
+    for name, group in sorted(groups.items()) + [('TOPLAM', total)]:
+        best = group['brotli'] if group['brotli'] is not None else group['gzip']
+        saving = 100 * (1 - best / group['original']) if group['original'] else 0
+        if name == 'TOPLAM':
+            print('-' * 86)
+        print(f"{name:<28} {group['files']:>5} {format_size(group['original']):>10} "
+              f"{format_size(group['minified']):>10} {format_size(group['gzip']):>10} "
+              f"{format_size(group['brotli']):>10} {saving:>6.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Veri dosyalarını minify et, .gz/.br kardeşlerini üret')
+    parser.add_argument('--dir', type=str, default=str(DEFAULT_DATA_DIR),
+                        help='Veri klasörü (varsayılan: docs/data)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help='Paralel süreç sayısı (varsayılan: çekirdek sayısı)')
+    parser.add_argument('--no-minify', action='store_true',
+                        help='JSON dosyalarını minify etme, sadece sıkıştır')
+    args = parser.parse_args()
+
+    data_dir = Path(args.dir).resolve()
+    if not data_dir.is_dir():
+        print(f"❌ Klasör bulunamadı: {data_dir}")
+        sys.exit(1)
+    if brotli is None:
+        print("⚠️  brotli paketi kurulu değil, sadece .gz üretilecek (pip install brotli)")
+
+    sources, orphans = find_data_files(data_dir)
+    for orphan in orphans:
+        orphan.unlink()
+
+    pinned = set() if args.no_minify else find_pinned_files(sources)
+
+    print(f"🗜️  {len(sources)} dosya ({len(pinned)} manifest hash'li, minify edilmez), "
+          f"{args.workers} süreç: {data_dir}")
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        minify = [not args.no_minify and path not in pinned for path in sources]
+        results = list(pool.map(process_file, sources, minify, chunksize=16))
+    elapsed = time.perf_counter() - started
+
+    errors = [result for result in results if result['error']]
+    results = [result for result in results if not result['error']]
+    print_report(results, data_dir)
+
+    written = sum(result['written'] for result in results)
+    print(f"\n✅ {elapsed:.2f} sn, {written} dosya yazıldı, {len(orphans)} eski sıkıştırılmış dosya silindi")
+    if errors:
+        print(f"❌ {len(errors)} dosyada hata:")
+        for result in errors:
+            print(f"   {result['path']}: {result['error']}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,41 +1,94 @@
-import json
-import re
-
-# Dosyayı oku
-with open('public/data/SektorKodlari.txt', 'r', encoding='utf-8') as f:
-    content = f.read()
-
-# JSON'u parse et
-data = json.loads(content)
-
-# Basit format için liste oluştur
-sector_list = []
-
-for item in data['data']['parameterItems']:
-    code = item['prmName']
-    # Türkçe açıklamayı bul
-    name = ""
-    for i18n_item in item['i18N']['i18NContentList']:
-        if i18n_item['language'] == 'tr':
-            name = i18n_item['i18NText']
-            break
-
-    if code and name:
-        sector_list.append({
-            "code": code,
-            "name": name
-        })
-
-# Koda göre sırala
-sector_list.sort(key=lambda x: x['code'])
-
-# Yeni JSON dosyasına yaz
-output_data = {
-    "sectors": sector_list
-}
-
-with open('public/data/SektorKodlari.json', 'w', encoding='utf-8') as f:
-    json.dump(output_data, f, ensure_ascii=False, indent=2)
-
-print(f"Toplam {len(sector_list)} sektör kodu dönüştürüldü.")
-print("Dosya 'public/data/SektorKodlari.json' olarak kaydedildi.")
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SektorKodlari.txt (parametre dışa aktarımı) -> SektorKodlari.json
+
+Kaynak dosya parameter_export ile akışla okunur; her öğeden sadece kod
+(prmName) ve Türkçe açıklama alınır. Çıktı koda göre sıralı
+{"sectors": [{"code", "name"}, ...]} biçimindedir ve sadece içerik
+değiştiyse yazılır.
+
+Yanına sector-codes/ klasörüne NACE hiyerarşisi (kısım -> bölüm -> grup ->
+sınıf -> alt sınıf) için tree.json ve bölüm başına division-NN.jsonl parça
+dosyaları, arama için de açıklama token'ları ve kod öneki trie'si içeren
+search-index.json yazılır (bkz. nace_tree).
+
+Birden fazla parametre ailesi içeren büyük dışa aktarımlar için --family
+ile aile seçilir (varsayılan: SECTOR_CODES; dosyada aile adı yoksa tüm
+öğeler alınır).
+
+Kullanım:
+    python scripts/convert_sektor_kodlari.py
+    python scripts/convert_sektor_kodlari.py --input export.json --family SECTOR_CODES
+
+    from convert_sektor_kodlari import convert_sector_codes
+    count = convert_sector_codes('public/data/SektorKodlari.txt', 'public/data/SektorKodlari.json')
+"""
+
+import argparse
+from pathlib import Path
+
+from json_writer import write_json_if_changed
+from nace_tree import write_nace_tree, write_sector_search_index
+from parameter_export import iter_parameter_items
+
+ROOT_DIR = Path(__file__).parent.parent
+DEFAULT_INPUT = ROOT_DIR / 'public' / 'data' / 'SektorKodlari.txt'
+DEFAULT_OUTPUT = ROOT_DIR / 'public' / 'data' / 'SektorKodlari.json'
+DEFAULT_TREE_DIR = ROOT_DIR / 'public' / 'data' / 'sector-codes'
+
+SECTOR_FAMILY = 'SECTOR_CODES'
+
+
+def iter_sector_codes(source, family=SECTOR_FAMILY):
+    """(kod, Türkçe açıklama) çiftlerini dosyadaki sırayla üretir
+
+    Aile adı taşımayan (tek aileli) dosyalarda tüm öğeler alınır.
+    """
+    for item in iter_parameter_items(source):
+        if item.family not in (family, None):
+            continue
+        if item.code and item.text:
+            yield item.code, item.text
+
+
+def convert_sector_codes(source=DEFAULT_INPUT, output=DEFAULT_OUTPUT, family=SECTOR_FAMILY, tree_dir=DEFAULT_TREE_DIR):
+    """Sektör kodlarını dönüştürür
+
+    Returns:
+        int: Yazılan sektör kodu sayısı
+    """
+    # Sıralama için (kod, açıklama) listesi tutulur; ayrıştırma akışla yapılır
+    sector_list = [{"code": code, "name": name} for code, name in iter_sector_codes(source, family)]
+    sector_list.sort(key=lambda x: x['code'])
+
+    write_json_if_changed(output, {"sectors": sector_list})
+    if tree_dir is not None:
+        write_nace_tree(sector_list, tree_dir)
+        write_sector_search_index(sector_list, tree_dir)
+    return len(sector_list)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sektör kodlarını parametre dışa aktarımından dönüştür')
+    parser.add_argument('--input', type=str, default=str(DEFAULT_INPUT),
+                        help='Parametre dışa aktarım dosyası (varsayılan: public/data/SektorKodlari.txt)')
+    parser.add_argument('--output', type=str, default=str(DEFAULT_OUTPUT),
+                        help='Çıktı dosyası (varsayılan: public/data/SektorKodlari.json)')
+    parser.add_argument('--family', type=str, default=SECTOR_FAMILY,
+                        help=f'Parametre ailesi (varsayılan: {SECTOR_FAMILY})')
+    parser.add_argument('--tree-dir', type=str, default=str(DEFAULT_TREE_DIR),
+                        help='NACE ağacı ve bölüm dosyalarının klasörü (varsayılan: public/data/sector-codes)')
+    parser.add_argument('--no-tree', action='store_true',
+                        help='NACE ağacını üretme')
+    args = parser.parse_args()
+
+    count = convert_sector_codes(args.input, args.output, args.family,
+                                 tree_dir=None if args.no_tree else args.tree_dir)
+
+    print(f"Toplam {count} sektör kodu dönüştürüldü.")
+    print(f"Dosya '{args.output}' olarak kaydedildi.")
+
+
+if __name__ == '__main__':
+    main()
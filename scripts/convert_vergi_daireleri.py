@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+VergiDaireleri.txt (parametre dışa aktarımı) -> tax-offices/ parça dosyaları
+
+Kaynak dosya parameter_export ile akışla okunur. Öğe metinleri
+"KAYSERİ - Sarız Malmüdürlüğü" biçimindedir; il ile daire adı ayrılır
+("TEKİRDAĞ-Kapaklı", "ŞANLIURFA- Bozova" gibi boşluk farkları da
+tanınır). İl öneki olmayan metinlerde ("KARAPINAR MAL MÜDÜRLÜĞÜ") il,
+ilk kelimesi aynı ilçe adıyla başlayan dairelerin ilinden çıkarılır;
+çıkarılamazsa il "?" olur.
+
+tax-offices/ klasörüne yazılanlar:
+
+- index.json: il listesi (ad, kayıt sayısı, parça dosyası, sha1) ve
+  kod -> il sırası tablosu; kodla doğrulama için önce buradan il bulunur
+- province-<il>.json: ilin daireleri [{"code", "name"}] (Türkçe sıralı)
+
+Böylece istemci tax.taxOffice alanını doğrulamak veya otomatik tamamlamak
+için 500 KB'lık dökümü değil, index.json ile tek bir ilin parçasını yükler.
+Sadece içeriği değişen dosyalar yazılır, artık kullanılmayan il parçaları
+silinir.
+
+Kullanım:
+    python scripts/convert_vergi_daireleri.py
+    python scripts/convert_vergi_daireleri.py --input export.json --family TAX_OFFICES
+
+    from convert_vergi_daireleri import convert_tax_offices
+    count = convert_tax_offices('public/data/VergiDaireleri.txt', 'public/data/tax-offices')
+"""
+
+import argparse
+import hashlib
+import json
+import re
+from pathlib import Path
+
+from json_writer import write_bytes_if_changed
+from parameter_export import iter_parameter_items
+from turkish_text import fold_turkish, tokenize
+
+ROOT_DIR = Path(__file__).parent.parent
+DEFAULT_INPUT = ROOT_DIR / 'public' / 'data' / 'VergiDaireleri.txt'
+DEFAULT_OUTPUT_DIR = ROOT_DIR / 'public' / 'data' / 'tax-offices'
+
+TAX_OFFICE_FAMILY = 'TAX_OFFICES'
+UNKNOWN_PROVINCE = '?'
+
+# "İL - Daire adı"; il büyük harflidir, tire çevresindeki boşluklar değişebilir
+PROVINCE_PATTERN = re.compile(r'^([^\W\d_a-zçğıöşü]+(?: [^\W\d_a-zçğıöşü]+)*)\s*-\s*(.+)$')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+def split_office_text(text):
+    """'KAYSERİ - Sarız Malmüdürlüğü' -> ('KAYSERİ', 'Sarız Malmüdürlüğü'); il yoksa (None, metin)"""
+    text = WHITESPACE_PATTERN.sub(' ', text).strip()
+    match = PROVINCE_PATTERN.match(text)
+    if not match:
+        return None, text
+    return match.group(1), match.group(2).strip()
+
+
+def province_slug(province):
+    """'ŞANLIURFA' -> 'sanliurfa'"""
+    return '-'.join(tokenize(province)) or 'diger'
+
+
+def infer_provinces(offices):
+    """İl öneki olmayan dairelere, ilk kelimeleri tek bir ildeki daire adlarıyla eşleşiyorsa o ili atar"""
+    first_words = {}
+    for office in offices:
+        if office['province'] is not None:
+            words = tokenize(office['name'])
+            if words:
+                first_words.setdefault(words[0], set()).add(office['province'])
+
+    for office in offices:
+        if office['province'] is not None:
+            continue
+        words = tokenize(office['name'])
+        provinces = first_words.get(words[0], set()) if words else set()
+        office['province'] = next(iter(provinces)) if len(provinces) == 1 else UNKNOWN_PROVINCE
+
+
+def iter_tax_offices(source, family=TAX_OFFICE_FAMILY):
+    """{"code", "province", "name"} kayıtlarını dosyadaki sırayla üretir (il çıkarımı yapılmadan)"""
+    for item in iter_parameter_items(source):
+        if item.family not in (family, None):
+            continue
+        if item.code and item.text:
+            province, name = split_office_text(item.text)
+            yield {'code': item.code, 'province': province, 'name': name}
+
+
+def encode_compact(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+def convert_tax_offices(source=DEFAULT_INPUT, output_dir=DEFAULT_OUTPUT_DIR, family=TAX_OFFICE_FAMILY):
+    """Vergi dairelerini il parçalarına dönüştürür
+
+    Returns:
+        dict: index.json içeriği
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    offices = list(iter_tax_offices(source, family))
+    infer_provinces(offices)
+
+    by_province = {}
+    for office in offices:
+        by_province.setdefault(office['province'], []).append({'code': office['code'], 'name': office['name']})
+
+    provinces = []
+    codes = {}
+    province_files = set()
+    for position, province in enumerate(sorted(by_province, key=fold_turkish)):
+        province_offices = sorted(by_province[province], key=lambda office: (fold_turkish(office['name']), office['code']))
+        file_name = f'province-{province_slug(province)}.json'
+        content = encode_compact({'province': province, 'offices': province_offices})
+        write_bytes_if_changed(output_dir / file_name, content)
+        province_files.add(file_name)
+
+        provinces.append({
+            'name': province,
+            'count': len(province_offices),
+            'file': file_name,
+            'sha1': hashlib.sha1(content).hexdigest(),
+        })
+        for office in province_offices:
+            codes[office['code']] = position
+
+    # Artık kullanılmayan il parçalarını sil
+    for stale in output_dir.glob('province-*.json'):
+        if stale.name not in province_files:
+            stale.unlink()
+
+    index = {
+        'total': len(offices),
+        'provinces': provinces,
+        'codes': dict(sorted(codes.items(), key=lambda item: (len(item[0]), item[0]))),
+    }
+    write_bytes_if_changed(output_dir / 'index.json', encode_compact(index))
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Vergi dairelerini parametre dışa aktarımından dönüştür')
+    parser.add_argument('--input', type=str, default=str(DEFAULT_INPUT),
+                        help='Parametre dışa aktarım dosyası (varsayılan: public/data/VergiDaireleri.txt)')
+    parser.add_argument('--output-dir', type=str, default=str(DEFAULT_OUTPUT_DIR),
+                        help='Çıktı klasörü (varsayılan: public/data/tax-offices)')
+    parser.add_argument('--family', type=str, default=TAX_OFFICE_FAMILY,
+                        help=f'Parametre ailesi (varsayılan: {TAX_OFFICE_FAMILY})')
+    args = parser.parse_args()
+
+    index = convert_tax_offices(args.input, args.output_dir, args.family)
+
+    unknown = sum(province['count'] for province in index['provinces'] if province['name'] == UNKNOWN_PROVINCE)
+    print(f"Toplam {index['total']} vergi dairesi, {len(index['provinces'])} il dönüştürüldü.")
+    if unknown:
+        print(f"{unknown} dairenin ili bulunamadı ('{UNKNOWN_PROVINCE}').")
+    print(f"Dosyalar '{args.output_dir}' klasörüne kaydedildi.")
+
+
+if __name__ == '__main__':
+    main()
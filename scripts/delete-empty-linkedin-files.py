@@ -5,11 +5,12 @@ LinkedIn linki olmayan firma dosyalarını siler
 UYARI: Bu işlem geri alınamaz! Dikkatli kullanın.
 """
 
-import json
 import shutil
 from pathlib import Path
 from datetime import datetime
 
+from company_corpus import load_companies
+
 def delete_empty_linkedin_files(dry_run=True, create_backup=True):
     """LinkedIn alanı boş olan firma dosyalarını sil"""
 
@@ -25,16 +26,16 @@ def delete_empty_linkedin_files(dry_run=True, create_backup=True):
         backup_dir.mkdir(exist_ok=True)
         print(f"📦 Yedek klasörü: {backup_dir}\n")
 
-    json_files = sorted(company_dir.glob('*.json'))
-    print(f"🔍 {len(json_files)} şirket dosyası taranıyor...\n")
+    corpus = load_companies(company_dir, verbose=False)
+    print(f"🔍 {corpus.file_count} şirket dosyası taranıyor...\n")
 
     to_delete = []
-    errors = []
+    errors = [{'file': path.stem, 'error': str(e)} for path, e in corpus.errors]
 
-    for json_file in json_files:
+    for record in corpus:
+        json_file = record.path
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = record.data
 
             # Social alanını kontrol et
             social = data.get('social')
@@ -81,7 +82,7 @@ def delete_empty_linkedin_files(dry_run=True, create_backup=True):
     print("=" * 80)
     print("🗑️  SİLİNECEK DOSYALAR")
     print("=" * 80)
-    print(f"\nToplam: {len(to_delete)}/{len(json_files)} dosya\n")
+    print(f"\nToplam: {len(to_delete)}/{corpus.file_count} dosya\n")
 
     if dry_run:
         print("⚠️  DRY RUN MODU - Hiçbir dosya silinmeyecek!\n")
@@ -16,6 +16,9 @@ import io
 import sys
 import warnings
 
+from company_merge import REPLACE, CompanyMerger
+from json_writer import write_stats
+
 # Suppress warnings
 warnings.filterwarnings('ignore')
 
@@ -43,6 +46,15 @@ class LogoDownloader:
         self.logo_dir = self.root_dir / 'public' / 'img' / 'company'
         self.logo_dir.mkdir(parents=True, exist_ok=True)
 
+        # The logo field is written through CompanyMerger, one commit per company
+        self.merger = CompanyMerger()
+
+    def update_logo_field(self, json_file, logo_path):
+        """Set the logo field through the merger and commit this company"""
+        self.merger.propose(json_file, [('logo', logo_path, REPLACE)])
+        self.merger.commit()
+        return json_file not in self.merger.errors
+
     def find_logo_url(self, html_content, base_url):
         """Find logo URL from HTML content"""
         soup = BeautifulSoup(html_content, 'lxml')
@@ -189,9 +201,7 @@ class LogoDownloader:
 
                     # Update JSON if needed
                     if company_data.get('logo') != existing_logo:
-                        company_data['logo'] = existing_logo
-                        with open(json_file, 'w', encoding='utf-8') as f:
-                            json.dump(company_data, f, ensure_ascii=False, indent=2)
+                        return self.update_logo_field(json_file, existing_logo)
                     return True
 
             # Fetch website HTML
@@ -239,14 +249,12 @@ class LogoDownloader:
                     return False
 
             # Update JSON file
-            company_data['logo'] = logo_path
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(company_data, f, ensure_ascii=False, indent=2)
+            updated = self.update_logo_field(json_file, logo_path)
 
             # Be nice to servers
             time.sleep(1)
 
-            return True
+            return updated
 
         except Exception as e:
             return False
@@ -278,6 +286,7 @@ class LogoDownloader:
         print(f"Basarili: {success_count}")
         print(f"Basarisiz: {failed_count}")
         print(f"Toplam: {success_count + failed_count}")
+        print(f"JSON yazma: {write_stats.summary()}")
         print(f"{'='*60}")
 
 def main():
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Kaydedilmiş LinkedIn yanıtları için çıkarım sonucu cache'i.
+
+Anahtar: yanıt içeriğinin hash'i + extractor versiyonu. Yanıt dosyaları
+değişmediği sürece HTML hiç parse edilmez; extractor versiyonu
+artırıldığında eski versiyonun kayıtları açılışta otomatik silinir.
+
+Paralel modda worker process'ler cache'i sadece okur (read_only=True),
+yeni sonuçları ana process yazar.
+"""
+
+import hashlib
+import json
+import sqlite3
+from pathlib import Path
+
+from company_corpus import CACHE_DIR
+
+EXTRACTION_CACHE_FILE = CACHE_DIR / 'linkedin-extract.sqlite'
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS extractions (
+    content_hash TEXT NOT NULL,
+    version TEXT NOT NULL,
+    info TEXT NOT NULL,
+    PRIMARY KEY (content_hash, version)
+);
+'''
+
+
+def content_hash(*parts):
+    """Verilen metin parçalarının sha1 hash'ini döner"""
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """content_hash + version -> JSON çıkarım sonucu"""
+
+    def __init__(self, version, db_path=EXTRACTION_CACHE_FILE, read_only=False):
+        self.version = str(version)
+        self.db_path = Path(db_path)
+        self.read_only = read_only
+        self.hits = 0
+        self.misses = 0
+        self.conn = None
+
+        if read_only:
+            if self.db_path.exists():
+                self.conn = sqlite3.connect(f'file:{self.db_path}?mode=ro', uri=True)
+            return
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.executescript(SCHEMA)
+        # Eski extractor versiyonlarına ait kayıtları geçersiz kıl
+        self.conn.execute("DELETE FROM extractions WHERE version != ?", (self.version,))
+        self.conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self.conn is not None:
+            if not self.read_only:
+                self.conn.commit()
+            self.conn.close()
+            self.conn = None
+
+    def get(self, key):
+        """Cache'teki sonucu döner, yoksa None"""
+        row = None
+        if self.conn is not None:
+            try:
+                row = self.conn.execute(
+                    "SELECT info FROM extractions WHERE content_hash = ? AND version = ?",
+                    (key, self.version)
+                ).fetchone()
+            except sqlite3.OperationalError:
+                # Tablo henüz oluşturulmamış (ilk çalıştırma)
+                row = None
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key, info):
+        """Sonucu cache'e yazar (commit close() veya commit() ile yapılır)"""
+        if self.read_only:
+            raise RuntimeError('Salt okunur cache\'e yazılamaz')
+        self.conn.execute(
+            "INSERT OR REPLACE INTO extractions (content_hash, version, info) VALUES (?, ?, ?)",
+            (key, self.version, json.dumps(info, ensure_ascii=False))
+        )
+
+    def commit(self):
+        if self.conn is not None and not self.read_only:
+            self.conn.commit()
@@ -6,7 +6,6 @@ Opera'da açık olan tarayıcı oturumunu kullanır.
 """
 
 import json
-import re
 import sys
 import time
 import argparse
@@ -14,12 +13,15 @@ from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+
+from json_writer import write_stats
+from linkedin_extract import (
+    extract_linkedin_info,
+    print_linkedin_info,
+    print_linkedin_updates,
+    update_company_json_with_linkedin,
+)
 
 # Windows terminal için encoding ayarı
 if sys.platform == 'win32':
@@ -50,8 +52,8 @@ def connect_to_remote_browser(debugger_address='localhost:9222'):
         return None
 
 
-def extract_linkedin_info_from_page(driver, linkedin_url, timeout=30):
-    """LinkedIn sayfasından bilgileri çıkar"""
+def fetch_linkedin_page(driver, linkedin_url, timeout=30):
+    """LinkedIn sayfasını açık tarayıcıda yükler ve HTML'ini döner"""
     try:
         print(f"🔍 LinkedIn sayfası açılıyor: {linkedin_url}")
         driver.get(linkedin_url)
@@ -65,179 +67,13 @@ def extract_linkedin_info_from_page(driver, linkedin_url, timeout=30):
             print("💡 Lütfen Opera'da LinkedIn'e giriş yapın ve scripti tekrar çalıştırın.")
             return None
 
-        # Sayfa HTML'ini al
-        html = driver.page_source
-        soup = BeautifulSoup(html, 'html.parser')
-
-        info = {
-            'name': '',
-            'about': '',
-            'tagline': '',
-            'industry': '',
-            'company_size': '',
-            'headquarters': '',
-            'website': '',
-            'founded': ''
-        }
-
-        # Firma adı
-        try:
-            # h1 başlıktan firma adını al
-            name_elem = driver.find_element(By.CSS_SELECTOR, 'h1.org-top-card-summary__title')
-            info['name'] = name_elem.text.strip()
-            print(f"  ✓ Name: {info['name']}")
-        except NoSuchElementException:
-            # Alternatif selector'lar
-            try:
-                name_elem = driver.find_element(By.CSS_SELECTOR, 'h1')
-                info['name'] = name_elem.text.strip()
-            except:
-                pass
-
-        # Tagline
-        try:
-            tagline_elem = driver.find_element(By.CSS_SELECTOR, 'p.org-top-card-summary__tagline')
-            info['tagline'] = tagline_elem.text.strip()
-            print(f"  ✓ Tagline: {info['tagline']}")
-        except NoSuchElementException:
-            pass
-
-        # About
-        try:
-            about_elem = driver.find_element(By.CSS_SELECTOR, 'p.break-words')
-            info['about'] = about_elem.text.strip()
-            print(f"  ✓ About: {info['about'][:100]}...")
-        except NoSuchElementException:
-            # Alternatif: section içinden about'u bul
-            try:
-                about_section = driver.find_element(By.CSS_SELECTOR, 'section[data-test-id="about-us"]')
-                paragraphs = about_section.find_elements(By.TAG_NAME, 'p')
-                if paragraphs:
-                    info['about'] = '\n'.join([p.text.strip() for p in paragraphs if p.text.strip()])
-                    print(f"  ✓ About: {info['about'][:100]}...")
-            except:
-                pass
-
-        # Industry (Sektör)
-        try:
-            # "Sektör" veya "Industry" yazısını içeren dt elementi bul
-            labels = driver.find_elements(By.CSS_SELECTOR, 'dt.org-page-details__definition-term')
-            for label in labels:
-                if 'Industry' in label.text or 'Sektör' in label.text:
-                    # Hemen sonraki dd elementini al
-                    industry_elem = label.find_element(By.XPATH, './following-sibling::dd')
-                    info['industry'] = industry_elem.text.strip()
-                    print(f"  ✓ Industry: {info['industry']}")
-                    break
-        except:
-            pass
-
-        # Company size (Çalışan sayısı)
-        try:
-            labels = driver.find_elements(By.CSS_SELECTOR, 'dt.org-page-details__definition-term')
-            for label in labels:
-                if 'Company size' in label.text or 'Şirket büyüklüğü' in label.text:
-                    size_elem = label.find_element(By.XPATH, './following-sibling::dd')
-                    info['company_size'] = size_elem.text.strip()
-                    print(f"  ✓ Company Size: {info['company_size']}")
-                    break
-        except:
-            pass
-
-        # Headquarters (Genel merkez)
-        try:
-            labels = driver.find_elements(By.CSS_SELECTOR, 'dt.org-page-details__definition-term')
-            for label in labels:
-                if 'Headquarters' in label.text or 'Genel merkez' in label.text:
-                    hq_elem = label.find_element(By.XPATH, './following-sibling::dd')
-                    info['headquarters'] = hq_elem.text.strip()
-                    print(f"  ✓ Headquarters: {info['headquarters']}")
-                    break
-        except:
-            pass
-
-        # Website
-        try:
-            labels = driver.find_elements(By.CSS_SELECTOR, 'dt.org-page-details__definition-term')
-            for label in labels:
-                if 'Website' in label.text or 'Web sitesi' in label.text:
-                    web_elem = label.find_element(By.XPATH, './following-sibling::dd')
-                    info['website'] = web_elem.text.strip()
-                    print(f"  ✓ Website: {info['website']}")
-                    break
-        except:
-            pass
-
-        # Founded (Kuruluş yılı)
-        try:
-            labels = driver.find_elements(By.CSS_SELECTOR, 'dt.org-page-details__definition-term')
-            for label in labels:
-                if 'Founded' in label.text or 'Kuruluş' in label.text:
-                    founded_elem = label.find_element(By.XPATH, './following-sibling::dd')
-                    info['founded'] = founded_elem.text.strip()
-                    print(f"  ✓ Founded: {info['founded']}")
-                    break
-        except:
-            pass
-
-        return info
+        return driver.page_source
 
     except Exception as e:
-        print(f"❌ LinkedIn bilgi çekme hatası: {e}")
-        import traceback
-        traceback.print_exc()
+        print(f"❌ LinkedIn sayfası yükleme hatası: {e}")
         return None
 
 
-def update_company_json_with_linkedin(json_path, linkedin_info, dry_run=False, force=False):
-    """JSON dosyasını LinkedIn bilgileriyle günceller"""
-    try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        updated = False
-        updates = []
-
-        # Name
-        if linkedin_info.get('name') and (not data.get('name') or force):
-            data['name'] = linkedin_info['name']
-            updated = True
-            updates.append(f"Name: {linkedin_info['name']}")
-
-        # About
-        if linkedin_info.get('about') and (not data.get('about') or force):
-            data['about'] = linkedin_info['about']
-            updated = True
-            updates.append(f"About: {linkedin_info['about'][:100]}...")
-
-        # Tagline
-        if linkedin_info.get('tagline') and (not data.get('tagline') or force):
-            data['tagline'] = linkedin_info['tagline']
-            updated = True
-            updates.append(f"Tagline: {linkedin_info['tagline']}")
-
-        if not updated:
-            print("  ℹ️  Güncellenecek yeni bilgi bulunamadı")
-            return False
-
-        print("\n📝 Güncellenecek alanlar:")
-        for update in updates:
-            print(f"  • {update}")
-
-        if not dry_run:
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            print(f"\n✅ Dosya güncellendi: {json_path}")
-        else:
-            print(f"\n🔍 DRY RUN: Dosya güncellenmedi")
-
-        return True
-
-    except Exception as e:
-        print(f"❌ JSON güncelleme hatası: {e}")
-        return False
-
-
 def process_single_file(driver, json_path, args):
     """Tek bir JSON dosyasını işler"""
     print(f"\n{'='*70}")
@@ -264,17 +100,25 @@ def process_single_file(driver, json_path, args):
     print(f"  Tagline: {data.get('tagline', '(boş)')}")
     print(f"  About: {data.get('about', '(boş)')[:100]}...")
 
-    # LinkedIn'den bilgi çek
-    linkedin_info = extract_linkedin_info_from_page(driver, linkedin_url, timeout=args.timeout)
+    # LinkedIn'den sayfayı çek
+    html = fetch_linkedin_page(driver, linkedin_url, timeout=args.timeout)
 
-    if not linkedin_info:
+    if not html:
         print("❌ LinkedIn bilgileri çekilemedi")
         return False
 
-    # JSON'u güncelle
-    success = update_company_json_with_linkedin(json_path, linkedin_info, dry_run=args.dry_run, force=args.force)
+    # Bilgileri çıkar ve JSON'u güncelle
+    linkedin_info = extract_linkedin_info(html)
+    print_linkedin_info(linkedin_info)
+
+    try:
+        updates = update_company_json_with_linkedin(json_path, linkedin_info, dry_run=args.dry_run, force=args.force)
+    except Exception as e:
+        print(f"❌ JSON güncelleme hatası: {e}")
+        return False
 
-    return success
+    print_linkedin_updates(json_path, updates, dry_run=args.dry_run)
+    return bool(updates)
 
 
 def process_all_files(driver, args):
@@ -331,6 +175,8 @@ def process_all_files(driver, args):
     print(f"Başarılı: {stats['success']}")
     print(f"Atlandı: {stats['skipped']}")
     print(f"Hatalı: {stats['failed']}")
+    if not args.dry_run:
+        print(f"JSON yazma: {write_stats.summary()}")
     print(f"{'='*70}")
 
 
@@ -6,7 +6,6 @@ Tarayıcı oturumu kullanarak LinkedIn'den firma bilgilerini çeker.
 """
 
 import json
-import re
 import sys
 import time
 from pathlib import Path
@@ -18,7 +17,14 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+
+from json_writer import write_stats
+from linkedin_extract import (
+    extract_linkedin_info,
+    print_linkedin_info,
+    print_linkedin_updates,
+    update_company_json_with_linkedin,
+)
 
 # Windows terminal için encoding ayarı
 if sys.platform == 'win32':
@@ -86,145 +92,6 @@ def fetch_linkedin_with_selenium(driver, linkedin_url, timeout=30, skip_on_auth=
     except Exception as e:
         print(f"❌ LinkedIn sayfası yükleme hatası: {e}")
         return None
-def extract_linkedin_info_detailed(html):
-    """HTML'den detaylı LinkedIn firma bilgilerini çıkarır"""
-    soup = BeautifulSoup(html, 'html.parser')
-
-    info = {
-        'name': '',
-        'about': '',
-        'tagline': '',
-        'industry': '',
-        'company_size': '',
-        'headquarters': '',
-        'founded': '',
-        'website': '',
-        'specialties': []
-    }
-
-    try:
-        # Firma adı - h1 tag'inden veya meta'dan
-        h1 = soup.find('h1', class_=re.compile(r'org.*-top-card.*name|company.*name'))
-        if h1:
-            info['name'] = h1.get_text(strip=True)
-
-        if not info['name']:
-            og_title = soup.find('meta', property='og:title')
-            if og_title:
-                title = og_title.get('content', '')
-                info['name'] = title.split('|')[0].strip()
-
-        # Tagline/Catchphrase
-        tagline_elem = soup.find('p', class_=re.compile(r'org.*-top-card.*tagline|company.*tagline'))
-        if tagline_elem:
-            info['tagline'] = tagline_elem.get_text(strip=True)
-
-        # About/Description
-        about_section = soup.find('section', class_=re.compile(r'about.*section'))
-        if about_section:
-            about_text = about_section.find('p', class_=re.compile(r'break.*words|description'))
-            if about_text:
-                info['about'] = about_text.get_text(strip=True)
-
-        # Alternatif about
-        if not info['about']:
-            og_desc = soup.find('meta', property='og:description')
-            if og_desc:
-                raw_about = og_desc.get('content', '').strip()
-                # Temizle
-                raw_about = re.sub(r"^.*?\s*\|\s*LinkedIn'de\s+[\d\.,]+\s+takipçi\s+", '', raw_about)
-                info['about'] = raw_about.strip()
-
-        # Company details (Industry, Size, etc.)
-        detail_items = soup.find_all('dd', class_=re.compile(r'org.*-details|company.*-details'))
-        for item in detail_items:
-            text = item.get_text(strip=True)
-
-            # Industry
-            parent = item.find_parent('div')
-            if parent:
-                dt = parent.find('dt')
-                if dt and 'Industry' in dt.get_text():
-                    info['industry'] = text
-                elif dt and 'Company size' in dt.get_text():
-                    info['company_size'] = text
-                elif dt and 'Headquarters' in dt.get_text():
-                    info['headquarters'] = text
-                elif dt and 'Founded' in dt.get_text():
-                    info['founded'] = text
-
-        # Website
-        website_link = soup.find('a', class_=re.compile(r'org.*-website|company.*-website'))
-        if website_link:
-            info['website'] = website_link.get('href', '')
-
-        # Specialties
-        specialties_section = soup.find('section', class_=re.compile(r'specialties'))
-        if specialties_section:
-            specialty_items = specialties_section.find_all('li')
-            info['specialties'] = [item.get_text(strip=True) for item in specialty_items]
-
-    except Exception as e:
-        print(f"⚠️  Bilgi çıkarma hatası: {e}")
-
-    return info
-
-
-def update_company_json_with_linkedin(json_path, linkedin_info, dry_run=False, force=False):
-    """JSON dosyasını LinkedIn bilgileriyle günceller"""
-    try:
-        # JSON dosyasını oku
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # Mevcut değerleri sakla
-        old_name = data.get('name', '')
-        old_about = data.get('about', '')
-        old_tagline = data.get('tagline', '')
-
-        updated = False
-        updates = []
-
-        # Name güncelle (sadece boşsa veya force modundaysa)
-        if linkedin_info['name'] and (not old_name or force):
-            data['name'] = linkedin_info['name']
-            updated = True
-            updates.append(f"Name: {linkedin_info['name']}")
-
-        # About güncelle (sadece boşsa veya force modundaysa)
-        if linkedin_info['about'] and (not old_about or force):
-            data['about'] = linkedin_info['about']
-            updated = True
-            updates.append(f"About: {linkedin_info['about'][:100]}...")
-
-        # Tagline güncelle (sadece boşsa veya force modundaysa)
-        if linkedin_info['tagline'] and (not old_tagline or force):
-            data['tagline'] = linkedin_info['tagline']
-            updated = True
-            updates.append(f"Tagline: {linkedin_info['tagline']}")
-
-        if not updated:
-            print("  ℹ️  Güncellenecek yeni bilgi bulunamadı (zaten dolu veya LinkedIn'den bilgi alınamadı)")
-            return False
-
-        # Güncellemeleri göster
-        print("\n📝 Güncellenecek alanlar:")
-        for update in updates:
-            print(f"  • {update}")
-
-        # Dosyayı kaydet
-        if not dry_run:
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            print(f"\n✅ Dosya güncellendi: {json_path}")
-        else:
-            print(f"\n🔍 DRY RUN: Dosya güncellenmedi (--dry-run)")
-
-        return True
-
-    except Exception as e:
-        print(f"❌ JSON güncelleme hatası: {e}")
-        return False
 
 
 def process_single_file(driver, json_path, args):
@@ -261,22 +128,20 @@ def process_single_file(driver, json_path, args):
 
     if not html:
         print("❌ LinkedIn HTML çekilemedi (authwall veya hata)")
-        return False    # Bilgileri çıkar
-    linkedin_info = extract_linkedin_info_detailed(html)
+        return False
 
-    print(f"\n✅ LinkedIn'den çekilen bilgiler:")
-    print(f"  Name: {linkedin_info['name'] or '(bulunamadı)'}")
-    print(f"  Tagline: {linkedin_info['tagline'] or '(bulunamadı)'}")
-    print(f"  About: {linkedin_info['about'][:100] if linkedin_info['about'] else '(bulunamadı)'}{'...' if len(linkedin_info['about']) > 100 else ''}")
-    if linkedin_info['industry']:
-        print(f"  Industry: {linkedin_info['industry']}")
-    if linkedin_info['company_size']:
-        print(f"  Company Size: {linkedin_info['company_size']}")
+    # Bilgileri çıkar ve JSON'u güncelle
+    linkedin_info = extract_linkedin_info(html)
+    print_linkedin_info(linkedin_info)
 
-    # JSON'u güncelle
-    success = update_company_json_with_linkedin(json_path, linkedin_info, dry_run=args.dry_run, force=args.force)
+    try:
+        updates = update_company_json_with_linkedin(json_path, linkedin_info, dry_run=args.dry_run, force=args.force)
+    except Exception as e:
+        print(f"❌ JSON güncelleme hatası: {e}")
+        return False
 
-    return success
+    print_linkedin_updates(json_path, updates, dry_run=args.dry_run)
+    return bool(updates)
 
 
 def process_all_files(driver, args):
@@ -338,6 +203,8 @@ def process_all_files(driver, args):
     print(f"Başarılı: {stats['success']}")
     print(f"Atlandı: {stats['skipped']}")
     print(f"Hatalı: {stats['failed']}")
+    if not args.dry_run:
+        print(f"JSON yazma: {write_stats.summary()}")
     print(f"{'='*70}")
 
 
@@ -6,13 +6,29 @@ LinkedIn linklerinden firma adı ve hakkında bilgisini çeker.
 """
 
 import json
-import re
 import sys
 import time
+from contextlib import nullcontext
 from pathlib import Path
 from urllib.parse import urlparse
 import requests
-from bs4 import BeautifulSoup
+
+from json_writer import write_stats
+from linkedin_extract import (
+    extract_linkedin_info,
+    print_linkedin_info,
+    print_linkedin_updates,
+    update_company_json_with_linkedin,
+)
+from run_journal import RunJournal
+
+# process_single_file sonuçları; FAILED olanlar --resume'da backoff ile tekrar denenir
+UPDATED = 'updated'
+UNCHANGED = 'unchanged'
+SKIPPED = 'skipped'
+FAILED = 'failed'
+
+JOURNAL_STAGE = 'fetch-linkedin-info'
 
 # Windows terminal için encoding ayarı
 if sys.platform == 'win32':
@@ -60,194 +76,12 @@ def fetch_linkedin_html(linkedin_url, timeout=30):
         return None
 
 
-def clean_linkedin_text(text):
-    """LinkedIn'den gelen metni temizler"""
-    import html
-    if not text:
-        return ''
-
-    # HTML entity'leri decode et
-    text = html.unescape(text)
-
-    # "Company Name | LinkedIn'de 123" formatını temizle
-    if ' | LinkedIn' in text:
-        # LinkedIn prefix'i kaldır
-        parts = text.split(' | ')
-        # İlk part firma bilgisi, son part LinkedIn meta
-        if len(parts) >= 2:
-            # "Company Name" kısmını al
-            text = parts[0].strip()
-
-    return text.strip()
-
-
-def extract_linkedin_info(html):
-    """HTML'den LinkedIn firma bilgilerini çıkarır"""
-    soup = BeautifulSoup(html, 'html.parser')
-
-    info = {
-        'name': '',
-        'about': '',
-        'tagline': '',
-        'industry': '',
-        'company_size': '',
-        'headquarters': '',
-        'founded': ''
-    }
-
-    try:
-        # Firma adı - meta tag'den
-        og_title = soup.find('meta', property='og:title')
-        if og_title and og_title.get('content'):
-            # "Company Name | LinkedIn" formatından sadece firma adını al
-            title = og_title.get('content', '')
-            info['name'] = clean_linkedin_text(title.split('|')[0])
-
-        # Alternatif: title tag'den
-        if not info['name']:
-            title_tag = soup.find('title')
-            if title_tag:
-                title = title_tag.text
-                info['name'] = clean_linkedin_text(title.split('|')[0])
-
-        # Hakkında (about) bilgisi - meta description'dan
-        og_description = soup.find('meta', property='og:description')
-        if og_description and og_description.get('content'):
-            raw_about = og_description.get('content', '').strip()
-            raw_about = clean_linkedin_text(raw_about)
-
-            # LinkedIn meta formatını temizle
-            # Format: "Company Name | LinkedIn'de 123 takipçi Actual description here"
-            # veya: "LinkedIn'de 123 takipçi Actual description here"
-
-            # "LinkedIn'de X takipçi/followers" kısmını kaldır
-            raw_about = re.sub(r"^.*?\s*\|\s*LinkedIn'de\s+[\d\.,]+\s+takipçi\s+", '', raw_about)
-            raw_about = re.sub(r"^.*?\s*\|\s*LinkedIn'de\s+[\d\.,]+\s+followers?\s+", '', raw_about)
-            raw_about = re.sub(r"^LinkedIn'de\s+[\d\.,]+\s+takipçi\s+", '', raw_about)
-            raw_about = re.sub(r"^LinkedIn'de\s+[\d\.,]+\s+followers?\s+", '', raw_about)
-
-            info['about'] = raw_about.strip()
-
-        # Alternatif: meta description tag'den
-        if not info['about']:
-            meta_desc = soup.find('meta', attrs={'name': 'description'})
-            if meta_desc and meta_desc.get('content'):
-                raw_desc = meta_desc.get('content', '').strip()
-                raw_desc = clean_linkedin_text(raw_desc)
-                raw_desc = re.sub(r"^.*?\s*\|\s*LinkedIn'de\s+[\d\.,]+\s+takipçi\s+", '', raw_desc)
-                raw_desc = re.sub(r"^LinkedIn'de\s+[\d\.,]+\s+takipçi\s+", '', raw_desc)
-                info['about'] = raw_desc.strip()
-
-        # Tagline - about'tan ilk anlamlı cümleyi çıkar
-        if info['about'] and len(info['about']) > 20:
-            # İlk cümleyi veya ilk pipe'a kadar olan kısmı al
-            if '|' in info['about']:
-                tagline = info['about'].split('|')[0].strip()
-            else:
-                # İlk cümleyi al (. veya ! veya ?)
-                sentences = re.split(r'[.!?]\s+', info['about'])
-                tagline = sentences[0].strip() if sentences else ''
-
-            # Makul bir tagline uzunluğu kontrolü
-            if 10 < len(tagline) < 200:
-                info['tagline'] = tagline
-
-        # JSON-LD structured data'dan bilgi çek
-        json_ld_scripts = soup.find_all('script', type='application/ld+json')
-        for script in json_ld_scripts:
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, dict):
-                    if data.get('@type') == 'Organization':
-                        if not info['name'] and data.get('name'):
-                            info['name'] = data['name']
-                        if not info['about'] and data.get('description'):
-                            info['about'] = data['description']
-            except:
-                continue
-
-        # Sayfa içeriğinden detaylı bilgi çekme (JavaScript render gerektirmeden)
-        # LinkedIn'in public görünümünde bazı bilgiler meta tag'lerde olabilir
-
-        # Industry bilgisi
-        for text in soup.stripped_strings:
-            if 'Industry' in text or 'Sektör' in text:
-                # Sonraki text node'u industry olabilir
-                pass
-
-        # Company size
-        for text in soup.stripped_strings:
-            if 'employees' in text.lower() or 'çalışan' in text.lower():
-                # Size bilgisi
-                match = re.search(r'(\d+[\-,]\d+|\d+\+?)\s*(employees|çalışan)', text, re.IGNORECASE)
-                if match:
-                    info['company_size'] = match.group(1)
-
-    except Exception as e:
-        print(f"⚠️  Bilgi çıkarma hatası: {e}")
-
-    return info
-
-
-def update_company_json_with_linkedin(json_path, linkedin_info, dry_run=False, force=False):
-    """JSON dosyasını LinkedIn bilgileriyle günceller"""
-    try:
-        # JSON dosyasını oku
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # Mevcut değerleri sakla
-        old_name = data.get('name', '')
-        old_about = data.get('about', '')
-        old_tagline = data.get('tagline', '')
-
-        updated = False
-        updates = []
-
-        # Name güncelle (sadece boşsa veya force modundaysa)
-        if linkedin_info['name'] and (not old_name or force):
-            data['name'] = linkedin_info['name']
-            updated = True
-            updates.append(f"Name: {linkedin_info['name']}")
-
-        # About güncelle (sadece boşsa veya force modundaysa)
-        if linkedin_info['about'] and (not old_about or force):
-            data['about'] = linkedin_info['about']
-            updated = True
-            updates.append(f"About: {linkedin_info['about'][:100]}...")
-
-        # Tagline güncelle (sadece boşsa veya force modundaysa)
-        if linkedin_info['tagline'] and (not old_tagline or force):
-            data['tagline'] = linkedin_info['tagline']
-            updated = True
-            updates.append(f"Tagline: {linkedin_info['tagline']}")
-
-        if not updated:
-            print("  ℹ️  Güncellenecek yeni bilgi bulunamadı (zaten dolu veya LinkedIn'den bilgi alınamadı)")
-            return False
-
-        # Güncellemeleri göster
-        print("\n📝 Güncellenecek alanlar:")
-        for update in updates:
-            print(f"  • {update}")
-
-        # Dosyayı kaydet
-        if not dry_run:
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            print(f"\n✅ Dosya güncellendi: {json_path}")
-        else:
-            print(f"\n🔍 DRY RUN: Dosya güncellenmedi (--dry-run)")
-
-        return True
-
-    except Exception as e:
-        print(f"❌ JSON güncelleme hatası: {e}")
-        return False
-
-
 def process_single_file(json_path, args):
-    """Tek bir JSON dosyasını işler"""
+    """Tek bir JSON dosyasını işler
+
+    Returns:
+        str: UPDATED, UNCHANGED, SKIPPED (LinkedIn linki yok) veya FAILED
+    """
     print(f"\n{'='*70}")
     print(f"📂 Dosya: {json_path.name}")
     print(f"{'='*70}")
@@ -258,13 +92,13 @@ def process_single_file(json_path, args):
             data = json.load(f)
     except Exception as e:
         print(f"❌ JSON okuma hatası: {e}")
-        return False
+        return FAILED
 
     # LinkedIn linkini al
     linkedin_url = data.get('social', {}).get('linkedin', '')
     if not linkedin_url:
         print("⚠️  LinkedIn linki bulunamadı")
-        return False
+        return SKIPPED
 
     print(f"🔗 LinkedIn: {linkedin_url}")
 
@@ -280,24 +114,29 @@ def process_single_file(json_path, args):
 
     if not html:
         print("❌ LinkedIn HTML çekilemedi")
-        return False
+        return FAILED
 
-    # Bilgileri çıkar
+    # Bilgileri çıkar ve JSON'u güncelle
     linkedin_info = extract_linkedin_info(html)
+    print_linkedin_info(linkedin_info)
 
-    print(f"\n✅ LinkedIn'den çekilen bilgiler:")
-    print(f"  Name: {linkedin_info['name'] or '(bulunamadı)'}")
-    print(f"  Tagline: {linkedin_info['tagline'] or '(bulunamadı)'}")
-    print(f"  About: {linkedin_info['about'][:100] if linkedin_info['about'] else '(bulunamadı)'}{'...' if len(linkedin_info['about']) > 100 else ''}")
-
-    # JSON'u güncelle
-    success = update_company_json_with_linkedin(json_path, linkedin_info, dry_run=args.dry_run, force=args.force)
+    try:
+        updates = update_company_json_with_linkedin(json_path, linkedin_info, dry_run=args.dry_run, force=args.force)
+    except Exception as e:
+        print(f"❌ JSON güncelleme hatası: {e}")
+        return FAILED
 
-    return success
+    print_linkedin_updates(json_path, updates, dry_run=args.dry_run)
+    return UPDATED if updates else UNCHANGED
 
 
 def process_all_files(args):
-    """Tüm company JSON dosyalarını işler"""
+    """Tüm company JSON dosyalarını işler
+
+    Her dosyanın sonucu .cache/run-journal.sqlite'a yazılır (dry-run hariç).
+    args.resume ise tamamlanmış dosyalar ve bekleme süresi dolmamış
+    başarısız dosyalar atlanır; değilse günlük sıfırlanır.
+    """
     company_dir = Path('public/data/company')
 
     if not company_dir.exists():
@@ -313,39 +152,60 @@ def process_all_files(args):
 
     print(f"📁 Toplam {len(json_files)} dosya bulundu")
 
-    if args.limit:
-        json_files = json_files[:args.limit]
-        print(f"⚠️  Limit uygulandı: İlk {args.limit} dosya işlenecek")
-
-    # İstatistikler
-    stats = {
-        'total': len(json_files),
-        'success': 0,
-        'failed': 0,
-        'skipped': 0
-    }
-
-    # Her dosyayı işle
-    for i, json_path in enumerate(json_files, 1):
-        print(f"\n{'='*70}")
-        print(f"[{i}/{len(json_files)}] İşleniyor...")
-        print(f"{'='*70}")
-
-        try:
-            success = process_single_file(json_path, args)
-            if success:
+    # Kesinti veya hata durumunda da bağlantı kapanır (dry-run'da günlük yok)
+    with nullcontext() if args.dry_run else RunJournal(JOURNAL_STAGE) as journal:
+        if args.resume and journal is not None:
+            json_files, resumed = journal.filter_pending(json_files, key=lambda path: path.stem)
+            print(f"⏭️  Devam modu: {resumed.get('done', 0)} tamamlanmış, "
+                  f"{resumed.get('backoff', 0)} bekleme süresindeki dosya atlandı")
+        elif journal is not None:
+            # Yeni çalışma: önceki çalışmaların 'done' kayıtları --resume'u etkilemesin
+            journal.reset()
+
+        if args.limit:
+            json_files = json_files[:args.limit]
+            print(f"⚠️  Limit uygulandı: İlk {args.limit} dosya işlenecek")
+
+        # İstatistikler
+        stats = {
+            'total': len(json_files),
+            'success': 0,
+            'failed': 0,
+            'skipped': 0
+        }
+
+        # Her dosyayı işle
+        for i, json_path in enumerate(json_files, 1):
+            print(f"\n{'='*70}")
+            print(f"[{i}/{len(json_files)}] İşleniyor...")
+            print(f"{'='*70}")
+
+            if journal is not None:
+                journal.start(json_path.stem)
+
+            error = None
+            try:
+                outcome = process_single_file(json_path, args)
+            except Exception as e:
+                print(f"❌ Hata: {e}")
+                outcome, error = FAILED, str(e)
+
+            if outcome == UPDATED:
                 stats['success'] += 1
+            elif outcome == FAILED:
+                stats['failed'] += 1
             else:
                 stats['skipped'] += 1
-        except Exception as e:
-            print(f"❌ Hata: {e}")
-            stats['failed'] += 1
 
-        # Rate limiting - LinkedIn'in throttle yapmaması için
-        if i < len(json_files):
-            wait_time = args.delay
-            print(f"\n⏳ {wait_time} saniye bekleniyor...")
-            time.sleep(wait_time)
+            if journal is not None:
+                journal.finish(json_path.stem, outcome, failed=outcome == FAILED,
+                               result=json_path.read_bytes() if json_path.exists() else None, error=error)
+
+            # Rate limiting - LinkedIn'in throttle yapmaması için
+            if i < len(json_files):
+                wait_time = args.delay
+                print(f"\n⏳ {wait_time} saniye bekleniyor...")
+                time.sleep(wait_time)
 
     # Özet
     print(f"\n{'='*70}")
@@ -355,6 +215,8 @@ def process_all_files(args):
     print(f"Başarılı: {stats['success']}")
     print(f"Atlandı: {stats['skipped']}")
     print(f"Hatalı: {stats['failed']}")
+    if not args.dry_run:
+        print(f"JSON yazma: {write_stats.summary()}")
     print(f"{'='*70}")
 
 
@@ -369,6 +231,8 @@ def main():
     parser.add_argument('--force', action='store_true', help='Mevcut bilgilerin üzerine yaz')
     parser.add_argument('--timeout', type=int, default=30, help='HTTP timeout (saniye, varsayılan: 30)')
     parser.add_argument('--delay', type=int, default=5, help='Dosyalar arası bekleme süresi (saniye, varsayılan: 5)')
+    parser.add_argument('--resume', action='store_true',
+                        help='Önceki çalışmada tamamlanan dosyaları atla, başarısızları bekleme süresi dolunca tekrar dene')
 
     args = parser.parse_args()
 
@@ -388,8 +252,8 @@ def main():
             print(f"❌ Dosya bulunamadı: {args.json_file}")
             return 1
 
-    success = process_single_file(json_path, args)
-    return 0 if success else 1
+    outcome = process_single_file(json_path, args)
+    return 0 if outcome == UPDATED else 1
 
 
 if __name__ == '__main__':
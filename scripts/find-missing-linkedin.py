@@ -3,9 +3,10 @@
 LinkedIn linki olmayan şirketleri listeler
 """
 
-import json
 from pathlib import Path
 
+from company_corpus import load_companies
+
 def find_companies_without_linkedin():
     """LinkedIn linki olmayan şirketleri bul"""
     company_dir = Path('public/data/company')
@@ -14,15 +15,18 @@ def find_companies_without_linkedin():
         print(f"❌ Dizin bulunamadı: {company_dir}")
         return
 
-    json_files = sorted(company_dir.glob('*.json'))
+    corpus = load_companies(company_dir, verbose=False)
     missing_linkedin = []
 
-    print(f"🔍 {len(json_files)} şirket dosyası taranıyor...\n")
+    print(f"🔍 {corpus.file_count} şirket dosyası taranıyor...\n")
+
+    for path, e in corpus.errors:
+        print(f"⚠️  Hata ({path.name}): {e}")
 
-    for json_file in json_files:
+    for record in corpus:
+        json_file = record.path
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = record.data
 
             company_name = data.get('name', json_file.stem)
             linkedin = data.get('social', {}).get('linkedin', '').strip()
@@ -41,7 +45,7 @@ def find_companies_without_linkedin():
     print("="*80)
     print(f"📊 LINKEDIN LİNKİ OLMAYAN ŞİRKETLER")
     print("="*80)
-    print(f"\nToplam: {len(missing_linkedin)}/{len(json_files)} şirket\n")
+    print(f"\nToplam: {len(missing_linkedin)}/{corpus.file_count} şirket\n")
     print("-"*80)
 
     for i, company in enumerate(missing_linkedin, 1):
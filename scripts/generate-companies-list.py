@@ -1,58 +1,201 @@
 #!/usr/bin/env python3
 """
 company/klasöründeki JSON dosyalarından şirket listesi oluşturur
-Her şirket için: name, slug (dosya adı), web sitesi bilgisi
+Her şirket için: name, slug (dosya adı), web sitesi bilgisi, logo yolu ve
+logo boyutu (logoWidth/logoHeight)
+
+Logo yolları public/img/company'nin tek taramasıyla (logo_index) diskteki
+gerçek dosyadan gelir; boyutu okunamayan (bozuk/HTML) dosyalar için logo
+null yazılır, böylece liste sayfası 404 veya kırık görsel istemez.
+
+Tam liste (companies.json) dışında, liste sayfasının kademeli yüklemesi
+için company-list/ klasörüne sabit boyutlu sayfalar (page-N.json) ve
+bunları tanımlayan küçük bir manifest.json yazılır:
+
+    {"total": 490, "pageSize": 100,
+     "pages": [{"file": "page-1.json", "count": 100, "sha1": "...",
+                "first": "4thewall", "last": "..."}, ...]}
+
+İstemci önce manifest'i ve ilk sayfayı yükler, kalanları kaydırma veya
+arama sırasında ister; sha1 önbellek anahtarı (?v=) olarak kullanılır.
+
+Arama için aynı klasöre search-index.json yazılır: name, slug, domain,
+sector ve tags alanlarının Türkçe katlanmış (turkish_text) token'larından
+trigram -> şirket listeleri ve her şirketin token'larının boşlukla
+birleşmiş metni (texts). Trigram kesişimi sadece aday üretir; istemci
+adayları texts'te alt dize aramasıyla doğrular, 1-2 harflik sorguları
+doğrudan texts üzerinde arar. Şirket numarası companies.json'daki
+sıradır (sayfa = numara // pageSize).
 """
 
+import hashlib
 import json
-import os
 from pathlib import Path
 
-def load_company_json(file_path):
-    """JSON dosyasını yükle"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"❌ Hata ({file_path}): {e}")
-        return None
+from company_corpus import load_companies, normalize_domain
+from json_writer import encode_json, write_bytes_if_changed
+from logo_index import LogoIndex
+from turkish_text import tokenize, trigrams
+
+# Sayfa başına şirket sayısı
+PAGE_SIZE = 100
+
+# Arama indeksine giren alanlar
+SEARCH_FIELDS = ('name', 'slug', 'domain', 'sector', 'tags')
+
+
+def search_text(company_data, slug):
+    """Bir şirketin aranabilir alanlarının metinleri"""
+    values = {
+        'name': company_data.get('name', ''),
+        'slug': slug,
+        'domain': normalize_domain((company_data.get('contact') or {}).get('web', '')),
+        'sector': company_data.get('sector') or [],
+        'tags': company_data.get('tags') or [],
+    }
+    texts = []
+    for field in SEARCH_FIELDS:
+        value = values[field]
+        if isinstance(value, list):
+            texts.extend(str(item) for item in value if item)
+        elif value:
+            texts.append(str(value))
+    return texts
+
+
+def build_search_index(documents):
+    """Şirket numarası -> metinler listesinden trigram indeksi ve doğrulama metinleri kurar
+
+    Args:
+        documents: Her şirket için search_text() çıktısı (companies.json sırasıyla)
+
+    Returns:
+        dict: {'count', 'trigrams': {tri: [no, ...]}, 'texts': ['token token ...', ...]}
+    """
+    trigram_postings = {}
+    texts = []
+    for doc_id, document in enumerate(documents):
+        tokens = list(dict.fromkeys(token for text in document for token in tokenize(text)))
+        doc_trigrams = set()
+        for token in tokens:
+            doc_trigrams |= trigrams(token)
+        # doc_id artan sırada geldiği için listeler sıralı kalır
+        for trigram in doc_trigrams:
+            trigram_postings.setdefault(trigram, []).append(doc_id)
+        texts.append(' '.join(tokens))
+
+    return {
+        'count': len(documents),
+        'trigrams': dict(sorted(trigram_postings.items())),
+        'texts': texts,
+    }
+
+
+def write_company_pages(companies, pages_dir, page_size=PAGE_SIZE, search_index=None):
+    """Listeyi sabit boyutlu sayfalara böler, sayfaları ve manifest'i yazar
+
+    search_index verilirse search-index.json olarak yazılır ve manifest'e
+    dosya adı ile sha1'i eklenir.
+
+    Returns:
+        dict: Yazılan manifest
+    """
+    pages_dir = Path(pages_dir)
+    pages_dir.mkdir(parents=True, exist_ok=True)
+
+    pages = []
+    for start in range(0, len(companies), page_size):
+        page = companies[start:start + page_size]
+        name = f'page-{len(pages) + 1}.json'
+        content = encode_json(page) + b'\n'
+        write_bytes_if_changed(pages_dir / name, content)
+        pages.append({
+            'file': name,
+            'count': len(page),
+            'sha1': hashlib.sha1(content).hexdigest(),
+            'first': page[0]['slug'],
+            'last': page[-1]['slug'],
+        })
+
+    # Liste kısaldıysa önceki çalışmadan kalan sayfaları sil
+    written = {page['file'] for page in pages}
+    for stale in pages_dir.glob('page-*.json'):
+        if stale.name not in written:
+            stale.unlink()
+
+    manifest = {
+        'total': len(companies),
+        'pageSize': page_size,
+        'pages': pages,
+    }
+
+    if search_index is not None:
+        # Makine için: boşluksuz serileştirme
+        content = json.dumps(search_index, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+        write_bytes_if_changed(pages_dir / 'search-index.json', content)
+        manifest['searchIndex'] = {
+            'file': 'search-index.json',
+            'sha1': hashlib.sha1(content).hexdigest(),
+        }
+    write_bytes_if_changed(pages_dir / 'manifest.json', encode_json(manifest) + b'\n')
+    return manifest
+
 
-def generate_companies_list(data_dir, output_file):
+def generate_companies_list(data_dir, output_file, logo_dir=None, pages_dir=None, page_size=PAGE_SIZE):
     """Şirket listesi oluştur"""
-    company_files = sorted(Path(data_dir).glob('*.json'))
+    corpus = load_companies(data_dir)
+    logos = LogoIndex(logo_dir or Path(output_file).parent.parent / 'img' / 'company')
     companies = []
+    search_documents = []
+    missing_logos = []
 
-    print(f"🔍 {len(company_files)} şirket dosyası bulundu\n")
+    print(f"🔍 {corpus.file_count} şirket dosyası bulundu\n")
 
-    for file_path in company_files:
-        company_data = load_company_json(file_path)
+    for record in corpus:
+        company_data = record.data
         if not company_data:
             continue
 
         # Slug = dosya adı (uzantısız)
-        slug = file_path.stem
+        slug = record.slug
         name = company_data.get('name', '')
         web = company_data.get('contact', {}).get('web', '')
 
-        # Logo path
-        logo = f"img/company/{slug}.svg"
+        # Logo: diskteki gerçek dosya ve başlıktan okunan boyut
+        logo, size = logos.resolve_image(slug, company_data.get('logo'))
+        if logo is None:
+            broken = logos.resolve(slug, company_data.get('logo'))
+            if broken:
+                missing_logos.append(broken)
+            size = (None, None)
 
         company_info = {
             'slug': slug,
             'name': name,
             'web': web,
-            'logo': logo
+            'logo': logo,
+            'logoWidth': size[0],
+            'logoHeight': size[1]
         }
 
         companies.append(company_info)
+        search_documents.append(search_text(company_data, slug))
         print(f"✅ {slug:30} => {name}")
 
-    # JSON olarak kaydet
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(companies, f, ensure_ascii=False, indent=2)
+    logos.save()
+
+    # JSON olarak kaydet (içerik değişmediyse dosyaya dokunulmaz)
+    write_bytes_if_changed(output_file, encode_json(companies) + b'\n')
+    pages_dir = pages_dir or Path(output_file).parent / 'company-list'
+    manifest = write_company_pages(companies, pages_dir, page_size, build_search_index(search_documents))
 
+    with_logo = sum(1 for company in companies if company['logo'])
     print(f"\n{'='*80}")
     print(f"✅ {len(companies)} şirket kaydedildi: {output_file}")
+    print(f"🖼️  Logo: {with_logo} şirket, {len(companies) - with_logo} şirkette logo yok")
+    if missing_logos:
+        print(f"⚠️  Boyutu okunamayan (bozuk) logo dosyaları: {', '.join(missing_logos)}")
+    print(f"📄 {len(manifest['pages'])} sayfa ({page_size} şirket/sayfa): {pages_dir}")
     print(f"{'='*80}\n")
 
     # Örnek kullanım
@@ -77,10 +220,12 @@ def main():
                         help='Şirket JSON dosyalarının bulunduğu dizin')
     parser.add_argument('--output', type=str, default='public/data/companies.json',
                         help='Çıktı dosyası')
+    parser.add_argument('--page-size', type=int, default=PAGE_SIZE,
+                        help=f'Sayfalı liste için sayfa başına şirket (varsayılan: {PAGE_SIZE})')
 
     args = parser.parse_args()
 
-    generate_companies_list(args.data_dir, args.output)
+    generate_companies_list(args.data_dir, args.output, page_size=args.page_size)
 
 if __name__ == '__main__':
     main()
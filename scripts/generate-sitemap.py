@@ -2,139 +2,206 @@
 """
 Sitemap Generator
 Generates sitemap.xml from companies.json
+
+Her URL'nin lastmod değeri scripts/sitemap-manifest.json'daki içerik
+hash'lerinden gelir: şirket JSON'u değişmedikçe o şirketin lastmod'u da
+değişmez. Ana sayfa ve şirket listesi tüm şirketlerin hash'ine bağlıdır.
+Sitemap dosyaları sadece içerikleri değiştiğinde yeniden yazılır.
+
+URL'ler akışla yazılır (sitemap_writer): sitemap-index.xml ve en fazla
+50.000 URL'lik sitemap-N.xml.gz parçaları her zaman, tek dosyalık
+sitemap.xml ise sınıra sığdığı sürece üretilir. Dosyalar public/ altına
+yazılır ve değişenler docs/'a kopyalanır.
+
+Şirket sayfalarına logo alanından <image:image> eklenir; logo dosyaları
+public/img/company'nin tek taramasıyla (logo_index) çözülür.
 """
 
+import hashlib
 import json
+import re
 from datetime import date
 from pathlib import Path
+from urllib.parse import quote
+from xml.sax.saxutils import unescape
+
+from company_corpus import load_companies
+from json_writer import copy_file_if_changed, encode_json, write_json_if_changed
+from logo_index import LogoIndex
+from sitemap_writer import MAX_URLS_PER_SITEMAP, ShardedSitemapWriter, SitemapFile
+
+SITE_URL = 'https://bufirmanasil.com.tr'
+MANIFEST_FILE = Path(__file__).parent / 'sitemap-manifest.json'
+
+# (yol, yorum, changefreq, priority)
+STATIC_PAGES = [
+    ('/', 'Ana Sayfa', 'weekly', '1.0'),
+    ('/home', 'Ana Sayfa (Home)', 'weekly', '0.9'),
+    ('/about', 'Hakkımızda', 'monthly', '0.8'),
+    ('/contact', 'İletişim', 'monthly', '0.8'),
+    ('/company-list', 'Şirket Listesi', 'weekly', '0.9'),
+    ('/sector-codes', 'Sektör Kodları', 'monthly', '0.7'),
+    ('/privacy', 'Gizlilik Politikası', 'yearly', '0.3'),
+    ('/terms', 'Kullanım Şartları', 'yearly', '0.3'),
+    ('/cookies', 'Çerez Politikası', 'yearly', '0.3'),
+]
+
+# İçeriği şirket listesinden oluşan sayfalar
+COMPANY_LIST_PAGES = {'/', '/home', '/company-list'}
+
+SITEMAP_ENTRY_PATTERN = re.compile(r'<loc>([^<]+)</loc>\s*<lastmod>([^<]+)</lastmod>')
+
+
+def sha1_hex(content):
+    return hashlib.sha1(content).hexdigest()
+
+
+def load_manifest(manifest_file=MANIFEST_FILE):
+    """URL yolu -> {'sha1', 'lastmod'} manifest'ini okur"""
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def read_sitemap_lastmods(sitemap_file):
+    """Mevcut sitemap'teki loc -> lastmod (manifest'te olmayan URL'ler için başlangıç değeri)"""
+    try:
+        content = sitemap_file.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return {}
+    return {unescape(loc): lastmod for loc, lastmod in SITEMAP_ENTRY_PATTERN.findall(content)}
+
+
+def resolve_lastmod(manifest, path, digest, today, seed_lastmods):
+    """Hash değişmediyse kayıtlı lastmod'u, değiştiyse bugünü döner (manifest'i günceller)
+
+    Returns:
+        tuple: (lastmod, lastmod değişti mi)
+    """
+    entry = manifest.get(path)
+    if entry is not None and entry['sha1'] == digest:
+        return entry['lastmod'], False
+
+    if entry is None and SITE_URL + path in seed_lastmods:
+        # Manifest'ten önce üretilmiş sitemap: mevcut tarihi koru
+        previous = lastmod = seed_lastmods[SITE_URL + path]
+    else:
+        previous = entry['lastmod'] if entry is not None else None
+        lastmod = today
+    manifest[path] = {'sha1': digest, 'lastmod': lastmod}
+    return lastmod, lastmod != previous
+
+
+def iter_sitemap_urls(company_digests, company_logos, manifest, today, seed_lastmods, counter):
+    """Sitemap URL'lerini (loc, lastmod, changefreq, priority, yorum, görsel) olarak sırayla üretir
+
+    company_logos: slug -> diskte bulunan logo yolu ('img/company/...')
+    lastmod'u değişen URL sayısı counter['changed'] içinde toplanır.
+    """
+    company_list_digest = sha1_hex('\n'.join(f'{slug} {digest}' for slug, digest in company_digests).encode('utf-8'))
+
+    for path, comment, changefreq, priority in STATIC_PAGES:
+        if path in COMPANY_LIST_PAGES:
+            digest = company_list_digest
+        else:
+            digest = sha1_hex(f'{path} {changefreq} {priority}'.encode('utf-8'))
+        lastmod, is_changed = resolve_lastmod(manifest, path, digest, today, seed_lastmods)
+        counter['changed'] += is_changed
+        yield SITE_URL + path, lastmod, changefreq, priority, comment, None
+
+    comment = 'Şirket Sayfaları'
+    for slug, digest in company_digests:
+        path = f'/company/{slug}'
+        lastmod, is_changed = resolve_lastmod(manifest, path, digest, today, seed_lastmods)
+        counter['changed'] += is_changed
+        logo = company_logos.get(slug)
+        image = f'{SITE_URL}/{quote(logo)}' if logo else None
+        yield SITE_URL + path, lastmod, 'monthly', '0.6', comment, image
+        comment = None
+
 
 def generate_sitemap():
     # Paths
     root_dir = Path(__file__).parent.parent
     company_data_dir = root_dir / 'public' / 'data' / 'company'
-    sitemap_file = root_dir / 'docs' / 'sitemap.xml'
-    sitemap_file_public = root_dir / 'public' / 'sitemap.xml'
+    public_dir = root_dir / 'public'
+    docs_dir = root_dir / 'docs'
+    sitemap_file_public = public_dir / 'sitemap.xml'
 
-    # Get all company JSON files
-    company_files = sorted(company_data_dir.glob('*.json'))
+    # Load all company JSON files in a single pass
+    corpus = load_companies(company_data_dir)
 
-    # Extract slugs from filenames
-    companies = []
-    for company_file in company_files:
-        slug = company_file.stem
-        companies.append({'slug': slug})
+    # Şirket başına içerik hash'i (kanonik serileştirme üzerinden)
+    company_digests = [(record.slug, sha1_hex(encode_json(record.data))) for record in corpus if record.slug]
 
-    # Current date for lastmod
+    # Logo dosyaları tek taramada; JSON'daki yol geçersizse slug'a ait dosya aranır.
+    # Görsel olmayan dosyalar atlanır (companies.json ile aynı kontrol); boyutlar
+    # cache'ten gelir, sadece değişen dosyalar açılır
+    logos = LogoIndex(public_dir / 'img' / 'company')
+    company_logos = {}
+    for record in corpus:
+        if record.slug:
+            logo, _ = logos.resolve_image(record.slug, (record.data or {}).get('logo'))
+            if logo:
+                company_logos[record.slug] = logo
+    logos.save()
+    url_count = len(STATIC_PAGES) + len(company_digests)
+
+    manifest = load_manifest()
+    seed_lastmods = read_sitemap_lastmods(sitemap_file_public)
     today = date.today().isoformat()
+    counter = {'changed': 0}
+
+    # Tek dosyalık sitemap.xml sadece protokol sınırına sığıyorsa yazılır;
+    # sitemap-index.xml + sitemap-N.xml.gz her zaman yazılır
+    single = None
+    if url_count <= MAX_URLS_PER_SITEMAP:
+        single = SitemapFile(sitemap_file_public)
+    else:
+        print(f"⚠️  {url_count} URL tek dosyaya sığmıyor; sadece sitemap-index.xml kullanılacak")
+        # Eski tek dosyalık sitemap kalırsa crawler'lar bayat içerik okur
+        for stale in (sitemap_file_public, docs_dir / sitemap_file_public.name):
+            if stale.exists():
+                stale.unlink()
+
+    with ShardedSitemapWriter(public_dir, SITE_URL) as sharded:
+        try:
+            for loc, lastmod, changefreq, priority, comment, image in iter_sitemap_urls(
+                    company_digests, company_logos, manifest, today, seed_lastmods, counter):
+                if single is not None:
+                    single.add(loc, lastmod, changefreq, priority, comment, image)
+                sharded.add(loc, lastmod, changefreq, priority, comment, image)
+        except BaseException:
+            if single is not None:
+                single.discard()
+            raise
+    single_changed = single.close() if single is not None else False
+
+    # Silinen şirketleri manifest'ten çıkar
+    known_paths = {path for path, *_ in STATIC_PAGES} | {f'/company/{slug}' for slug, _ in company_digests}
+    manifest = {path: manifest[path] for path in sorted(manifest) if path in known_paths}
+    write_json_if_changed(MANIFEST_FILE, manifest)
+
+    # public/ altındaki dosyaları docs/'a kopyala (sadece içerik değiştiyse)
+    outputs = ([sitemap_file_public.name] if single is not None else []) + [sharded.index_path.name] + sharded.shard_names
+    changed_outputs = single_changed + sharded.changed_shards + sharded.index_changed
+    for name in outputs:
+        changed_outputs += bool(copy_file_if_changed(public_dir / name, docs_dir / name))
+    for stale in sorted(docs_dir.glob('sitemap-*.xml.gz')):
+        if stale.name not in outputs:
+            stale.unlink()
 
-    # Start XML
-    xml_lines = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"',
-        '        xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"',
-        '        xsi:schemaLocation="http://www.sitemaps.org/schemas/sitemap/0.9',
-        '        http://www.sitemaps.org/schemas/sitemap/0.9/sitemap.xsd">',
-        '',
-        '  <!-- Ana Sayfa -->',
-        '  <url>',
-        '    <loc>https://bufirmanasil.com.tr/</loc>',
-        f'    <lastmod>{today}</lastmod>',
-        '    <changefreq>weekly</changefreq>',
-        '    <priority>1.0</priority>',
-        '  </url>',
-        '',
-        '  <!-- Ana Sayfa (Home) -->',
-        '  <url>',
-        '    <loc>https://bufirmanasil.com.tr/home</loc>',
-        f'    <lastmod>{today}</lastmod>',
-        '    <changefreq>weekly</changefreq>',
-        '    <priority>0.9</priority>',
-        '  </url>',
-        '',
-        '  <!-- Hakkımızda -->',
-        '  <url>',
-        '    <loc>https://bufirmanasil.com.tr/about</loc>',
-        f'    <lastmod>{today}</lastmod>',
-        '    <changefreq>monthly</changefreq>',
-        '    <priority>0.8</priority>',
-        '  </url>',
-        '',
-        '  <!-- İletişim -->',
-        '  <url>',
-        '    <loc>https://bufirmanasil.com.tr/contact</loc>',
-        f'    <lastmod>{today}</lastmod>',
-        '    <changefreq>monthly</changefreq>',
-        '    <priority>0.8</priority>',
-        '  </url>',
-        '',
-        '  <!-- Şirket Listesi -->',
-        '  <url>',
-        '    <loc>https://bufirmanasil.com.tr/company-list</loc>',
-        f'    <lastmod>{today}</lastmod>',
-        '    <changefreq>weekly</changefreq>',
-        '    <priority>0.9</priority>',
-        '  </url>',
-        '',
-        '  <!-- Sektör Kodları -->',
-        '  <url>',
-        '    <loc>https://bufirmanasil.com.tr/sector-codes</loc>',
-        f'    <lastmod>{today}</lastmod>',
-        '    <changefreq>monthly</changefreq>',
-        '    <priority>0.7</priority>',
-        '  </url>',
-        '',
-        '  <!-- Gizlilik Politikası -->',
-        '  <url>',
-        '    <loc>https://bufirmanasil.com.tr/privacy</loc>',
-        f'    <lastmod>{today}</lastmod>',
-        '    <changefreq>yearly</changefreq>',
-        '    <priority>0.3</priority>',
-        '  </url>',
-        '',
-        '  <!-- Kullanım Şartları -->',
-        '  <url>',
-        '    <loc>https://bufirmanasil.com.tr/terms</loc>',
-        f'    <lastmod>{today}</lastmod>',
-        '    <changefreq>yearly</changefreq>',
-        '    <priority>0.3</priority>',
-        '  </url>',
-        '',
-        '  <!-- Çerez Politikası -->',
-        '  <url>',
-        '    <loc>https://bufirmanasil.com.tr/cookies</loc>',
-        f'    <lastmod>{today}</lastmod>',
-        '    <changefreq>yearly</changefreq>',
-        '    <priority>0.3</priority>',
-        '  </url>',
-        '',
-        '  <!-- Şirket Sayfaları -->',
-    ]
-
-    # Add company URLs
-    for company in companies:
-        slug = company.get('slug', '')
-        if slug:
-            xml_lines.extend([
-                '  <url>',
-                f'    <loc>https://bufirmanasil.com.tr/company/{slug}</loc>',
-                f'    <lastmod>{today}</lastmod>',
-                '    <changefreq>monthly</changefreq>',
-                '    <priority>0.6</priority>',
-                '  </url>',
-                '',
-            ])
-
-    # Close XML
-    xml_lines.append('</urlset>')
-
-    # Write sitemap to both locations
-    for output_file in [sitemap_file, sitemap_file_public]:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(xml_lines))
-        print(f"✅ Sitemap oluşturuldu: {output_file}")
-    print(f"📊 Toplam URL sayısı: {9 + len(companies)}")
-    print(f"   - Statik sayfalar: 9")
-    print(f"   - Şirket sayfaları: {len(companies)}")
+    if changed_outputs:
+        print(f"✅ Sitemap güncellendi: {public_dir} ve {docs_dir} ({len(sharded.shards)} parça + sitemap-index.xml)")
+    else:
+        print(f"♻️  Sitemap değişmedi ({len(sharded.shards)} parça + sitemap-index.xml)")
+    print(f"📊 Toplam URL sayısı: {url_count}")
+    print(f"   - Statik sayfalar: {len(STATIC_PAGES)}")
+    print(f"   - Şirket sayfaları: {len(company_digests)}")
+    print(f"   - Logo görseli olan: {len(company_logos)} ({logos.size_reads} logo dosyası okundu)")
+    print(f"   - lastmod güncellenen: {counter['changed']}")
 
 if __name__ == '__main__':
     generate_sitemap()
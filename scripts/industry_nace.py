@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn sektör metinlerini ("BT Hizmetleri ve BT Danışmanlığı",
+"Electronics Manufacturing") NACE alt sınıf kodlarına eşleyen toplu
+bulanık eşleyici.
+
+Tüm SektorKodlari açıklamaları bir kez karakter n-gram TF-IDF matrisine
+(scipy.sparse CSR, satırlar L2 normlu) çevrilir. Eşlenecek farklı sektör
+metinleri aynı sözlükle ikinci bir matrise çevrilir ve skorlar seyrek
+matris çarpımlarıyla (sorgular x açıklamalar) hesaplanır.
+
+N-gram'lar kelime bazında çıkarılır: metin turkish_text ile katlanır,
+token'lar stem_turkish ile köke indirilir ve her kelime " kelime " olarak
+sınırlanıp 3-4 karakterlik parçalara bölünür. NACE açıklamalarının kalıp
+kelimeleri ("faaliyetleri", "hizmet", "diğer", "vb.") STOPWORDS ile
+atılır; aksi halde "BT Hizmetleri ve BT Danışmanlığı" gibi metinler sadece
+bu kelimeler üzerinden alakasız açıklamalara (70.22.03) eşleşir.
+Açıklamalarda geçmeyen n-gram'lar sorgu normuna dahil edilir; İngilizce
+metinler bu yüzden düşük güvenle döner. LinkedIn'in NACE'de karşılığı
+olmayan kelimeleri ("BT", "Bilişim", "Siber") QUERY_ALIASES ile NACE
+sözcüklerine genişletilir.
+
+Tek bir alt sınıf açıklamasıyla tesadüfi kelime örtüşmesi ("Yazılım
+Geliştirme" -> "vücut geliştirme salonları") yerine, skor alt sınıfın
+yanında sınıf (62.01) ve grup (62.0) düzeyinde de hesaplanır: üst düzey
+belge altındaki açıklamaların birleşimidir ve alt sınıfın skoru üç
+kosinüs benzerliğinin ortalamasıdır. Metin ile açıklamanın faaliyet türü
+(imalat / ticaret / diğer) uyuşmuyorsa skor ACTIVITY_MISMATCH_WEIGHT ile
+çarpılır. Sonuç güven değeri olarak kullanılır (0-1).
+
+MIN_CONFIDENCE, elle etiketlenmiş şirket sektör metinleriyle seçilmiştir;
+altındaki eşleşmeler kullanılmamalıdır. EXPECTED_MAPPINGS elle kontrol
+edilmiş beklenen eşleşmelerdir ve check_expectations ile doğrulanır
+(map-industries.py --check).
+
+Sonuç tablosu .cache/industry-nace.json'da tutulur. Tablo sektör
+dosyasının sha1'i ve MAPPER_VERSION ile anahtarlanır; ikisi değişmediği
+sürece sadece tabloda olmayan metinler skorlanır.
+
+Kullanım:
+    from industry_nace import IndustryMapper, load_sectors
+
+    sectors, _ = load_sectors()
+    mapper = IndustryMapper(sectors)
+    table = mapper.map(['Tüketici Elektroniği', 'Telekomünikasyon'])
+    table['Tüketici Elektroniği']['code']        # '26.40.90'
+    table['Tüketici Elektroniği']['confidence']  # 0.41
+"""
+
+import hashlib
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+
+from company_corpus import CACHE_DIR
+from json_writer import write_bytes_if_changed
+from turkish_text import stem_turkish, tokenize
+
+ROOT_DIR = Path(__file__).parent.parent
+SECTOR_CODES_FILE = ROOT_DIR / 'public' / 'data' / 'SektorKodlari.json'
+INDUSTRY_TABLE_FILE = CACHE_DIR / 'industry-nace.json'
+
+# Vektörleştirme veya skorlama değişirse artırılır (eski tablo geçersiz olur)
+MAPPER_VERSION = 2
+
+NGRAM_SIZES = (3, 4)
+
+# Bu güvenin altındaki eşleşmeler kullanılmaz (EXPECTED_MAPPINGS ve şirket
+# sektör metinlerinin elle etiketlenmesiyle kalibre edildi)
+MIN_CONFIDENCE = 0.30
+
+# NACE açıklamalarında her yerde geçen bağlaç ve kalıp kelimeler
+# (katlanmış token veya stem_turkish kökü olarak)
+STOPWORDS = frozenset({
+    've', 'veya', 'ile', 'ya', 'da', 'icin', 'gibi', 'bir', 'olan', 'olmayan', 'olarak',
+    'vb', 'bys', 'diger', 'baska', 'yerde', 'siniflandirilmamis', 'dahil', 'haric',
+    'benzer', 'bunlar', 'ait', 'ilgili', 'ilgil', 'yonelik', 'belirli', 'belirl', 'tahsis',
+    'edilmis', 'mala', 'kullanilan', 'yapilan', 'faaliyet', 'hizmet', 'urun',
+})
+
+# Sorgu (LinkedIn sektörü) tarafında NACE sözlüğüne genişletilen kelimeler
+QUERY_ALIASES = {
+    'bt': 'bilgi teknolojisi',
+    'bilisim': 'bilgi teknolojisi bilgisayar',
+    'yazilim': 'yazilim bilgisayar programlama',
+    'siber': 'bilgisayar network',
+    'ag': 'network',
+    'e': 'internet',
+}
+
+# Faaliyet türünü belirleyen kökler; türü uyuşmayan açıklamanın skor çarpanı
+ACTIVITY_TERMS = {'imalat': 1, 'ticaret': 2}
+ACTIVITY_MISMATCH_WEIGHT = 0.8
+
+# Alt sınıfla birlikte skorlanan üst düzeyler: kod önek uzunluğu ("62.01", "62.0")
+PARENT_PREFIX_LENGTHS = (5, 4)
+
+# Elle kontrol edilmiş eşleşmeler: metin -> kabul edilen kod önekleri;
+# None, metnin MIN_CONFIDENCE altında kalması (eşlenmemesi) gerektiğidir
+EXPECTED_MAPPINGS = {
+    'BT Hizmetleri ve BT Danışmanlığı': ('62',),
+    'Yazılım Geliştirme': ('62.01',),
+    'Bilgi Teknolojisi ve Hizmetleri': ('62',),
+    'Teknoloji, Bilgi ve İnternet': ('62', '63'),
+    'Bilgisayar ve Ağ Güvenliği': ('62',),
+    'Yazılım': ('62.01', '58.29'),
+    'Bilişim': ('62',),
+    'Siber Güvenlik': ('62',),
+    'Masaüstü Bilgisayar Yazılımı Ürünleri': ('62', '58.29'),
+    'Bilgi Hizmetleri': ('63',),
+    'Telekomünikasyon': ('61',),
+    'E-Ticaret': ('47.91',),
+    'Bilgisayar Donanımı İmalatı': ('26.20',),
+    'Bilgisayar Ağları Ürünleri': ('26.20', '26.30'),
+    'Bilgisayarlar ve Elektronik Ürünler İmalatı': ('26',),
+    'Tüketici Elektroniği': ('26.40',),
+    'Motorlu Taşıt İmalatı': ('29.10',),
+    'Finansal Hizmetler': ('64',),
+    'Petrol ve Gaz': ('06',),
+    'Cam, Seramik ve Beton İmalatı': ('23',),
+    'Appliances': None,
+    'Electrical': None,
+    'Electronics Manufacturing': None,
+    'Çeviri ve Yerelleştirme': None,
+}
+
+# Tabloda en iyi eşleşmenin yanında tutulan aday sayısı
+CANDIDATE_COUNT = 3
+
+
+def content_words(text, aliases=None):
+    """Metnin kalıp kelimeleri atılmış kökleri; aliases verilirse token'lar önce genişletilir"""
+    words = []
+    for token in tokenize(text):
+        expansion = aliases.get(token) if aliases else None
+        for word in tokenize(expansion) if expansion else [token]:
+            stem = stem_turkish(word)
+            if word not in STOPWORDS and stem not in STOPWORDS:
+                words.append(stem)
+    return words
+
+
+def char_ngrams(text, aliases=None):
+    """Metnin kelime sınırlı karakter n-gram sayıları"""
+    counts = {}
+    for stem in content_words(text, aliases):
+        word = f' {stem} '
+        for size in NGRAM_SIZES:
+            for i in range(len(word) - size + 1):
+                gram = word[i:i + size]
+                counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+
+def activity(text):
+    """Metnin faaliyet türü bit maskesi (ACTIVITY_TERMS; 0 = imalat/ticaret değil)"""
+    mask = 0
+    for token in tokenize(text):
+        mask |= ACTIVITY_TERMS.get(stem_turkish(token), 0)
+    return mask
+
+
+def load_sectors(path=SECTOR_CODES_FILE):
+    """SektorKodlari.json -> ([{"code", "name"}, ...], içerik sha1'i)"""
+    content = Path(path).read_bytes()
+    return json.loads(content.decode('utf-8'))['sectors'], hashlib.sha1(content).hexdigest()
+
+
+class IndustryMapper:
+    """NACE açıklamalarının (alt sınıf, sınıf, grup) TF-IDF matrisleri ve toplu eşleme"""
+
+    def __init__(self, sectors):
+        self.sectors = sectors
+
+        grams = [char_ngrams(sector['name']) for sector in sectors]
+        self.vocabulary = {}
+        for counts in grams:
+            for gram in counts:
+                self.vocabulary.setdefault(gram, len(self.vocabulary))
+
+        document_frequency = np.zeros(len(self.vocabulary))
+        for counts in grams:
+            document_frequency[[self.vocabulary[gram] for gram in counts]] += 1
+
+        # Yumuşatılmış idf; açıklamalarda hiç geçmeyen n-gram'ın ağırlığı
+        document_count = len(sectors)
+        self.idf = np.log((1 + document_count) / (1 + document_frequency)) + 1
+        self.unseen_idf = math.log(1 + document_count) + 1
+
+        self.matrix = self._vectorize(grams)
+        self.activities = np.array([activity(sector['name']) for sector in sectors])
+
+        # Üst düzey belgeler: aynı kod önekli açıklamaların n-gram toplamı;
+        # parent_rows[i], i. alt sınıfın üst düzey matristeki satırıdır
+        self.parents = []
+        for length in PARENT_PREFIX_LENGTHS:
+            rows = {}
+            parent_grams = []
+            parent_rows = []
+            for sector, counts in zip(sectors, grams):
+                row = rows.setdefault(sector['code'][:length], len(rows))
+                if row == len(parent_grams):
+                    parent_grams.append({})
+                merged = parent_grams[row]
+                for gram, count in counts.items():
+                    merged[gram] = merged.get(gram, 0) + count
+                parent_rows.append(row)
+            self.parents.append((self._vectorize(parent_grams), np.asarray(parent_rows)))
+
+    def _vectorize(self, grams):
+        """n-gram sayılarından L2 normlu CSR matris"""
+        indptr = [0]
+        indices = []
+        data = []
+        unseen_weights = []
+        for counts in grams:
+            unseen = 0.0
+            for gram, count in counts.items():
+                # Alt doğrusal tf: 1 + log(sayı)
+                weight = 1 + math.log(count)
+                column = self.vocabulary.get(gram)
+                if column is None:
+                    unseen += (weight * self.unseen_idf) ** 2
+                    continue
+                indices.append(column)
+                data.append(weight)
+            indptr.append(len(indices))
+            unseen_weights.append(unseen)
+
+        matrix = sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float64), np.asarray(indices, dtype=np.int64), np.asarray(indptr)),
+            shape=(len(grams), len(self.vocabulary)),
+        )
+        matrix = matrix.multiply(self.idf).tocsr()
+
+        # Norm, sözlükte olmayan n-gram'ları da içerir
+        seen = np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel()
+        norms = np.sqrt(seen + np.asarray(unseen_weights))
+        norms[norms == 0] = 1
+        return sparse.diags(1 / norms) @ matrix
+
+    def scores(self, texts):
+        """Metinler x sektörler skor matrisi (yoğun ndarray)
+
+        Alt sınıf, sınıf ve grup kosinüs benzerliklerinin ortalaması; faaliyet
+        türü uyuşmayan sütunlar ACTIVITY_MISMATCH_WEIGHT ile çarpılır.
+        """
+        queries = self._vectorize([char_ngrams(text, QUERY_ALIASES) for text in texts])
+        scores = (queries @ self.matrix.T).toarray()
+        for matrix, parent_rows in self.parents:
+            scores += (queries @ matrix.T).toarray()[:, parent_rows]
+        scores /= 1 + len(self.parents)
+
+        activities = np.array([activity(text) for text in texts])
+        mismatch = activities[:, None] != self.activities[None, :]
+        scores[mismatch] *= ACTIVITY_MISMATCH_WEIGHT
+        return scores
+
+    def map(self, texts, candidates=CANDIDATE_COUNT):
+        """Her metin için en iyi NACE eşleşmesi ve adaylar
+
+        Returns:
+            dict: metin -> {"code", "name", "confidence", "candidates": [{"code", "confidence"}]}
+        """
+        texts = list(dict.fromkeys(texts))
+        if not texts:
+            return {}
+
+        scores = self.scores(texts)
+        count = min(candidates, scores.shape[1])
+        # Satır başına en yüksek `count` skor (sırasız), sonra sadece onlar sıralanır
+        top = np.argpartition(-scores, count - 1, axis=1)[:, :count]
+        rows = np.arange(len(texts))[:, None]
+        top = np.take_along_axis(top, np.argsort(-scores[rows, top], axis=1), axis=1)
+
+        table = {}
+        for row, text in enumerate(texts):
+            best = top[row, 0]
+            if scores[row, best] <= 0:
+                table[text] = {'code': None, 'name': None, 'confidence': 0.0, 'candidates': []}
+                continue
+            table[text] = {
+                'code': self.sectors[best]['code'],
+                'name': self.sectors[best]['name'],
+                'confidence': round(float(scores[row, best]), 4),
+                'candidates': [
+                    {'code': self.sectors[column]['code'], 'confidence': round(float(scores[row, column]), 4)}
+                    for column in top[row, 1:] if scores[row, column] > 0
+                ],
+            }
+        return table
+
+
+def load_industry_table(sectors_sha1, path=INDUSTRY_TABLE_FILE):
+    """Geçerli (aynı sektör dosyası ve versiyon) tabloyu döner, yoksa boş dict"""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    try:
+        cached = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if cached.get('version') != MAPPER_VERSION or cached.get('sectorsSha1') != sectors_sha1:
+        return {}
+    return cached.get('industries') or {}
+
+
+def write_industry_table(table, sectors_sha1, path=INDUSTRY_TABLE_FILE):
+    """Tabloyu metne göre sıralı yazar; değiştiyse True"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    content = {
+        'version': MAPPER_VERSION,
+        'sectorsSha1': sectors_sha1,
+        'industries': dict(sorted(table.items())),
+    }
+    return write_bytes_if_changed(
+        path, json.dumps(content, ensure_ascii=False, indent=2).encode('utf-8') + b'\n'
+    )
+
+
+def check_expectations(table, min_confidence=MIN_CONFIDENCE, expected=EXPECTED_MAPPINGS):
+    """Tabloyu elle kontrol edilmiş eşleşmelerle karşılaştırır
+
+    Returns:
+        list: uymayanlar [(metin, beklenen önekler veya None, eşleşme)]
+    """
+    failures = []
+    for text, prefixes in expected.items():
+        match = table.get(text) or {'code': None, 'confidence': 0.0}
+        accepted = match['code'] is not None and match['confidence'] >= min_confidence
+        if prefixes is None:
+            ok = not accepted
+        else:
+            ok = accepted and match['code'].startswith(prefixes)
+        if not ok:
+            failures.append((text, prefixes, match))
+    return failures
+
+
+def map_industries(texts, sectors_path=SECTOR_CODES_FILE, table_path=INDUSTRY_TABLE_FILE, force=False):
+    """Metinleri cache'li tabloyla eşler; sadece yeni metinler skorlanır
+
+    Returns:
+        (tablo, yeni skorlanan metin sayısı)
+    """
+    sectors, sectors_sha1 = load_sectors(sectors_path)
+    table = {} if force else load_industry_table(sectors_sha1, table_path)
+
+    missing = [text for text in dict.fromkeys(texts) if text not in table]
+    if missing:
+        table.update(IndustryMapper(sectors).map(missing))
+        write_industry_table(table, sectors_sha1, table_path)
+    return table, len(missing)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Company JSON dosyaları için atomik ve değişiklik-duyarlı yazma katmanı.
+
+Veri her zaman aynı biçimde (ensure_ascii=False, indent=2) serileştirilir ve
+diskteki byte'larla karşılaştırılır; içerik aynıysa dosyaya dokunulmaz (mtime
+korunur). Farklıysa aynı klasörde geçici dosyaya yazılıp os.replace ile
+yerine konur, böylece yarıda kalan bir yazma dosyayı bozmaz.
+
+Kullanım:
+    from json_writer import write_json_if_changed, write_stats
+
+    if write_json_if_changed(json_path, data):
+        print("güncellendi")
+    print(write_stats.summary())
+"""
+
+import filecmp
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+
+def encode_json(data):
+    """Company JSON dosyalarının kanonik byte gösterimi"""
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+class WriteStats:
+    """Yapılan ve gereksiz olduğu için atlanan yazma sayaçları"""
+
+    def __init__(self):
+        self.written = 0
+        self.unchanged = 0
+
+    def summary(self):
+        return f"{self.written} yazildi, {self.unchanged} degismedi (yazilmadi)"
+
+
+# Process genelindeki varsayılan sayaç
+write_stats = WriteStats()
+
+
+def write_bytes_atomic(path, content):
+    """Byte içeriğini geçici dosya + rename ile atomik olarak yazar"""
+    path = Path(path)
+    try:
+        mode = path.stat().st_mode & 0o777
+    except FileNotFoundError:
+        mode = 0o644
+
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp 0600 ile oluşturur; mevcut dosyanın iznini koru
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class AtomicFile:
+    """Akışla (parça parça) yazılan dosya için write_bytes_if_changed karşılığı
+
+    İçerik aynı klasördeki geçici dosyaya yazılır; close() ile diskteki
+    dosyayla parça parça karşılaştırılır, farklıysa os.replace ile yerine
+    konur, aynıysa geçici dosya silinir. Bellek kullanımı içerik boyutundan
+    bağımsızdır.
+
+    Kullanım:
+        with AtomicFile(path) as f:
+            f.write(b'...')
+        print(f.changed)
+    """
+
+    def __init__(self, path, stats=write_stats):
+        self.path = Path(path)
+        self.stats = stats
+        self.changed = None
+        fd, self.tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f'.{self.path.name}.', suffix='.tmp')
+        self.file = os.fdopen(fd, 'wb')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is not None:
+            self.discard()
+        elif self.file is not None:
+            self.close()
+
+    def write(self, data):
+        return self.file.write(data)
+
+    def flush(self):
+        self.file.flush()
+
+    def discard(self):
+        """Geçici dosyayı siler, hedefe dokunmaz"""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        try:
+            os.unlink(self.tmp_path)
+        except OSError:
+            pass
+
+    def close(self):
+        """Yazmayı bitirir; hedef değiştiyse True döner"""
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        self.file = None
+
+        try:
+            mode = self.path.stat().st_mode & 0o777
+            unchanged = filecmp.cmp(self.tmp_path, self.path, shallow=False)
+        except FileNotFoundError:
+            mode, unchanged = 0o644, False
+
+        if unchanged:
+            os.unlink(self.tmp_path)
+            self.stats.unchanged += 1
+            self.changed = False
+        else:
+            # mkstemp 0600 ile oluşturur; mevcut dosyanın iznini koru
+            os.chmod(self.tmp_path, mode)
+            os.replace(self.tmp_path, self.path)
+            self.stats.written += 1
+            self.changed = True
+        return self.changed
+
+
+def copy_file_if_changed(source, path, stats=write_stats):
+    """Dosyayı, içerik farklıysa hedefe atomik olarak kopyalar"""
+    with AtomicFile(path, stats=stats) as f, open(source, 'rb') as src:
+        shutil.copyfileobj(src, f)
+    return f.changed
+
+
+def write_bytes_if_changed(path, content, stats=write_stats):
+    """İçerik diskteki ile aynı değilse atomik olarak yazar
+
+    Returns:
+        bool: Dosya yazıldıysa True, içerik zaten aynıysa False
+    """
+    path = Path(path)
+    try:
+        if path.read_bytes() == content:
+            stats.unchanged += 1
+            return False
+    except FileNotFoundError:
+        pass
+
+    write_bytes_atomic(path, content)
+    stats.written += 1
+    return True
+
+
+def write_json_if_changed(path, data, stats=write_stats):
+    """Veriyi kanonik biçimde serileştirir, değiştiyse atomik olarak yazar"""
+    return write_bytes_if_changed(path, encode_json(data), stats=stats)
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+"""
+LinkedIn sirket sayfalari icin ortak cikarma ve birlestirme paketi.
+
+Kullanim:
+    from linkedin_extract import extract_linkedin_info, update_company_json_with_linkedin
+
+    info = extract_linkedin_info(html)
+    updates = update_company_json_with_linkedin(json_path, info, dry_run=True)
+"""
+
+from linkedin_extract.extract import (
+    EXTRACTOR_VERSION,
+    LINKEDIN_FIELDS,
+    PageNodes,
+    build_linkedin_info,
+    clean_company_name,
+    collect_page,
+    empty_linkedin_info,
+    extract_linkedin_info,
+)
+from linkedin_extract.merge import (
+    FETCH_FIELD_RULES,
+    FIELD_RULES,
+    linkedin_proposals,
+    merge_linkedin_info,
+    update_company_json_with_linkedin,
+)
+from linkedin_extract.report import print_linkedin_info, print_linkedin_updates
+
+__all__ = [
+    'EXTRACTOR_VERSION',
+    'FETCH_FIELD_RULES',
+    'FIELD_RULES',
+    'LINKEDIN_FIELDS',
+    'PageNodes',
+    'build_linkedin_info',
+    'clean_company_name',
+    'collect_page',
+    'empty_linkedin_info',
+    'extract_linkedin_info',
+    'linkedin_proposals',
+    'merge_linkedin_info',
+    'print_linkedin_info',
+    'print_linkedin_updates',
+    'update_company_json_with_linkedin',
+]
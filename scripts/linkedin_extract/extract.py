@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn sirket sayfasi HTML'inden bilgi cikarma motoru.
+
+Sayfa lxml'in artimli parser'ina parca parca verilir ve tek geciste sadece
+gereken dugumler toplanir:
+
+- <head>: og:title, og:description, og:image, <title>, ld+json bloklari
+- top-card: baslik (h1), sektor (h2), tagline (h4 > span)
+- Hakkinda bolumu: aciklama ve dt/dd detaylari (web sitesi, sektor,
+  sirket buyuklugu, genel merkez, kurulus, uzmanliklar)
+
+Gereken bolumler kapandiginda sayfanin geri kalani hic parse edilmez. Acik
+(public) sayfalardaki data-test-id isaretleri ve oturum acilmis sayfalardaki
+(Selenium) org-* siniflari ile dt etiketleri ayni geciste desteklenir.
+"""
+
+import html
+import json
+import re
+
+from lxml import etree
+
+# extract_linkedin_info ciktisi degistiginde artirin; cache otomatik gecersizlenir
+EXTRACTOR_VERSION = 2
+
+# Tum extractor'larin ortak cikti semasi
+LINKEDIN_FIELDS = (
+    'companyName',
+    'tagline',
+    'description',
+    'website',
+    'industry',
+    'companySize',
+    'headquarters',
+    'founded',
+    'specialties',
+    'followers',
+    'logoUrl',
+)
+
+# Parser'a tek seferde verilen karakter sayisi
+CHUNK_SIZE = 16 * 1024
+
+TAGLINE_CLASS = 'top-card-layout__second-subline'
+INDUSTRY_CLASS = 'top-card-layout__headline'
+TITLE_CLASSES = ('top-card-layout__title', 'org-top-card-summary__title')
+LOGGED_IN_TAGLINE_CLASS = 'org-top-card-summary__tagline'
+
+ABOUT_SECTION_ID = 'about-us'
+ABOUT_DESCRIPTION_ID = 'about-us__description'
+
+# Hakkinda bolumundeki data-test-id -> alan
+ABOUT_DETAIL_IDS = {
+    'about-us__website': 'website',
+    'about-us__industry': 'industry',
+    'about-us__size': 'companySize',
+    'about-us__headquarters': 'headquarters',
+    'about-us__foundedOn': 'founded',
+    'about-us__specialties': 'specialties',
+}
+
+# data-test-id olmayan sayfalar icin dt etiketi -> alan
+DETAIL_LABELS = {
+    'web sitesi': 'website',
+    'website': 'website',
+    'sektör': 'industry',
+    'industry': 'industry',
+    'şirket büyüklüğü': 'companySize',
+    'company size': 'companySize',
+    'genel merkez': 'headquarters',
+    'headquarters': 'headquarters',
+    'kuruluş': 'founded',
+    'founded': 'founded',
+    'uzmanlık alanları': 'specialties',
+    'specialties': 'specialties',
+}
+
+LINKEDIN_TITLE_SUFFIX = re.compile(r'\s*\|\s*LinkedIn\s*$', re.IGNORECASE)
+# "Firma | LinkedIn'de 1.059 takipci Tagline | Hakkinda" (apostrof ‘ veya ' olabilir)
+OG_DESCRIPTION_PREFIX = re.compile(
+    r"^.*?LinkedIn\S*\s+([\d.,]+[KMB]?)\s+(?:takipçi|takipci|followers?)\s*", re.IGNORECASE
+)
+
+
+def empty_linkedin_info():
+    """Bos cikti semasi"""
+    return {field: None for field in LINKEDIN_FIELDS}
+
+
+def collapse_whitespace(text):
+    """Birden fazla boslugu teke indirir"""
+    return ' '.join(text.split())
+
+
+def clean_company_name(name):
+    """og:title / <title> degerinden ' | LinkedIn' son ekini kaldirir"""
+    if not name:
+        return ''
+    return LINKEDIN_TITLE_SUFFIX.sub('', html.unescape(name)).strip()
+
+
+def _text(element):
+    return ''.join(element.itertext())
+
+
+def _has_class(element, class_name):
+    return class_name in (element.get('class') or '')
+
+
+def _is_logged_in_about(element):
+    """Oturumlu sayfadaki Hakkinda paragrafi (about section'i icinde p.break-words)"""
+    if not _has_class(element, 'break-words'):
+        return False
+    return any(ancestor.tag == 'section' and _has_class(ancestor, 'about')
+               for ancestor in element.iterancestors())
+
+
+class PageNodes:
+    """Sayfadan toplanan ham dugum metinleri"""
+
+    __slots__ = ('title', 'meta', 'meta_names', 'ld_json', 'heading', 'tagline', 'industry',
+                 'description', 'details', 'parsed_chars', 'stopped_early')
+
+    def __init__(self):
+        self.title = None
+        # property -> content ve name -> content (ilk gorulen kazanir)
+        self.meta = {}
+        self.meta_names = {}
+        # ld+json script icerikleri (bos script icin None)
+        self.ld_json = []
+        self.heading = None
+        self.tagline = None
+        self.industry = None
+        self.description = None
+        # alan -> dd metni (ilk gorulen kazanir)
+        self.details = {}
+        self.parsed_chars = 0
+        self.stopped_early = False
+
+
+def collect_page(html_content, head_only=False, chunk_size=CHUNK_SIZE):
+    """Sayfayi artimli parse eder, gereken dugumler bulununca durur
+
+    Args:
+        head_only: True ise </head> ve top-card blogu kapandiginda durur
+            (Hakkinda bolumu okunmaz)
+    """
+    nodes = PageNodes()
+    parser = etree.HTMLPullParser(events=('end',))
+
+    head_closed = False
+    h4_seen = False
+    top_card = None
+    top_card_closed = False
+    about_closed = False
+
+    for offset in range(0, len(html_content), chunk_size):
+        parser.feed(html_content[offset:offset + chunk_size])
+        nodes.parsed_chars = min(offset + chunk_size, len(html_content))
+
+        for _, element in parser.read_events():
+            tag = element.tag
+            if not isinstance(tag, str):
+                # Yorum / islem talimati
+                continue
+
+            # Head-only modda Hakkinda bolumu okunmaz
+            test_id = None if head_only else element.get('data-test-id')
+
+            if tag == 'meta':
+                prop, name = element.get('property'), element.get('name')
+                if prop is not None:
+                    nodes.meta.setdefault(prop, element.get('content', ''))
+                if name is not None:
+                    nodes.meta_names.setdefault(name, element.get('content', ''))
+
+            elif tag == 'title':
+                if nodes.title is None:
+                    nodes.title = _text(element)
+
+            elif tag == 'script':
+                if element.get('type') == 'application/ld+json':
+                    nodes.ld_json.append(element.text)
+
+            elif tag == 'head':
+                head_closed = True
+
+            elif tag == 'h1':
+                if nodes.heading is None and any(_has_class(element, c) for c in TITLE_CLASSES):
+                    nodes.heading = _text(element)
+
+            elif tag == 'h2':
+                if top_card is None and _has_class(element, INDUSTRY_CLASS):
+                    nodes.industry = _text(element)
+                    top_card = element.getparent()
+
+            elif tag == 'h4':
+                if not h4_seen and _has_class(element, TAGLINE_CLASS):
+                    h4_seen = True
+                    span = next(element.iter('span'), None)
+                    if span is not None:
+                        nodes.tagline = _text(span)
+
+            elif tag == 'p':
+                if nodes.tagline is None and _has_class(element, LOGGED_IN_TAGLINE_CLASS):
+                    nodes.tagline = _text(element)
+                elif nodes.description is None and test_id == ABOUT_DESCRIPTION_ID:
+                    nodes.description = _text(element)
+                elif nodes.description is None and not head_only and _is_logged_in_about(element):
+                    nodes.description = _text(element)
+
+            elif tag == 'dd' and not head_only:
+                label = element.getprevious()
+                if label is not None and label.tag == 'dt':
+                    field = DETAIL_LABELS.get(collapse_whitespace(_text(label)).lower())
+                    if field is not None:
+                        nodes.details.setdefault(field, _text(element))
+
+            if test_id in ABOUT_DETAIL_IDS:
+                dd = next(element.iter('dd'), None)
+                if dd is not None:
+                    # data-test-id etiketten daha guvenilir; dt eslesmesinin uzerine yazar
+                    nodes.details[ABOUT_DETAIL_IDS[test_id]] = _text(dd)
+            elif test_id == ABOUT_SECTION_ID:
+                about_closed = True
+
+            if element is top_card:
+                top_card_closed = True
+
+        if head_closed and top_card_closed and (head_only or about_closed):
+            nodes.stopped_early = nodes.parsed_chars < len(html_content)
+            break
+
+    return nodes
+
+
+def _og_description_parts(og_description):
+    """og:description'dan (takipci, kalan metin) ayirir"""
+    text = html.unescape(og_description).strip()
+    match = OG_DESCRIPTION_PREFIX.match(text)
+    if not match:
+        return None, text
+    return match.group(1), text[match.end():]
+
+
+def build_linkedin_info(nodes):
+    """Toplanan dugumlerden ortak semadaki bilgi sozlugunu olusturur"""
+    info = empty_linkedin_info()
+
+    # Sirket adi - og:title, top-card basligi, <title>
+    for candidate in (nodes.meta.get('og:title'), nodes.heading, nodes.title):
+        name = clean_company_name(candidate)
+        if name:
+            info['companyName'] = name
+            break
+
+    # Logo URL - og:image meta tag'den
+    logo_url = nodes.meta.get('og:image', '').strip()
+    if logo_url and 'company-logo' in logo_url:
+        info['logoUrl'] = logo_url
+
+    # Tagline - top-card h4'unun ilk span'i (veya oturumlu sayfada tagline p'si)
+    if nodes.tagline is not None:
+        tagline = collapse_whitespace(nodes.tagline)
+        if len(tagline) > 5:
+            info['tagline'] = tagline
+
+    # Sektor - top-card h2'den, yoksa detaylardan
+    for candidate in (nodes.industry, nodes.details.get('industry')):
+        if candidate is not None:
+            industry = collapse_whitespace(candidate)
+            if 5 < len(industry) < 200:
+                info['industry'] = industry
+                break
+
+    # Hakkinda detaylari
+    website = nodes.details.get('website')
+    if website and website.split():
+        # dd icinde link metninden sonra gizli aciklama olabilir
+        info['website'] = website.split()[0]
+    for field in ('companySize', 'headquarters', 'founded', 'specialties'):
+        value = collapse_whitespace(nodes.details.get(field) or '')
+        if value:
+            info[field] = value
+
+    if nodes.description is not None and nodes.description.strip():
+        info['description'] = nodes.description.strip()
+
+    # JSON-LD - Organization adi/aciklamasi (eksikse)
+    for content in nodes.ld_json:
+        try:
+            data = json.loads(content) if content else None
+        except ValueError:
+            continue
+        if isinstance(data, dict) and data.get('@type') == 'Organization':
+            if not info['companyName'] and data.get('name'):
+                info['companyName'] = data['name']
+            if not info['description'] and data.get('description'):
+                info['description'] = data['description']
+
+    # Takipci sayisi ve aciklama yedegi - og:description'dan
+    og_description = nodes.meta.get('og:description') or nodes.meta_names.get('description')
+    if og_description:
+        followers, remainder = _og_description_parts(og_description)
+        info['followers'] = followers
+        if not info['description']:
+            # "Tagline | Hakkinda" ise tagline kismini at
+            if info['tagline'] and remainder.startswith(info['tagline']):
+                remainder = remainder[len(info['tagline']):].lstrip(' |')
+            if remainder:
+                info['description'] = remainder
+
+    return info
+
+
+def extract_linkedin_info(html_content, head_only=False):
+    """HTML iceriginden LinkedIn bilgilerini ortak semada cikarir
+
+    head_only=True ise sadece head ve top-card parse edilir; Hakkinda
+    bolumune dayanan alanlar (website, companySize, headquarters, founded,
+    specialties) bos kalir, aciklama og:description'dan gelir.
+    """
+    try:
+        return build_linkedin_info(collect_page(html_content, head_only=head_only))
+    except Exception as e:
+        print(f"  [!] Parse hatasi: {e}")
+        return empty_linkedin_info()
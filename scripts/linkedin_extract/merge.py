@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+LinkedIn bilgilerini company JSON verisine birlestirme kurallari.
+
+Kurallar company_merge uzerinden uygulanir; her script kendi kural
+setini kullanir. IF_EMPTY alanlar sadece bossa yazilir, force=True
+(--force) verilirse doluysa da uzerine yazilir; baska bir kural mevcut
+degeri degistirmez.
+
+FIELD_RULES (parse-linkedin-responses):
+- name, tagline, about, companySize, headquarters, contact.web: IF_EMPTY
+- logo: logo indirilebildiyse dosyanin yolu yazilir
+- eski linkedinInfo alani kaldirilir
+
+FETCH_FIELD_RULES (fetch-linkedin-info, -selenium, -remote):
+- name, tagline, about: IF_EMPTY
+
+LinkedIn sektoru (industry) sector listesine eklenmez: ham LinkedIn
+metinleri NACE etiketleriyle karisip filtrelemeyi bozuyordu; eslemesi
+map-industries.py ile ayrica yapilir.
+"""
+
+import json
+from pathlib import Path
+
+from company_merge import IF_EMPTY, REMOVE, REPLACE, apply_proposals
+from json_writer import write_json_if_changed
+
+# (company JSON alani, LinkedIn alani, kural)
+FIELD_RULES = (
+    ('name', 'companyName', IF_EMPTY),
+    ('tagline', 'tagline', IF_EMPTY),
+    ('about', 'description', IF_EMPTY),
+    ('companySize', 'companySize', IF_EMPTY),
+    ('headquarters', 'headquarters', IF_EMPTY),
+    ('contact.web', 'website', IF_EMPTY),
+)
+
+# fetch-linkedin-info script'leri sadece bu alanlari yazar
+FETCH_FIELD_RULES = (
+    ('name', 'companyName', IF_EMPTY),
+    ('tagline', 'tagline', IF_EMPTY),
+    ('about', 'description', IF_EMPTY),
+)
+
+
+def linkedin_proposals(linkedin_info, logo_path=None, rules=FIELD_RULES):
+    """LinkedIn bilgilerinden company_merge onerileri (alan, deger, kural) uretir
+
+    Args:
+        logo_path: Indirilen logonun 'img/company/...' yolu (varsa)
+        rules: (alan, LinkedIn alani, kural) kural seti
+    """
+    proposals = [
+        (field, linkedin_info.get(source), rule)
+        for field, source, rule in rules
+        if linkedin_info.get(source)
+    ]
+    if logo_path:
+        proposals.append(('logo', logo_path, REPLACE))
+    # Eski linkedinInfo alanini kaldir (artik gereksiz)
+    proposals.append(('linkedinInfo', None, REMOVE))
+    return proposals
+
+
+def merge_linkedin_info(data, linkedin_info, force=False, logo_fetcher=None, slug=None, rules=FIELD_RULES):
+    """LinkedIn bilgilerini company verisine (yerinde) birlestirir
+
+    Args:
+        logo_fetcher: (logo_url, slug) -> 'img/company/...' yolu veya None
+        slug: Logo dosya adi icin sirket slug'i
+        rules: Kural seti (varsayilan FIELD_RULES)
+
+    Returns:
+        list: (alan, yeni deger) degisiklik listesi; bos ise degisiklik yok
+    """
+    logo_path = None
+    if logo_fetcher is not None and linkedin_info.get('logoUrl'):
+        logo_path = logo_fetcher(linkedin_info['logoUrl'], slug)
+
+    return apply_proposals(data, linkedin_proposals(linkedin_info, logo_path, rules), force=force)
+
+
+def update_company_json_with_linkedin(json_path, linkedin_info, dry_run=False, force=False,
+                                      logo_fetcher=None, rules=FETCH_FIELD_RULES):
+    """Company JSON dosyasini LinkedIn bilgileriyle gunceller
+
+    dry_run=True ise degisiklikler hesaplanir ama dosya yazilmaz ve logo
+    indirilmez.
+
+    Returns:
+        list: (alan, yeni deger) degisiklik listesi
+    """
+    json_path = Path(json_path)
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    updates = merge_linkedin_info(
+        data, linkedin_info, force=force,
+        logo_fetcher=None if dry_run else logo_fetcher,
+        slug=json_path.stem,
+        rules=rules,
+    )
+
+    if updates and not dry_run:
+        write_json_if_changed(json_path, data)
+
+    return updates
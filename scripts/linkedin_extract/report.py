@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+fetch-linkedin-info* script'lerinin ortak konsol ciktilari.
+"""
+
+# (alan, etiket) - print_linkedin_info sirasi
+DISPLAY_FIELDS = (
+    ('companyName', 'Name'),
+    ('tagline', 'Tagline'),
+    ('description', 'About'),
+    ('industry', 'Industry'),
+    ('companySize', 'Company Size'),
+    ('headquarters', 'Headquarters'),
+    ('website', 'Website'),
+)
+
+
+def _shorten(value, limit=100):
+    value = str(value)
+    return value[:limit] + '...' if len(value) > limit else value
+
+
+def print_linkedin_info(linkedin_info):
+    """Çekilen LinkedIn bilgilerini yazdırır"""
+    print(f"\n✅ LinkedIn'den çekilen bilgiler:")
+    for field, label in DISPLAY_FIELDS:
+        value = linkedin_info.get(field)
+        if value:
+            print(f"  {label}: {_shorten(value)}")
+        elif field in ('companyName', 'tagline', 'description'):
+            print(f"  {label}: (bulunamadı)")
+
+
+def print_linkedin_updates(json_path, updates, dry_run=False):
+    """update_company_json_with_linkedin sonucunu yazdırır"""
+    if not updates:
+        print("  ℹ️  Güncellenecek yeni bilgi bulunamadı (zaten dolu veya LinkedIn'den bilgi alınamadı)")
+        return
+
+    print("\n📝 Güncellenecek alanlar:")
+    for field, value in updates:
+        if value is None:
+            print(f"  • {field} (kaldırıldı)")
+        else:
+            print(f"  • {field}: {_shorten(value)}")
+
+    if dry_run:
+        print(f"\n🔍 DRY RUN: Dosya güncellenmedi (--dry-run)")
+    else:
+        print(f"\n✅ Dosya güncellendi: {json_path}")
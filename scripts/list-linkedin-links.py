@@ -4,25 +4,29 @@ LinkedIn Link Lister
 Tüm şirket JSON dosyalarındaki LinkedIn linklerini listeler.
 """
 
-import json
 from pathlib import Path
 
+from company_corpus import load_companies
+
 def main():
     company_dir = Path("public/data/company")
 
-    # Tüm JSON dosyalarını oku
-    json_files = sorted(company_dir.glob("*.json"))
+    # Tüm JSON dosyalarını tek geçişte oku
+    corpus = load_companies(company_dir, verbose=False)
 
-    print(f"Toplam {len(json_files)} şirket dosyası bulundu.\n")
+    print(f"Toplam {corpus.file_count} şirket dosyası bulundu.\n")
     print("=" * 80)
 
     has_linkedin = []
     no_linkedin = []
 
-    for json_file in json_files:
+    for path, e in corpus.errors:
+        print(f"❌ Hata ({path.name}): {e}")
+
+    for record in corpus:
+        json_file = record.path
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = record.data
 
             company_name = data.get('name', json_file.stem)
             linkedin = data.get('social', {}).get('linkedin', '')
@@ -50,7 +54,7 @@ def main():
     # Özet
     print("\n" + "=" * 80)
     print(f"📊 ÖZET:")
-    print(f"   Toplam Şirket: {len(json_files)}")
+    print(f"   Toplam Şirket: {corpus.file_count}")
     print(f"   LinkedIn Var:  {len(has_linkedin)}")
     print(f"   LinkedIn Yok:  {len(no_linkedin)}")
     print("=" * 80)
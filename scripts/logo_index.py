@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+public/img/company klasörünün tek taramalık indeksi.
+
+Logo dosyaları tek bir os.scandir ile okunur; şirket başına exists()
+kontrolü yapılmaz. resolve() önce JSON'daki logo alanını, dosya yoksa
+slug ile başlayan dosyaları LOGO_EXTENSIONS sırasıyla dener.
+
+image_size() genişlik/yüksekliği sadece dosya başlığından okur (PNG, JPEG,
+WebP, GIF, ICO, SVG); Pillow gerekmez ve görsel decode edilmez. Okunan
+boyutlar (okunamayanlar dahil) .cache/logo-sizes.json'da tarama
+sırasındaki mtime ve boyutla saklanır; dosya değişmediği sürece sonraki
+çalışmalarda açılmaz. save() cache'i yazar.
+
+Kullanım:
+    from logo_index import LogoIndex
+
+    logos = LogoIndex()
+    logo = logos.resolve('innova', company_data.get('logo'))  # 'img/company/innova.png' veya None
+    width, height = logos.size(logo) or (None, None)
+
+    # Sitemap ve companies.json için: sadece boyutu okunabilen (geçerli) logolar
+    logo, size = logos.resolve_image('innova', company_data.get('logo'))
+    logos.save()
+"""
+
+import json
+import os
+import re
+import struct
+from pathlib import Path
+
+from company_corpus import CACHE_DIR
+from json_writer import WriteStats, write_bytes_if_changed
+
+ROOT_DIR = Path(__file__).parent.parent
+LOGO_DIR = ROOT_DIR / 'public' / 'img' / 'company'
+LOGO_SIZE_CACHE_FILE = CACHE_DIR / 'logo-sizes.json'
+
+# Boyut okuma veya cache biçimi değişirse artırılır
+SIZE_CACHE_VERSION = 1
+
+# JSON'daki yol öneki (public/ altına göre)
+LOGO_URL_PREFIX = 'img/company/'
+
+# Aynı slug için birden fazla dosya varsa tercih sırası
+LOGO_EXTENSIONS = ('.svg', '.png', '.jpg', '.jpeg', '.webp')
+
+# Boyut için okunan başlık uzunluğu: JPEG'de SOF işaretçisi gömülü ICC/EXIF
+# bloklarından, SVG'de <svg ...> etiketi XML bildirimi ve editör
+# yorumlarından sonra gelir
+HEADER_BYTES = 64 * 1024
+
+SVG_TAG_PATTERN = re.compile(rb'<svg\b[^>]*>', re.IGNORECASE | re.DOTALL)
+SVG_ATTR_PATTERN = re.compile(rb'\s(width|height|viewBox)\s*=\s*["\']([^"\']*)["\']', re.IGNORECASE)
+SVG_LENGTH_PATTERN = re.compile(rb'^\s*([0-9]*\.?[0-9]+)\s*(px)?\s*$')
+
+
+def _png_size(head):
+    if head[:8] == b'\x89PNG\r\n\x1a\n' and head[12:16] == b'IHDR':
+        return struct.unpack('>II', head[16:24])
+    return None
+
+
+def _jpeg_size(head):
+    if head[:2] != b'\xff\xd8':
+        return None
+    pos = 2
+    while pos + 9 <= len(head):
+        if head[pos] != 0xFF:
+            return None
+        marker = head[pos + 1]
+        if marker == 0xFF:
+            pos += 1
+            continue
+        length = struct.unpack('>H', head[pos + 2:pos + 4])[0]
+        # SOF0..SOF15 (DHT, JPG ve DAC hariç)
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack('>HH', head[pos + 5:pos + 9])
+            return width, height
+        pos += 2 + length
+    return None
+
+
+def _webp_size(head):
+    if head[:4] != b'RIFF' or head[8:12] != b'WEBP':
+        return None
+    chunk = head[12:16]
+    if chunk == b'VP8 ' and len(head) >= 30:
+        width, height = struct.unpack('<HH', head[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b'VP8L' and len(head) >= 25:
+        bits = int.from_bytes(head[21:25], 'little')
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b'VP8X' and len(head) >= 30:
+        return int.from_bytes(head[24:27], 'little') + 1, int.from_bytes(head[27:30], 'little') + 1
+    return None
+
+
+def _gif_size(head):
+    if head[:6] in (b'GIF87a', b'GIF89a'):
+        return struct.unpack('<HH', head[6:10])
+    return None
+
+
+def _ico_size(head):
+    """.png uzantılı favicon'lar: en büyük ikonun boyutu (0 = 256)"""
+    if head[:4] != b'\x00\x00\x01\x00':
+        return None
+    count = struct.unpack('<H', head[4:6])[0]
+    sizes = []
+    for i in range(count):
+        entry = head[6 + 16 * i:8 + 16 * i]
+        if len(entry) < 2:
+            break
+        sizes.append((entry[0] or 256, entry[1] or 256))
+    return max(sizes, default=None)
+
+
+def _svg_size(head):
+    """width/height (px veya birimsiz) ya da viewBox'tan boyut"""
+    tag = SVG_TAG_PATTERN.search(head)
+    if not tag:
+        return None
+    attrs = {name.lower(): value for name, value in SVG_ATTR_PATTERN.findall(tag.group(0))}
+
+    width = SVG_LENGTH_PATTERN.match(attrs.get(b'width', b''))
+    height = SVG_LENGTH_PATTERN.match(attrs.get(b'height', b''))
+    if width and height:
+        return round(float(width.group(1))), round(float(height.group(1)))
+
+    parts = re.split(rb'[\s,]+', attrs.get(b'viewbox', b'').strip())
+    if len(parts) == 4:
+        try:
+            return round(float(parts[2])), round(float(parts[3]))
+        except ValueError:
+            return None
+    return None
+
+
+_SIZE_READERS = {
+    '.png': _png_size,
+    '.jpg': _jpeg_size,
+    '.jpeg': _jpeg_size,
+    '.webp': _webp_size,
+    '.gif': _gif_size,
+    '.ico': _ico_size,
+    '.svg': _svg_size,
+}
+
+
+def image_size(path):
+    """Görselin (genişlik, yükseklik) değeri; okunamazsa None
+
+    Uzantı yanlış olabileceği için (ör. .png adlı ICO) önce uzantıya ait,
+    sonra diğer okuyucular denenir.
+    """
+    path = Path(path)
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(HEADER_BYTES)
+    except OSError:
+        return None
+
+    preferred = _SIZE_READERS.get(path.suffix.lower())
+    readers = [preferred] if preferred else []
+    readers += [reader for reader in (_png_size, _jpeg_size, _webp_size, _gif_size, _ico_size, _svg_size) if reader is not preferred]
+    for reader in readers:
+        size = reader(head)
+        if size and size[0] > 0 and size[1] > 0:
+            return size
+    return None
+
+
+class LogoIndex:
+    """Dosya adı ve slug -> logo dosyası tabloları"""
+
+    def __init__(self, logo_dir=LOGO_DIR, cache_path=LOGO_SIZE_CACHE_FILE):
+        self.logo_dir = Path(logo_dir)
+        self.files = set()
+        # slug -> {uzantı: dosya adı}
+        self.by_stem = {}
+        # dosya adı -> (mtime_ns, boyut) tarama sırasındaki stat
+        self.stats = {}
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._scan()
+        # dosya adı -> [mtime_ns, boyut, genişlik, yükseklik]; okunamayanlarda genişlik/yükseklik None
+        self.sizes = self._load_cache()
+        self.size_reads = 0
+
+    def _scan(self):
+        try:
+            entries = os.scandir(self.logo_dir)
+        except FileNotFoundError:
+            return
+        with entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                stem, ext = os.path.splitext(entry.name)
+                ext = ext.lower()
+                if ext not in LOGO_EXTENSIONS:
+                    continue
+                st = entry.stat()
+                self.files.add(entry.name)
+                self.stats[entry.name] = (st.st_mtime_ns, st.st_size)
+                self.by_stem.setdefault(stem, {})[ext] = entry.name
+
+    def _load_cache(self):
+        if self.cache_path is None:
+            return {}
+        try:
+            cached = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if cached.get('version') != SIZE_CACHE_VERSION or cached.get('dir') != str(self.logo_dir.resolve()):
+            return {}
+        return cached.get('files') or {}
+
+    def save(self):
+        """Boyut cache'ini yazar (sadece diskte olan dosyalar); değiştiyse True"""
+        if self.cache_path is None:
+            return False
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        content = {
+            'version': SIZE_CACHE_VERSION,
+            'dir': str(self.logo_dir.resolve()),
+            'files': {name: self.sizes[name] for name in sorted(self.sizes) if name in self.files},
+        }
+        return write_bytes_if_changed(
+            self.cache_path, json.dumps(content, separators=(',', ':')).encode('utf-8') + b'\n',
+            stats=WriteStats()
+        )
+
+    def __len__(self):
+        return len(self.files)
+
+    def find(self, slug):
+        """Slug için diskteki logo dosya adı (tercih sırasına göre), yoksa None"""
+        candidates = self.by_stem.get(slug)
+        if not candidates:
+            return None
+        for ext in LOGO_EXTENSIONS:
+            if ext in candidates:
+                return candidates[ext]
+        return None
+
+    def resolve(self, slug, logo=None):
+        """Logo alanı diskte varsa onu, yoksa slug'a ait dosyayı döner
+
+        Returns:
+            str: 'img/company/<dosya>' biçiminde yol veya None
+        """
+        if logo and isinstance(logo, str) and logo.startswith(LOGO_URL_PREFIX):
+            name = logo[len(LOGO_URL_PREFIX):]
+            if name in self.files:
+                return logo
+
+        name = self.find(slug)
+        return LOGO_URL_PREFIX + name if name else None
+
+    def file_size(self, name):
+        """Dosyanın (genişlik, yükseklik) değeri; mtime/boyut değişmediyse cache'ten"""
+        stat = self.stats.get(name)
+        if stat is None:
+            return None
+        cached = self.sizes.get(name)
+        if cached is not None and tuple(cached[:2]) == stat:
+            return tuple(cached[2:]) if cached[2] is not None else None
+
+        size = image_size(self.logo_dir / name)
+        self.size_reads += 1
+        self.sizes[name] = [*stat, *(size or (None, None))]
+        return size
+
+    def size(self, logo):
+        """resolve() ile bulunan logonun (genişlik, yükseklik) değeri, yoksa None"""
+        if not logo or not logo.startswith(LOGO_URL_PREFIX):
+            return None
+        return self.file_size(logo[len(LOGO_URL_PREFIX):])
+
+    def resolve_image(self, slug, logo=None):
+        """Geçerli görsel ise (yol, (genişlik, yükseklik)), değilse (None, None)
+
+        Önce JSON'daki logo, sonra slug'a ait dosyalar LOGO_EXTENSIONS
+        sırasıyla denenir; görsel olmayan dosyalar (HTML hata sayfası, boş
+        dosya) atlanır. Sitemap ve companies.json aynı kararı buradan alır.
+        """
+        names = []
+        if logo and isinstance(logo, str) and logo.startswith(LOGO_URL_PREFIX):
+            names.append(logo[len(LOGO_URL_PREFIX):])
+        candidates = self.by_stem.get(slug) or {}
+        names += [candidates[ext] for ext in LOGO_EXTENSIONS if ext in candidates]
+
+        for name in dict.fromkeys(names):
+            size = self.file_size(name)
+            if size is not None:
+                return LOGO_URL_PREFIX + name, size
+        return None, None
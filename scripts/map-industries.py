@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Şirket dosyalarındaki sektör metinlerini NACE kodlarına eşler.
+
+Şirketlerin sector listeleri ham LinkedIn sektör adlarını ("Appliances",
+"Yazılım Geliştirme") içerir. Bu script
+tüm şirketlerdeki farklı sektör metinlerini toplar, SektorKodlari
+açıklamalarına karşı tek seferde skorlar (bkz. industry_nace) ve
+metin -> NACE kodu tablosunu güven değerleriyle .cache/industry-nace.json
+dosyasına yazar. Tabloda olan metinler yeniden skorlanmaz.
+
+--check ile elle kontrol edilmiş beklenen eşleşmeler
+(industry_nace.EXPECTED_MAPPINGS) de skorlanır; uymayan varsa listelenir
+ve script 1 ile çıkar.
+
+Kullanım:
+    python scripts/map-industries.py
+    python scripts/map-industries.py --min-confidence 0.4
+    python scripts/map-industries.py --force
+    python scripts/map-industries.py --check
+"""
+
+import argparse
+import sys
+import time
+from collections import Counter
+
+from company_corpus import COMPANY_DATA_DIR, load_companies
+from industry_nace import (
+    EXPECTED_MAPPINGS,
+    INDUSTRY_TABLE_FILE,
+    MIN_CONFIDENCE,
+    SECTOR_CODES_FILE,
+    check_expectations,
+    map_industries,
+)
+
+# Output encoding fix for Windows
+if sys.platform == 'win32':
+    sys.stdout.reconfigure(encoding='utf-8')
+
+
+def collect_industries(corpus):
+    """Şirketlerdeki sektör metinleri -> kullanan şirket sayısı"""
+    counts = Counter()
+    for record in corpus:
+        sectors = record.data.get('sector')
+        if isinstance(sectors, str):
+            sectors = [sectors]
+        if not isinstance(sectors, list):
+            continue
+        for sector in sectors:
+            if isinstance(sector, str) and sector.strip():
+                counts[sector.strip()] += 1
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Şirket sektör metinlerini NACE kodlarına eşle')
+    parser.add_argument('--data-dir', type=str, default=str(COMPANY_DATA_DIR),
+                        help='Şirket JSON klasörü (varsayılan: public/data/company)')
+    parser.add_argument('--sectors', type=str, default=str(SECTOR_CODES_FILE),
+                        help='Sektör kodları dosyası (varsayılan: public/data/SektorKodlari.json)')
+    parser.add_argument('--output', type=str, default=str(INDUSTRY_TABLE_FILE),
+                        help='Eşleme tablosu (varsayılan: .cache/industry-nace.json)')
+    parser.add_argument('--min-confidence', type=float, default=MIN_CONFIDENCE,
+                        help=f'Raporda düşük güven eşiği (varsayılan: {MIN_CONFIDENCE})')
+    parser.add_argument('--force', action='store_true',
+                        help='Tabloyu yok say, tüm metinleri yeniden skorla')
+    parser.add_argument('--check', action='store_true',
+                        help='Beklenen eşleşmeleri (EXPECTED_MAPPINGS) doğrula')
+    args = parser.parse_args()
+
+    corpus = load_companies(args.data_dir, verbose=False)
+    industries = collect_industries(corpus)
+    print(f"📂 {len(corpus)} şirket, {len(industries)} farklı sektör metni")
+
+    started = time.perf_counter()
+    texts = list(industries) + (list(EXPECTED_MAPPINGS) if args.check else [])
+    table, scored = map_industries(texts, args.sectors, args.output, force=args.force)
+    elapsed = time.perf_counter() - started
+
+    low = 0
+    print(f"\n{'şirket':>6} {'güven':>6}  {'kod':<9} sektör metni -> NACE açıklaması")
+    print('-' * 100)
+    for industry, count in industries.most_common():
+        match = table[industry]
+        marker = ' '
+        if match['confidence'] < args.min_confidence:
+            marker = '?'
+            low += 1
+        name = (match['name'] or '-')[:50]
+        print(f"{count:>6} {match['confidence']:>6.2f}{marker} {match['code'] or '-':<9} {industry} -> {name}")
+
+    print(f"\n✅ {scored} metin skorlandı ({elapsed:.2f} sn), {len(set(texts)) - scored} tablodan geldi")
+    print(f"   {low} eşleşme {args.min_confidence} güvenin altında (?)")
+    print(f"   Tablo: {args.output}")
+
+    if args.check:
+        failures = check_expectations(table, args.min_confidence)
+        if not failures:
+            print(f"\n✅ {len(EXPECTED_MAPPINGS)} beklenen eşleşmenin hepsi tuttu")
+            return
+        print(f"\n❌ {len(failures)}/{len(EXPECTED_MAPPINGS)} beklenen eşleşme tutmadı:")
+        for text, prefixes, match in failures:
+            expected = ', '.join(prefixes) if prefixes else 'eşik altı'
+            print(f"   {text}: beklenen {expected}, bulunan {match['code'] or '-'} ({match['confidence']:.2f})")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
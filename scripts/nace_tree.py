@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sektör kodlarından (NACE Rev.2, 6 haneli "46.73.12") hiyerarşik ağaç
+indeksi ve bölüm (division) başına parça dosyaları üretir.
+
+Hiyerarşi kodun kendisinden çıkarılır:
+
+    kısım (section)   G         bölüm aralığından (45-47)
+    bölüm (division)  46        ilk 2 hane
+    grup (group)      46.7      3 hane
+    sınıf (class)     46.73     4 hane
+    alt sınıf         46.73.12  kaynaktaki kod
+
+Her bölümün alt sınıfları sector-codes/division-NN.jsonl dosyasına satır
+başına bir {"code", "name"} olarak yazılır. tree.json her düğüm için
+kayıt sayısını, grup ve sınıflar için de bölüm dosyasındaki byte
+aralığını (offset, length) içerir; istemci tek bir bölümü (veya Range
+isteğiyle tek bir grubu) yükleyebilir.
+
+Arama için search-index.json yazılır (build_sector_search_index):
+
+- terms/postings: Türkçe katlanmış ve hafif kök bulunmuş açıklama
+  token'ları (sıralı) -> SektorKodlari.json'daki satır numaraları; satır
+  numaraları fark kodludur (ilk değer mutlak, sonrakiler bir öncekine göre)
+- codeTrie: noktasız kod haneleri üzerinde trie; her düğüm
+  [başlangıç, bitiş, {hane: alt düğüm}] olarak, koda göre sıralı listede
+  o öneki taşıyan satırların aralığını verir ("62.01" -> "6201" düğümü).
+  Tek satırlık yapraklar sadece satır numarasıdır.
+
+Kullanım:
+    from nace_tree import write_nace_tree
+
+    tree = write_nace_tree(sorted_sectors, 'public/data/sector-codes')
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+from json_writer import write_bytes_if_changed
+from turkish_text import stem_turkish, tokenize
+
+# (kısım, ilk bölüm, son bölüm, Türkçe başlık)
+NACE_SECTIONS = [
+    ('A', 1, 3, 'Tarım, ormancılık ve balıkçılık'),
+    ('B', 5, 9, 'Madencilik ve taş ocakçılığı'),
+    ('C', 10, 33, 'İmalat'),
+    ('D', 35, 35, 'Elektrik, gaz, buhar ve iklimlendirme üretimi ve dağıtımı'),
+    ('E', 36, 39, 'Su temini; kanalizasyon, atık yönetimi ve iyileştirme faaliyetleri'),
+    ('F', 41, 43, 'İnşaat'),
+    ('G', 45, 47, 'Toptan ve perakende ticaret; motorlu kara taşıtlarının ve motosikletlerin onarımı'),
+    ('H', 49, 53, 'Ulaştırma ve depolama'),
+    ('I', 55, 56, 'Konaklama ve yiyecek hizmeti faaliyetleri'),
+    ('J', 58, 63, 'Bilgi ve iletişim'),
+    ('K', 64, 66, 'Finans ve sigorta faaliyetleri'),
+    ('L', 68, 68, 'Gayrimenkul faaliyetleri'),
+    ('M', 69, 75, 'Mesleki, bilimsel ve teknik faaliyetler'),
+    ('N', 77, 82, 'İdari ve destek hizmet faaliyetleri'),
+    ('O', 84, 84, 'Kamu yönetimi ve savunma; zorunlu sosyal güvenlik'),
+    ('P', 85, 85, 'Eğitim'),
+    ('Q', 86, 88, 'İnsan sağlığı ve sosyal hizmet faaliyetleri'),
+    ('R', 90, 93, 'Kültür, sanat, eğlence, dinlence ve spor'),
+    ('S', 94, 96, 'Diğer hizmet faaliyetleri'),
+    ('T', 97, 98, 'Hanehalklarının işveren olarak faaliyetleri; hanehalkları tarafından kendi '
+                  'kullanımlarına yönelik olarak ayrım yapılmamış mal ve hizmet üretim faaliyetleri'),
+    ('U', 99, 99, 'Ulusötesi örgüt ve temsilciliklerinin faaliyetleri'),
+]
+
+UNKNOWN_SECTION = ('?', 'Sınıflandırılmamış')
+
+
+def section_for_division(division):
+    """Bölüm kodunun ('46') kısmı: (harf, başlık)"""
+    try:
+        number = int(division)
+    except ValueError:
+        return UNKNOWN_SECTION
+    for letter, first, last, title in NACE_SECTIONS:
+        if first <= number <= last:
+            return letter, title
+    return UNKNOWN_SECTION
+
+
+def code_levels(code):
+    """'46.73.12' -> ('46', '46.7', '46.73')"""
+    digits = code.replace('.', '')
+    return digits[:2], f'{digits[:2]}.{digits[2:3]}', f'{digits[:2]}.{digits[2:4]}'
+
+
+def division_file_name(division):
+    return f'division-{division}.jsonl'
+
+
+def write_nace_tree(sectors, out_dir):
+    """Koda göre sıralı sektörlerden ağacı ve bölüm dosyalarını tek geçişte yazar
+
+    Args:
+        sectors: Koda göre sıralı {"code", "name"} listesi/iterable'ı
+        out_dir: tree.json ve division-NN.jsonl dosyalarının klasörü
+
+    Returns:
+        dict: tree.json içeriği
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    sections = []
+    division_files = set()
+    total = 0
+
+    # Açık düğümler: sıralı girdide bir seviye değiştiğinde alttakiler kapanır
+    section = division = group = klass = None
+    lines = []
+    offset = 0
+
+    def close_division():
+        if division is None:
+            return
+        content = ''.join(lines).encode('utf-8')
+        write_bytes_if_changed(out_dir / division['file'], content)
+        division['bytes'] = len(content)
+        division['sha1'] = hashlib.sha1(content).hexdigest()
+        division_files.add(division['file'])
+
+    for sector in sectors:
+        code = sector['code']
+        division_code, group_code, class_code = code_levels(code)
+
+        if division is None or division['code'] != division_code:
+            close_division()
+            letter, title = section_for_division(division_code)
+            if section is None or section['code'] != letter:
+                section = {'code': letter, 'name': title, 'count': 0, 'divisions': []}
+                sections.append(section)
+            division = {'code': division_code, 'count': 0, 'file': division_file_name(division_code), 'groups': []}
+            section['divisions'].append(division)
+            group = klass = None
+            lines = []
+            offset = 0
+
+        if group is None or group['code'] != group_code:
+            group = {'code': group_code, 'count': 0, 'offset': offset, 'length': 0, 'classes': []}
+            division['groups'].append(group)
+            klass = None
+
+        if klass is None or klass['code'] != class_code:
+            klass = {'code': class_code, 'count': 0, 'offset': offset, 'length': 0}
+            group['classes'].append(klass)
+
+        line = json.dumps({'code': code, 'name': sector['name']}, ensure_ascii=False) + '\n'
+        size = len(line.encode('utf-8'))
+        lines.append(line)
+        offset += size
+
+        for node in (section, division, group, klass):
+            node['count'] += 1
+        group['length'] += size
+        klass['length'] += size
+        total += 1
+
+    close_division()
+
+    # Artık kullanılmayan bölüm dosyalarını sil
+    for stale in out_dir.glob('division-*.jsonl'):
+        if stale.name not in division_files:
+            stale.unlink()
+
+    tree = {'total': total, 'sections': sections}
+    content = json.dumps(tree, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+    write_bytes_if_changed(out_dir / 'tree.json', content)
+    return tree
+
+
+def build_code_trie(codes):
+    """Koda göre sıralı kodlardan önek trie'si: [başlangıç, bitiş, {hane: düğüm}]
+
+    Liste sıralı olduğu için her önek ardışık bir aralığa karşılık gelir.
+    Yapraklarda (çocuksuz düğüm) sadece [başlangıç, bitiş], tek satırlık
+    yapraklarda sadece başlangıç tutulur.
+    """
+    root = [0, 0, {}]
+    for row, code in enumerate(codes):
+        node = root
+        node[1] = row + 1
+        for digit in code.replace('.', ''):
+            children = node[2]
+            if digit not in children:
+                children[digit] = [row, row + 1, {}]
+            node = children[digit]
+            node[1] = row + 1
+
+    def compact(node):
+        if not node[2]:
+            return node[0] if node[1] == node[0] + 1 else node[:2]
+        return [node[0], node[1], {digit: compact(child) for digit, child in node[2].items()}]
+
+    return compact(root)
+
+
+def delta_encode(rows):
+    """Artan satır numaraları -> [ilk, fark, fark, ...]"""
+    return [row - previous for previous, row in zip([0] + rows, rows)]
+
+
+def build_sector_search_index(sectors):
+    """Açıklama token'ları -> satır numaraları ve kod trie'si
+
+    Args:
+        sectors: Koda göre sıralı {"code", "name"} listesi (SektorKodlari.json sırası)
+    """
+    postings = {}
+    for row, sector in enumerate(sectors):
+        for term in {stem_turkish(token) for token in tokenize(sector['name'])}:
+            postings.setdefault(term, []).append(row)
+
+    terms = sorted(postings)
+    return {
+        'count': len(sectors),
+        'terms': terms,
+        'postings': [delta_encode(postings[term]) for term in terms],
+        'codeTrie': build_code_trie(sector['code'] for sector in sectors),
+    }
+
+
+def write_sector_search_index(sectors, out_dir):
+    """search-index.json'u yazar, indeksi döner"""
+    index = build_sector_search_index(sectors)
+    content = json.dumps(index, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+    write_bytes_if_changed(Path(out_dir) / 'search-index.json', content)
+    return index
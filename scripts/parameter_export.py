@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parametre dışa aktarımlarını (SektorKodlari.txt, VergiDaireleri.txt ve
+birden fazla parametre ailesi içeren büyük upstream dosyaları) akışla
+okuyan ayrıştırıcı.
+
+Dosyanın tamamı belleğe alınmaz ve tam nesne ağacı kurulmaz: metin
+parçalar (chunk) halinde okunur, "parameterItems" dizileri bulunur ve her
+öğe json.JSONDecoder.raw_decode ile tek tek çözülüp işlendikten sonra
+bırakılır. Çalışma belleği dosya boyutundan bağımsızdır (bir parça + bir
+öğe).
+
+Beklenen yapı (her aile için):
+
+    {"data": {"name": "SECTOR_CODES", ..., "parameterItems": [
+        {"i18N": {"i18NContentList": [{"language": "tr", "i18NText": "..."}]},
+         "sortOrder": 1, "prmName": "46.73.12"}, ...]}}
+
+Aile adı, dizinin önündeki son "name" alanından alınır.
+
+Kullanım:
+    from parameter_export import iter_parameter_items
+
+    for item in iter_parameter_items('public/data/SektorKodlari.txt'):
+        print(item.family, item.code, item.text)
+"""
+
+import json
+import re
+from collections import namedtuple
+from pathlib import Path
+
+# Okuma parçası (karakter)
+CHUNK_SIZE = 64 * 1024
+
+# Dizi aranırken korunan son kısım: parça sınırında bölünen anahtar ve
+# aile adı için yeterli
+SCAN_TAIL = 4096
+
+ITEMS_KEY_PATTERN = re.compile(r'"parameterItems"\s*:\s*\[')
+NAME_KEY_PATTERN = re.compile(r'"name"\s*:\s*("(?:[^"\\]|\\.)*")')
+SEPARATOR_PATTERN = re.compile(r'[\s,]*')
+
+ParameterItem = namedtuple('ParameterItem', ['family', 'code', 'text', 'sort_order'])
+
+
+def item_text(item, language='tr'):
+    """Öğenin istenen dildeki metni, yoksa None"""
+    contents = (item.get('i18N') or {}).get('i18NContentList') or []
+    for content in contents:
+        if content.get('language') == language:
+            return content.get('i18NText')
+    return None
+
+
+def _last_name(text, start=0, end=None):
+    """Metin aralığındaki son "name" değeri, yoksa None"""
+    names = NAME_KEY_PATTERN.findall(text, start, len(text) if end is None else end)
+    return json.loads(names[-1]) if names else None
+
+
+def iter_raw_parameter_items(source, chunk_size=CHUNK_SIZE):
+    """(aile adı, ham öğe sözlüğü) çiftlerini dosyadaki sırayla üretir
+
+    Args:
+        source: Dosya yolu veya metin modunda açılmış dosya nesnesi
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, 'r', encoding='utf-8') as f:
+            yield from iter_raw_parameter_items(f, chunk_size)
+        return
+
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    eof = False
+    family = None
+    in_items = False
+
+    def read_more():
+        nonlocal buffer, pos, eof
+        chunk = source.read(chunk_size)
+        if not chunk:
+            eof = True
+        # İşlenen kısmı bırak
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+    while True:
+        if not in_items:
+            match = ITEMS_KEY_PATTERN.search(buffer, pos)
+            if match:
+                family = _last_name(buffer, pos, match.start()) or family
+                pos = match.end()
+                in_items = True
+                continue
+            if eof:
+                return
+            # Bölünmüş anahtar için son kısmı tut, atılan kısımdaki aile adını hatırla
+            keep_from = max(pos, len(buffer) - SCAN_TAIL)
+            family = _last_name(buffer, pos, keep_from) or family
+            pos = keep_from
+            read_more()
+            continue
+
+        pos = SEPARATOR_PATTERN.match(buffer, pos).end()
+        if pos >= len(buffer):
+            if eof:
+                raise ValueError('parameterItems dizisi kapanmadan dosya bitti')
+            read_more()
+            continue
+
+        if buffer[pos] == ']':
+            pos += 1
+            in_items = False
+            continue
+
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            read_more()
+            continue
+
+        # Nesne olmayan öğe (sayı vb.) parça sonunda kesilmiş olabilir
+        if end >= len(buffer) and not eof and not isinstance(item, (dict, list)):
+            read_more()
+            continue
+
+        pos = end
+        yield family, item
+
+
+def iter_parameter_items(source, families=None, language='tr', chunk_size=CHUNK_SIZE):
+    """ParameterItem(family, code, text, sort_order) öğelerini akışla üretir
+
+    Args:
+        source: Dosya yolu veya metin modunda açılmış dosya nesnesi
+        families: Sadece bu ailelerin öğeleri (ör. {'SECTOR_CODES'}); None ise hepsi
+        language: i18NContentList'ten seçilecek dil
+    """
+    for family, item in iter_raw_parameter_items(source, chunk_size):
+        if families is not None and family not in families:
+            continue
+        if not isinstance(item, dict):
+            continue
+        yield ParameterItem(
+            family=family,
+            code=item.get('prmName'),
+            text=item_text(item, language),
+            sort_order=item.get('sortOrder'),
+        )
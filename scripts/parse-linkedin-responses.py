@@ -9,11 +9,19 @@ import json
 import re
 import sys
 from pathlib import Path
-from bs4 import BeautifulSoup
 import argparse
 import requests
 from urllib.parse import urlparse
 import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from functools import partial
+
+from company_corpus import load_companies, normalize_linkedin_slug
+from company_merge import CompanyMerger
+from extraction_cache import ExtractionCache, content_hash
+from json_writer import write_stats
+from linkedin_extract import EXTRACTOR_VERSION, extract_linkedin_info, linkedin_proposals
 
 # Output encoding fix for Windows
 if sys.platform == 'win32':
@@ -24,249 +32,24 @@ LINKEDIN_RESPONSES_DIR = Path("linkedin-responses")
 COMPANY_DATA_DIR = Path("public/data/company")
 LOGO_DIR = Path("public/img/company")
 
-def extract_linkedin_info(html_content):
-    """HTML iceriginden LinkedIn bilgilerini cikarir"""
-    info = {
-        "companyName": None,
-        "tagline": None,
-        "description": None,
-        "website": None,
-        "industry": None,
-        "companySize": None,
-        "headquarters": None,
-        "specialties": None,
-        "followers": None,
-        "logoUrl": None
-    }
-
-    try:
-        soup = BeautifulSoup(html_content, 'html.parser')
-
-        # Sirket adi - meta tag'den
-        name_meta = soup.find('meta', {'property': 'og:title'})
-        if name_meta:
-            info['companyName'] = name_meta.get('content', '').strip()
-
-        # Logo URL - og:image meta tag'den
-        logo_meta = soup.find('meta', {'property': 'og:image'})
-        if logo_meta:
-            logo_url = logo_meta.get('content', '').strip()
-            if logo_url and 'company-logo' in logo_url:
-                info['logoUrl'] = logo_url
-
-        # Tagline - h4 tag'inden (top-card-layout__second-subline)
-        tagline_tag = soup.find('h4', {'class': re.compile(r'top-card-layout__second-subline')})
-        if tagline_tag:
-            tagline_span = tagline_tag.find('span')
-            if tagline_span:
-                tagline = tagline_span.get_text().strip()
-                # HTML entities'leri temizle
-                tagline = tagline.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
-                if tagline and len(tagline) > 5:
-                    info['tagline'] = tagline
-
-        # Takipci sayisi - meta description'dan
-        desc_meta = soup.find('meta', {'property': 'og:description'})
-        if desc_meta:
-            desc = desc_meta.get('content', '').strip()
-            # Takipci sayisini ayir
-            follower_match = re.search(r'(\d+(?:[.,]\d+)?[KMB]?)\s+takipci', desc, re.IGNORECASE)
-            if follower_match:
-                info['followers'] = follower_match.group(1)
-
-        # About/Hakkinda bolumu - JSON-LD'den veya text'ten
-        scripts = soup.find_all('script', {'type': 'application/ld+json'})
-        for script in scripts:
-            try:
-                data = json.loads(script.string)
-                if isinstance(data, dict):
-                    if 'description' in data:
-                        info['description'] = data['description']
-                    if 'name' in data and not info['companyName']:
-                        info['companyName'] = data['name']
-            except:
-                pass
-
-        # Diger bilgiler - text iceriginden
-        text = soup.get_text()
-
-        # Web sitesi
-        website_match = re.search(r'Web\s*sitesi[:\s]+([^\s]+)', text, re.IGNORECASE)
-        if website_match:
-            info['website'] = website_match.group(1).strip()
-
-        # Sektor/Industry - HTML yapisindan
-        # Oncelikle h2 tag'inden (top-card-layout__headline)
-        industry_tag = soup.find('h2', {'class': re.compile(r'top-card-layout__headline')})
-        if industry_tag:
-            industry_text = industry_tag.get_text().strip()
-            if industry_text and len(industry_text) > 5 and len(industry_text) < 200:
-                info['industry'] = industry_text
-
-        # Yoksa text'ten regex ile bul
-        if not info['industry']:
-            industry_match = re.search(r'Sektor[:\s]+([^\n]+)', text, re.IGNORECASE)
-            if not industry_match:
-                industry_match = re.search(r'Industry[:\s]+([^\n]+)', text, re.IGNORECASE)
-            if industry_match:
-                industry_text = industry_match.group(1).strip()
-                if industry_text and len(industry_text) > 5 and len(industry_text) < 200:
-                    info['industry'] = industry_text
-
-        # Sirket buyuklugu
-        size_match = re.search(r'Sirket buyuklugu[:\s]+([^\n]+)', text, re.IGNORECASE)
-        if not size_match:
-            size_match = re.search(r'Company size[:\s]+([^\n]+)', text, re.IGNORECASE)
-        if size_match:
-            info['companySize'] = size_match.group(1).strip()
-
-        # Genel merkez
-        hq_match = re.search(r'Genel merkez[:\s]+([^\n]+)', text, re.IGNORECASE)
-        if not hq_match:
-            hq_match = re.search(r'Headquarters[:\s]+([^\n]+)', text, re.IGNORECASE)
-        if hq_match:
-            info['headquarters'] = hq_match.group(1).strip()
-
-        # Uzmanliklar
-        spec_match = re.search(r'Uzmanliklar[:\s]+([^\n]+)', text, re.IGNORECASE)
-        if not spec_match:
-            spec_match = re.search(r'Specialties[:\s]+([^\n]+)', text, re.IGNORECASE)
-        if spec_match:
-            info['specialties'] = spec_match.group(1).strip()
-
-    except Exception as e:
-        print(f"  [!] Parse hatasi: {e}")
+def build_linkedin_index(data_dir=None):
+    """Company JSON dosyalarini bir kez okuyup LinkedIn slug -> dosya listesi indeksi olusturur
 
-    return info
+    Slug normalizasyonu (company_corpus.normalize_linkedin_slug) numerik ID'li
+    URL'leri, www/tr alt alan adlarini, sondaki '/' ve query string'leri tolere eder.
+    """
+    corpus = load_companies(data_dir or COMPANY_DATA_DIR, verbose=False)
+    return {
+        slug: [record.path for record in records]
+        for slug, records in corpus.linkedin_matches.items()
+    }
 
-def find_company_json_by_linkedin(linkedin_url):
-    """LinkedIn URL'sine gore company JSON dosyasini bulur"""
+def find_company_json_by_linkedin(linkedin_url, linkedin_index):
+    """LinkedIn URL'sine gore eslesen company JSON dosyalarini dondurur (sabit zamanli)"""
     if not linkedin_url:
-        return None
-
-    # LinkedIn URL'den slug cikar
-    linkedin_slug = linkedin_url.replace('https://linkedin.com/company/', '')
-    linkedin_slug = linkedin_slug.replace('https://www.linkedin.com/company/', '')
-    linkedin_slug = linkedin_slug.replace('/', '').replace('?', '').strip()
-
-    # Tum company JSON dosyalarini tara
-    for json_file in COMPANY_DATA_DIR.glob("*.json"):
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+        return []
 
-            company_linkedin = data.get('social', {}).get('linkedin', '')
-            if not company_linkedin:
-                continue
-
-            # LinkedIn URL'lerini karsilastir
-            company_slug = company_linkedin.replace('https://linkedin.com/company/', '')
-            company_slug = company_slug.replace('https://www.linkedin.com/company/', '')
-            company_slug = company_slug.replace('/', '').replace('?', '').strip()
-
-            if company_slug.lower() == linkedin_slug.lower():
-                return json_file
-
-        except Exception as e:
-            continue
-
-    return None
-
-def update_company_json(json_file, linkedin_info):
-    """Company JSON dosyasini LinkedIn bilgileriyle gunceller"""
-    try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        updated = False
-
-        # Name guncelle - "| LinkedIn" ifadesini kaldir
-        if linkedin_info['companyName']:
-            clean_name = linkedin_info['companyName'].replace(' | LinkedIn', '').strip()
-            current_name = data.get('name', '')
-            # Sadece bos ise veya LinkedIn'den gelen isim farkli ise guncelle
-            if not current_name or current_name == '':
-                data['name'] = clean_name
-                updated = True
-
-        # Tagline guncelle - LinkedIn'den gelen veri daha guncel ve kaliteli
-        if linkedin_info['tagline']:
-            current_tagline = data.get('tagline', '')
-            if linkedin_info['tagline'] != current_tagline:
-                data['tagline'] = linkedin_info['tagline']
-                updated = True
-
-        # About guncelle - LinkedIn'den gelen description uzunsa ve farkli ise guncelle
-        if linkedin_info['description']:
-            current_about = data.get('about', '')
-            # LinkedIn'den gelen description daha uzun veya mevcut about cok kisaysa guncelle
-            if (len(linkedin_info['description']) > len(current_about) or
-                len(current_about) < 50 or
-                linkedin_info['description'] != current_about):
-                data['about'] = linkedin_info['description']
-                updated = True
-
-        # Industry'yi sector dizisine ekle (sadece anlamli ise)
-        if linkedin_info['industry'] and len(linkedin_info['industry']) > 5 and len(linkedin_info['industry']) < 200:
-            if 'sector' not in data:
-                data['sector'] = []
-            # Eger sector bos veya yok ise ekle
-            if not data['sector'] or len(data['sector']) == 0:
-                data['sector'] = [linkedin_info['industry']]
-                updated = True
-            # Eger sector var ama bu industry yoksa ekle
-            elif linkedin_info['industry'] not in data['sector']:
-                data['sector'].append(linkedin_info['industry'])
-                updated = True
-
-        # Company size'i en disariya ekle
-        if linkedin_info['companySize'] and not data.get('companySize'):
-            data['companySize'] = linkedin_info['companySize']
-            updated = True
-
-        # Headquarters'i en disariya ekle
-        if linkedin_info['headquarters'] and not data.get('headquarters'):
-            data['headquarters'] = linkedin_info['headquarters']
-            updated = True
-
-        # Website'i contact'a ekle
-        if linkedin_info['website'] and not data.get('contact', {}).get('web'):
-            if 'contact' not in data:
-                data['contact'] = {}
-            if not data['contact'].get('web'):
-                data['contact']['web'] = linkedin_info['website']
-                updated = True
-
-        # Logo indir ve guncelle
-        if linkedin_info['logoUrl']:
-            # Slug'i al - dosya adini kullan
-            company_slug = Path(json_file).stem
-
-            # Logo'yu indir
-            logo_path = download_logo(linkedin_info['logoUrl'], company_slug)
-
-            # Basarili ise JSON'u guncelle
-            if logo_path:
-                current_logo = data.get('logo', '')
-                if current_logo != logo_path:
-                    data['logo'] = logo_path
-                    updated = True
-
-        # Eski linkedinInfo alanini kaldir (artik gereksiz)
-        if 'linkedinInfo' in data:
-            del data['linkedinInfo']
-            updated = True
-
-        if updated:
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            return True
-
-        return False
-
-    except Exception as e:
-        print(f"  [X] JSON guncelleme hatasi: {e}")
-        return False
+    return linkedin_index.get(normalize_linkedin_slug(linkedin_url), [])
 
 def download_logo(logo_url, company_slug, max_retries=3):
     """LinkedIn'den logo indirir ve yerel dosyaya kaydeder
@@ -336,8 +119,169 @@ def download_logo(logo_url, company_slug, max_retries=3):
     print(f"  [X] Logo indirilemedi: {company_slug}")
     return None
 
-def process_linkedin_responses(limit=None, dry_run=False):
-    """LinkedIn response dosyalarini isler"""
+# Response dosyasi siniflari
+RESPONSE_CLASSES = ('html', 'redirect', 'authwall', 'error')
+
+HEADER_LINE_PATTERN = re.compile(r'^(URL|Tarih|Status):\s*(.*)$')
+AUTHWALL_LOCATION_PATTERN = re.compile(r'/(?:uas/login|authwall|login|checkpoint)', re.IGNORECASE)
+
+def classify_response(status, headers):
+    """Status satiri ve header'lara gore response sinifini belirler (body okunmaz)
+
+    Returns:
+        str: 'html', 'redirect', 'authwall' veya 'error'
+    """
+    if status is None:
+        return 'error'
+
+    # LinkedIn bot korumasi 999 ile authwall sayfasi dondurur
+    if status == 999:
+        return 'authwall'
+
+    if 300 <= status < 400:
+        location = headers.get('location', '') if isinstance(headers, dict) else ''
+        if AUTHWALL_LOCATION_PATTERN.search(location):
+            return 'authwall'
+        return 'redirect'
+
+    if 200 <= status < 300:
+        return 'html'
+
+    return 'error'
+
+def read_response_header(f):
+    """Response dosyasinin sadece header blogunu (URL, Tarih, Status, HEADERS) okur
+
+    Dosya imleci '=== BODY ===' satirinin hemen arkasinda birakilir.
+    """
+    header = {'url': None, 'date': None, 'status': None, 'headers': {}}
+    header_lines = None
+
+    for line in f:
+        stripped = line.strip()
+
+        if stripped == '=== BODY ===':
+            break
+
+        if stripped == '=== HEADERS ===':
+            header_lines = []
+            continue
+
+        if header_lines is not None:
+            header_lines.append(line)
+            continue
+
+        match = HEADER_LINE_PATTERN.match(stripped)
+        if match:
+            key, value = match.group(1), match.group(2).strip()
+            if key == 'URL':
+                header['url'] = value
+            elif key == 'Tarih':
+                header['date'] = value
+            elif key == 'Status':
+                header['status'] = int(value) if value.isdigit() else None
+
+    if header_lines:
+        try:
+            header['headers'] = json.loads(''.join(header_lines))
+        except ValueError:
+            header['headers'] = {}
+
+    header['class'] = classify_response(header['status'], header['headers'])
+    return header
+
+# Worker process basina tek salt okunur cache baglantisi
+_cache_reader = None
+
+def get_cache_reader():
+    """Bu process icin salt okunur extraction cache baglantisini dondurur"""
+    global _cache_reader
+    if _cache_reader is None:
+        _cache_reader = ExtractionCache(EXTRACTOR_VERSION, read_only=True)
+    return _cache_reader
+
+def read_linkedin_response(response_file, use_cache=False, head_only=False):
+    """Response dosyasini okuyup parse eder
+
+    Once sadece header blogu okunur; redirect/authwall/hata yanitlarinin body'si
+    hic okunmaz. use_cache=True ise ayni icerik daha once parse edildiyse sonuc
+    cache'ten alinir ve HTML hic parse edilmez. Paralel modda worker
+    process'lerde calisir; dosyaya ve cache'e yazmaz, sadece sonucu dondurur.
+    head_only=True ise sadece head ve top-card parse edilir (cache kullanilmaz).
+
+    Returns:
+        tuple: (header, linkedin_info, hata_mesaji, cache_key, cache_hit) -
+               HTML olmayan yanitlarda linkedin_info None'dir
+    """
+    try:
+        with open(response_file, 'r', encoding='utf-8') as f:
+            header = read_response_header(f)
+
+            if not header['url']:
+                return header, None, "  [!] URL bulunamadi", None, False
+
+            # HTML olmayan yanitlari body'ye dokunmadan atla
+            if header['class'] != 'html':
+                return header, None, None, None, False
+
+            html_content = f.read().lstrip()
+
+        if not html_content:
+            return header, None, "  [!] HTML icerigi bulunamadi", None, False
+
+        cache_key = None
+        if use_cache:
+            cache_key = content_hash(header['url'], html_content)
+            cached_info = get_cache_reader().get(cache_key)
+            if cached_info is not None:
+                return header, cached_info, None, cache_key, True
+
+        # LinkedIn bilgilerini parse et
+        return header, extract_linkedin_info(html_content, head_only=head_only), None, cache_key, False
+
+    except Exception as e:
+        return None, None, f"  [X] Hata: {e}\n", None, False
+
+def print_response_class_report(class_counts, total):
+    """Response siniflarinin dagilimini yazdirir"""
+    print("[*] Yanit siniflari:")
+    for response_class in RESPONSE_CLASSES:
+        count = class_counts.get(response_class, 0)
+        percentage = (count / total * 100) if total else 0
+        print(f"     {response_class:10} {count:5}  ({percentage:5.1f}%)")
+
+def report_response_classes(response_files):
+    """Sadece header bloklarini okuyarak response siniflarini raporlar"""
+    class_counts = {}
+    for response_file in response_files:
+        try:
+            with open(response_file, 'r', encoding='utf-8') as f:
+                response_class = read_response_header(f)['class']
+        except Exception as e:
+            print(f"  [X] Hata ({response_file.name}): {e}")
+            response_class = 'error'
+        class_counts[response_class] = class_counts.get(response_class, 0) + 1
+
+    print_response_class_report(class_counts, len(response_files))
+
+def process_linkedin_responses(limit=None, dry_run=False, workers=1, classify_only=False,
+                               use_cache=True, head_only=False):
+    """LinkedIn response dosyalarini isler
+
+    Guncellemeler once bellekte toplanir (company_merge.CompanyMerger) ve
+    calismanin sonunda her sirket dosyasi bir kez yazilir; ayni sirkete
+    eslesen birden fazla yanit da tek yazmaya indirgenir.
+
+    Args:
+        use_cache: extract_linkedin_info sonuclarini icerik hash'i + EXTRACTOR_VERSION
+            ile cache'le; degismeyen dosyalar yeniden parse edilmez
+        workers: 1'den buyukse parse islemi bu kadar process'e dagitilir.
+            Sonuclar girdi sirasiyla gelir; JSON yazma islemleri sadece ana
+            process'te yapilir.
+        head_only: Sadece head ve top-card'i parse et; Hakkinda bolumune dayanan
+            alanlar (website, companySize, headquarters, founded, specialties) bos kalir.
+            Parse zaten cok hizli oldugu icin cache kullanilmaz.
+    """
 
     if not LINKEDIN_RESPONSES_DIR.exists():
         print(f"[X] {LINKEDIN_RESPONSES_DIR} klasoru bulunamadi!")
@@ -354,72 +298,121 @@ def process_linkedin_responses(limit=None, dry_run=False):
 
     print(f"[*] Toplam {len(response_files)} LinkedIn response dosyasi bulundu\n")
 
+    if classify_only:
+        report_response_classes(response_files)
+        return
+
     if dry_run:
         print("[!] DRY RUN MODE - Hicbir degisiklik yapilmayacak\n")
 
+    if workers > 1:
+        print(f"[*] Paralel mod: {workers} worker process\n")
+
+    if head_only:
+        use_cache = False
+        print("[*] Head-only mod: sadece head ve top-card parse edilecek\n")
+
+    # LinkedIn slug indeksini bir kez olustur
+    linkedin_index = build_linkedin_index()
+    ambiguous_slugs = {slug: files for slug, files in linkedin_index.items() if len(files) > 1}
+    if ambiguous_slugs:
+        print(f"[!] {len(ambiguous_slugs)} LinkedIn slug'i birden fazla sirket dosyasina eslesiyor:")
+        for slug, files in sorted(ambiguous_slugs.items()):
+            print(f"    - {slug}: {', '.join(f.name for f in files)}")
+        print()
+
     processed = 0
     updated = 0
     not_found = 0
+    ambiguous = 0
+    skipped = 0
     errors = 0
+    class_counts = {}
+    cache_hits = 0
+    cache_misses = 0
+    merger = CompanyMerger()
+
+    with ExitStack() as stack:
+        cache = None
+        if use_cache:
+            cache = stack.enter_context(ExtractionCache(EXTRACTOR_VERSION))
+
+        read_response = partial(read_linkedin_response, use_cache=use_cache, head_only=head_only)
+        if workers > 1:
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            # map sonuclari girdi sirasiyla, hazir oldukca akitir
+            results = executor.map(read_response, response_files, chunksize=4)
+        else:
+            results = map(read_response, response_files)
+
+        for i, (response_file, result) in enumerate(zip(response_files, results), 1):
+            print(f"[{i}/{len(response_files)}] Isleniyor: {response_file.name}")
+
+            header, linkedin_info, error, cache_key, cache_hit = result
+            if cache_key:
+                if cache_hit:
+                    cache_hits += 1
+                else:
+                    cache_misses += 1
+                    cache.put(cache_key, linkedin_info)
 
-    for i, response_file in enumerate(response_files, 1):
-        print(f"[{i}/{len(response_files)}] Isleniyor: {response_file.name}")
-
-        try:
-            # Response dosyasini oku
-            with open(response_file, 'r', encoding='utf-8') as f:
-                content = f.read()
+            if header:
+                class_counts[header['class']] = class_counts.get(header['class'], 0) + 1
 
-            # URL'yi cikar
-            url_match = re.search(r'^URL:\s*(.+)$', content, re.MULTILINE)
-            if not url_match:
-                print("  [!] URL bulunamadi")
+            if error:
+                print(error)
                 errors += 1
                 continue
 
-            linkedin_url = url_match.group(1).strip()
-
-            # HTML icerigini cikar
-            body_match = re.search(r'=== BODY ===\s*(.+)', content, re.DOTALL)
-            if not body_match:
-                print("  [!] HTML icerigi bulunamadi")
-                errors += 1
+            linkedin_url = header['url']
+            if header['class'] != 'html':
+                print(f"  [-] Atlandi: {header['class']} (Status {header['status']})")
+                skipped += 1
                 continue
 
-            html_content = body_match.group(1)
+            try:
+                if linkedin_info['companyName']:
+                    print(f"  [+] Sirket: {linkedin_info['companyName']}")
 
-            # LinkedIn bilgilerini parse et
-            linkedin_info = extract_linkedin_info(html_content)
+                # Ilgili company JSON dosyasini bul
+                json_files = find_company_json_by_linkedin(linkedin_url, linkedin_index)
 
-            if linkedin_info['companyName']:
-                print(f"  [+] Sirket: {linkedin_info['companyName']}")
+                if not json_files:
+                    print(f"  [!] JSON dosyasi bulunamadi: {linkedin_url}")
+                    not_found += 1
+                    continue
 
-            # Ilgili company JSON dosyasini bul
-            json_file = find_company_json_by_linkedin(linkedin_url)
+                json_file = json_files[0]
+                if len(json_files) > 1:
+                    ambiguous += 1
+                    others = ', '.join(f.name for f in json_files[1:])
+                    print(f"  [!] Belirsiz eslesme, ilk dosya kullaniliyor (digerleri: {others})")
 
-            if not json_file:
-                print(f"  [!] JSON dosyasi bulunamadi: {linkedin_url}")
-                not_found += 1
-                continue
+                print(f"  [OK] JSON bulundu: {json_file.name}")
 
-            print(f"  [OK] JSON bulundu: {json_file.name}")
+                # Guncellemeleri topla; dosyalar en sonda bir kez yazilir
+                logo_path = None
+                if not dry_run and linkedin_info.get('logoUrl'):
+                    logo_path = download_logo(linkedin_info['logoUrl'], json_file.stem)
+                merger.propose(json_file, linkedin_proposals(linkedin_info, logo_path))
 
-            # JSON dosyasini guncelle
-            if not dry_run:
-                if update_company_json(json_file, linkedin_info):
-                    print(f"  [OK] Guncellendi!")
-                    updated += 1
-                else:
-                    print(f"  [-] Guncellenecek veri yok")
-            else:
-                print(f"  [DRY RUN] Guncelleme atlandi")
+                processed += 1
+                print()
 
-            processed += 1
-            print()
+            except Exception as e:
+                print(f"  [X] Hata: {e}\n")
+                errors += 1
 
-        except Exception as e:
-            print(f"  [X] Hata: {e}\n")
-            errors += 1
+    # Toplanan guncellemeleri uygula (sirket basina tek yazma)
+    print(f"[*] {len(merger)} sirket dosyasi birlestiriliyor...")
+    results = merger.commit(dry_run=dry_run)
+    for json_file, e in merger.errors.items():
+        print(f"  [X] JSON guncelleme hatasi ({json_file.name}): {e}")
+        errors += 1
+    for json_file, updates in sorted(results.items()):
+        fields = ', '.join(field for field, _ in updates)
+        print(f"  [{'DRY RUN' if dry_run else 'OK'}] {json_file.name}: {fields}")
+    updated = len(results)
 
     # Ozet
     print("\n" + "="*60)
@@ -428,8 +421,16 @@ def process_linkedin_responses(limit=None, dry_run=False):
     print(f"[OK] Islenen:        {processed}")
     print(f"[OK] Guncellenen:    {updated}")
     print(f"[!]  Bulunamayan:    {not_found}")
+    print(f"[!]  Belirsiz:       {ambiguous}")
+    print(f"[-]  Atlanan:        {skipped}")
     print(f"[X]  Hata:           {errors}")
     print(f"[*]  Toplam:         {len(response_files)}")
+    if use_cache:
+        print(f"[*]  Cache:          {cache_hits} isabet, {cache_misses} yeni parse")
+    if not dry_run:
+        print(f"[*]  JSON yazma:     {write_stats.summary()}")
+    print("="*60)
+    print_response_class_report(class_counts, len(response_files))
     print("="*60)
 
 def main():
@@ -446,15 +447,43 @@ def main():
         action='store_true',
         help='Degisiklik yapmadan test et'
     )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='HTML parse icin paralel process sayisi (0 = CPU sayisi, varsayilan: 1)'
+    )
+
+    parser.add_argument(
+        '--classify-only',
+        action='store_true',
+        help='Sadece header bloklarini okuyup yanit siniflarini raporla (html/redirect/authwall/error)'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Extraction cache kullanma, tum HTML dosyalarini yeniden parse et'
+    )
+
+    parser.add_argument(
+        '--head-only',
+        action='store_true',
+        help='Sadece head ve top-card parse et (Hakkinda alanlari: website, sirket buyuklugu, merkez, kurulus, uzmanliklar atlanir)'
+    )
 
     args = parser.parse_args()
 
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+
     print("="*60)
     print("LinkedIn Response Parser")
     print("="*60)
     print()
 
-    process_linkedin_responses(limit=args.limit, dry_run=args.dry_run)
+    process_linkedin_responses(limit=args.limit, dry_run=args.dry_run, workers=workers,
+                               classify_only=args.classify_only, use_cache=not args.no_cache,
+                               head_only=args.head_only)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Uzun süren zenginleştirme çalışmaları için write-ahead iş günlüğü.
+
+Her şirket için işe başlamadan önce 'started' kaydı yazılır ve hemen
+commit edilir; iş bitince sonuç (outcome), zaman damgası ve sonuç dosyasının
+hash'i kaydedilir. Çalışma yarıda kesilirse --resume ile tamamlanan şirketler
+atlanır, 'started'da kalanlar yeniden işlenir. --resume olmadan başlayan
+yeni bir çalışma önce stage'in kayıtlarını siler (reset); aksi halde önceki
+çalışmalardan kalan 'done' kayıtları sonraki bir --resume'da hiç
+işlenmemiş öğeleri atlatır.
+
+Başarısız işler deneme sayısına göre üstel bekleme süresiyle (backoff)
+işaretlenir; bekleme dolmadan --resume bunları da atlar.
+
+Kullanım:
+    from run_journal import RunJournal
+
+    with RunJournal('fetch-linkedin-info') as journal:
+        if resume:
+            slugs, skipped = journal.filter_pending(slugs)
+        else:
+            journal.reset()
+        for slug in slugs:
+            journal.start(slug)
+            outcome = process(slug)
+            journal.finish(slug, outcome, failed=outcome == 'failed', result=json_path.read_bytes())
+"""
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+
+from company_corpus import CACHE_DIR
+
+RUN_JOURNAL_FILE = CACHE_DIR / 'run-journal.sqlite'
+
+# İlk başarısızlıktan sonra bekleme; her denemede ikiye katlanır
+RETRY_BASE_SECONDS = 10 * 60
+RETRY_MAX_SECONDS = 24 * 60 * 60
+
+STARTED = 'started'
+DONE = 'done'
+FAILED = 'failed'
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS journal (
+    stage TEXT NOT NULL,
+    item TEXT NOT NULL,
+    status TEXT NOT NULL,
+    outcome TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result_hash TEXT,
+    error TEXT,
+    updated_at REAL NOT NULL,
+    retry_at REAL,
+    PRIMARY KEY (stage, item)
+);
+'''
+
+
+def retry_delay(attempts, base=RETRY_BASE_SECONDS, maximum=RETRY_MAX_SECONDS):
+    """attempts. başarısızlıktan sonra beklenecek süre (saniye)"""
+    return min(base * 2 ** (attempts - 1), maximum)
+
+
+class RunJournal:
+    """(stage, item) -> son durum; her kayıt anında commit edilir"""
+
+    def __init__(self, stage, db_path=RUN_JOURNAL_FILE):
+        self.stage = stage
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+    def get(self, item):
+        """Kaydı sözlük olarak döner, yoksa None"""
+        row = self.conn.execute(
+            "SELECT status, outcome, attempts, result_hash, error, updated_at, retry_at "
+            "FROM journal WHERE stage = ? AND item = ?",
+            (self.stage, item)
+        ).fetchone()
+        if row is None:
+            return None
+        keys = ('status', 'outcome', 'attempts', 'result_hash', 'error', 'updated_at', 'retry_at')
+        return dict(zip(keys, row))
+
+    def skip_reason(self, item, now=None):
+        """--resume'da atlanacaksa nedeni ('done' veya 'backoff'), yoksa None"""
+        entry = self.get(item)
+        if entry is None:
+            return None
+        if entry['status'] == DONE:
+            return 'done'
+        if entry['status'] == FAILED and entry['retry_at'] and entry['retry_at'] > (now or time.time()):
+            return 'backoff'
+        # Yarıda kalmış ('started') veya bekleme süresi dolmuş
+        return None
+
+    def reset(self):
+        """Stage'in tüm kayıtlarını siler (--resume olmadan yeni çalışma)"""
+        self.conn.execute("DELETE FROM journal WHERE stage = ?", (self.stage,))
+        self.conn.commit()
+
+    def start(self, item):
+        """İşe başlamadan önce kaydı yazar (çökme durumunda 'started' kalır)"""
+        self.conn.execute(
+            "INSERT INTO journal (stage, item, status, updated_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (stage, item) DO UPDATE SET status = excluded.status, "
+            "updated_at = excluded.updated_at",
+            (self.stage, item, STARTED, time.time())
+        )
+        self.conn.commit()
+
+    def finish(self, item, outcome, failed=False, result=None, error=None):
+        """Sonucu kaydeder
+
+        Args:
+            outcome: Script'e özgü sonuç ('updated', 'exists', 'not_found', ...)
+            failed: True ise deneme sayısı artırılır ve tekrar zamanı hesaplanır
+            result: Sonuç içeriği (bytes); sha1 hash'i saklanır
+            error: Hata mesajı (varsa)
+        """
+        now = time.time()
+        entry = self.get(item)
+        attempts = entry['attempts'] if entry else 0
+        result_hash = hashlib.sha1(result).hexdigest() if result is not None else None
+
+        if failed:
+            attempts += 1
+            status, retry_at = FAILED, now + retry_delay(attempts)
+        else:
+            attempts, status, retry_at = 0, DONE, None
+
+        self.conn.execute(
+            "INSERT OR REPLACE INTO journal "
+            "(stage, item, status, outcome, attempts, result_hash, error, updated_at, retry_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (self.stage, item, status, outcome, attempts, result_hash, error, now, retry_at)
+        )
+        self.conn.commit()
+
+    def filter_pending(self, items, key=str, now=None):
+        """--resume için: (işlenecekler, {neden: atlanan sayısı}) döner
+
+        Args:
+            key: Öğeden günlük anahtarını üretir (ör. lambda path: path.stem)
+        """
+        now = now or time.time()
+        pending = []
+        skipped = {}
+        for item in items:
+            reason = self.skip_reason(key(item), now=now)
+            if reason:
+                skipped[reason] = skipped.get(reason, 0) + 1
+            else:
+                pending.append(item)
+        return pending, skipped
@@ -8,6 +8,15 @@ from pathlib import Path
 from urllib.parse import urljoin
 import time
 import warnings
+
+from company_merge import REPLACE, CompanyMerger
+from json_writer import write_stats
+from run_journal import RunJournal
+
+JOURNAL_STAGE = 'simple-logo-downloader'
+# Results worth retrying on --resume (network/site errors); the rest are final
+RETRY_RESULTS = {'not_found', 'download_failed', 'json_update_failed'}
+
 warnings.filterwarnings('ignore')
 
 class SimpleLogoDownloader:
@@ -21,6 +30,9 @@ class SimpleLogoDownloader:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) Firefox/121.0'
         }
 
+        # The logo field is written through CompanyMerger, one commit per company
+        self.merger = CompanyMerger()
+
     def find_logo(self, url):
         """Find and download logo from URL"""
         try:
@@ -69,20 +81,11 @@ class SimpleLogoDownloader:
             return None
 
     def update_json(self, slug, logo_path):
-        """Update JSON with logo path"""
-        try:
-            json_file = self.company_dir / f"{slug}.json"
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-
-            data['logo'] = logo_path
-
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-
-            return True
-        except:
-            return False
+        """Update JSON with logo path (committed before the journal records the result)"""
+        json_file = self.company_dir / f"{slug}.json"
+        self.merger.propose(json_file, [('logo', logo_path, REPLACE)])
+        self.merger.commit()
+        return json_file not in self.merger.errors
 
     def process_company(self, slug):
         """Process one company"""
@@ -119,8 +122,12 @@ class SimpleLogoDownloader:
 
         return 'success'
 
-    def process_all(self, slugs):
-        """Process list of company slugs"""
+    def process_all(self, slugs, journal=None):
+        """Process list of company slugs
+
+        If a RunJournal is given, each slug is recorded before and after
+        processing so an interrupted run can be resumed.
+        """
         results = {
             'success': 0,
             'exists': 0,
@@ -132,9 +139,17 @@ class SimpleLogoDownloader:
         }
 
         for i, slug in enumerate(slugs, 1):
+            if journal is not None:
+                journal.start(slug)
+
             result = self.process_company(slug)
             results[result] = results.get(result, 0) + 1
 
+            if journal is not None:
+                json_file = self.company_dir / f"{slug}.json"
+                journal.finish(slug, result, failed=result in RETRY_RESULTS,
+                               result=json_file.read_bytes() if json_file.exists() else None)
+
             if i % 10 == 0:
                 print(f"[{i}/{len(slugs)}] Success: {results['success']}, Exists: {results['exists']}, Failed: {results['not_found'] + results['download_failed']}")
 
@@ -148,21 +163,31 @@ if __name__ == '__main__':
     import argparse
     parser = argparse.ArgumentParser()
     parser.add_argument('--limit', type=int, default=None, help='Limit number of companies to process')
+    parser.add_argument('--resume', action='store_true',
+                        help='Skip companies finished in a previous run; retry failed ones after their backoff')
     args = parser.parse_args()
 
     downloader = SimpleLogoDownloader()
+    journal = RunJournal(JOURNAL_STAGE)
 
     # Read missing logos list
     missing_file = Path(__file__).parent.parent / 'missing-logos.txt'
     with open(missing_file, 'r', encoding='utf-8') as f:
         slugs = [line.strip() for line in f if line.strip()]
 
+    if args.resume:
+        slugs, resumed = journal.filter_pending(slugs)
+        print(f"Resuming: skipped {resumed.get('done', 0)} finished, {resumed.get('backoff', 0)} in backoff")
+    else:
+        # Fresh run: don't let 'done' rows from earlier runs leak into a later --resume
+        journal.reset()
+
     if args.limit:
         slugs = slugs[:args.limit]
 
     print(f"Processing {len(slugs)} companies...")
     try:
-        results = downloader.process_all(slugs)
+        results = downloader.process_all(slugs, journal=journal)
 
         print("\nFinal Results:")
         print(f"  Success: {results['success']}")
@@ -172,7 +197,10 @@ if __name__ == '__main__':
         print(f"  No website: {results['no_web']}")
         print(f"  No JSON: {results['no_json']}")
         print(f"  JSON update failed: {results['json_update_failed']}")
+        print(f"  JSON writes: {write_stats.written} written, {write_stats.unchanged} unchanged (skipped)")
     except Exception as e:
         print(f"ERROR: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        journal.close()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Akışla çalışan sitemap yazıcıları.
+
+URL'ler tek tek eklenir ve doğrudan (geçici) dosyaya yazılır; bellek
+kullanımı URL sayısından bağımsızdır. Dosyalar json_writer.AtomicFile ile
+yazıldığı için içerik değişmediyse diskteki dosyaya dokunulmaz.
+
+- SitemapFile: tek bir urlset dosyası (.xml veya gzip'li .xml.gz)
+- url_entry(): <url> bloğu; image verilirse Google image sitemap
+  uzantısıyla <image:image> eklenir
+- ShardedSitemapWriter: protokol sınırlarına (50.000 URL / 50 MB) göre
+  numaralı sitemap-N.xml.gz parçaları ve bunları listeleyen
+  sitemap-index.xml
+
+Kullanım:
+    from sitemap_writer import ShardedSitemapWriter
+
+    with ShardedSitemapWriter(out_dir, 'https://bufirmanasil.com.tr') as writer:
+        for loc, lastmod in urls:
+            writer.add(loc, lastmod, 'monthly', '0.6')
+    print(writer.shard_names)
+"""
+
+import gzip
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+from json_writer import AtomicFile, write_bytes_if_changed, write_stats
+
+# Sitemap protokolü sınırları (dosya başına, sıkıştırılmamış boyut)
+MAX_URLS_PER_SITEMAP = 50000
+MAX_BYTES_PER_SITEMAP = 50 * 1024 * 1024
+
+URLSET_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"\n'
+    '        xmlns:image="http://www.google.com/schemas/sitemap-image/1.1"\n'
+    '        xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"\n'
+    '        xsi:schemaLocation="http://www.sitemaps.org/schemas/sitemap/0.9\n'
+    '        http://www.sitemaps.org/schemas/sitemap/0.9/sitemap.xsd">\n'
+    '\n'
+).encode('utf-8')
+URLSET_FOOTER = b'</urlset>'
+
+
+def url_entry(loc, lastmod, changefreq, priority, comment=None, image=None):
+    """Tek bir <url> bloğu (ardından boş satır), isteğe bağlı yorum satırı ve
+    image:image (mutlak görsel URL'si) ile"""
+    lines = [f'  <!-- {comment} -->'] if comment else []
+    lines += [
+        '  <url>',
+        f'    <loc>{escape(loc)}</loc>',
+        f'    <lastmod>{lastmod}</lastmod>',
+        f'    <changefreq>{changefreq}</changefreq>',
+        f'    <priority>{priority}</priority>',
+    ]
+    if image:
+        lines += [
+            '    <image:image>',
+            f'      <image:loc>{escape(image)}</image:loc>',
+            '    </image:image>',
+        ]
+    lines += [
+        '  </url>',
+        '',
+        '',
+    ]
+    return '\n'.join(lines).encode('utf-8')
+
+
+class SitemapFile:
+    """Tek bir urlset dosyasını akışla yazar (.gz uzantılıysa gzip'ler)"""
+
+    def __init__(self, path, stats=write_stats):
+        self.path = Path(path)
+        self.url_count = 0
+        self.byte_count = 0
+        self.lastmod = None
+        self._target = AtomicFile(self.path, stats=stats)
+        if self.path.suffix == '.gz':
+            # mtime=0 ve boş dosya adı: aynı içerik her zaman aynı byte'lar
+            self._stream = gzip.GzipFile(filename='', mode='wb', fileobj=self._target, mtime=0)
+        else:
+            self._stream = self._target
+        self._write(URLSET_HEADER)
+
+    def _write(self, data):
+        self._stream.write(data)
+        self.byte_count += len(data)
+
+    def fits(self, entry, max_urls=MAX_URLS_PER_SITEMAP, max_bytes=MAX_BYTES_PER_SITEMAP):
+        """Girdi bu dosyaya sınırları aşmadan eklenebilir mi"""
+        return (self.url_count < max_urls
+                and self.byte_count + len(entry) + len(URLSET_FOOTER) <= max_bytes)
+
+    def add_entry(self, entry, lastmod):
+        """url_entry() ile üretilmiş bloğu yazar"""
+        self._write(entry)
+        self.url_count += 1
+        if self.lastmod is None or lastmod > self.lastmod:
+            self.lastmod = lastmod
+
+    def add(self, loc, lastmod, changefreq, priority, comment=None, image=None):
+        self.add_entry(url_entry(loc, lastmod, changefreq, priority, comment, image), lastmod)
+
+    def close(self):
+        """Dosyayı kapatır; içerik değiştiyse True döner"""
+        self._write(URLSET_FOOTER)
+        if self._stream is not self._target:
+            self._stream.close()
+        return self._target.close()
+
+    def discard(self):
+        if self._stream is not self._target:
+            self._stream.close()
+        self._target.discard()
+
+
+class ShardedSitemapWriter:
+    """sitemap-index.xml + numaralı sitemap-N.xml.gz parçaları
+
+    Parçalar dolduğunda kapatılıp yenisine geçilir; aynı anda sadece bir
+    parça açıktır. close() sitemap-index.xml'i yazar ve önceki çalışmadan
+    kalan fazla parçaları siler.
+    """
+
+    def __init__(self, out_dir, base_url, prefix='sitemap', max_urls=MAX_URLS_PER_SITEMAP,
+                 max_bytes=MAX_BYTES_PER_SITEMAP, stats=write_stats):
+        self.out_dir = Path(out_dir)
+        self.base_url = base_url.rstrip('/')
+        self.prefix = prefix
+        self.max_urls = max_urls
+        self.max_bytes = max_bytes
+        self.stats = stats
+        self.index_path = self.out_dir / f'{prefix}-index.xml'
+        # (parça adı, en yeni lastmod)
+        self.shards = []
+        self.changed_shards = 0
+        self.index_changed = False
+        self.url_count = 0
+        self._current = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is not None:
+            if self._current is not None:
+                self._current.discard()
+                self._current = None
+        else:
+            self.close()
+
+    @property
+    def shard_names(self):
+        return [name for name, _ in self.shards]
+
+    def shard_name(self, number):
+        return f'{self.prefix}-{number}.xml.gz'
+
+    def _close_current(self):
+        if self._current is not None:
+            self.shards.append((self._current.path.name, self._current.lastmod))
+            self.changed_shards += bool(self._current.close())
+            self._current = None
+
+    def add(self, loc, lastmod, changefreq, priority, comment=None, image=None):
+        entry = url_entry(loc, lastmod, changefreq, priority, comment, image)
+        if self._current is None or not self._current.fits(entry, self.max_urls, self.max_bytes):
+            self._close_current()
+            path = self.out_dir / self.shard_name(len(self.shards) + 1)
+            self._current = SitemapFile(path, stats=self.stats)
+        self._current.add_entry(entry, lastmod)
+        self.url_count += 1
+
+    def _remove_stale_shards(self):
+        number = len(self.shards) + 1
+        while True:
+            stale = self.out_dir / self.shard_name(number)
+            if not stale.exists():
+                break
+            stale.unlink()
+            number += 1
+
+    def close(self):
+        """Son parçayı ve indeks dosyasını yazar; indeks değiştiyse True döner"""
+        self._close_current()
+        self._remove_stale_shards()
+
+        lines = [
+            '<?xml version="1.0" encoding="UTF-8"?>',
+            '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">',
+        ]
+        for name, lastmod in self.shards:
+            lines += [
+                '  <sitemap>',
+                f'    <loc>{escape(f"{self.base_url}/{name}")}</loc>',
+                f'    <lastmod>{lastmod}</lastmod>',
+                '  </sitemap>',
+            ]
+        lines.append('</sitemapindex>')
+        self.index_changed = write_bytes_if_changed(self.index_path, ('\n'.join(lines) + '\n').encode('utf-8'),
+                                                    stats=self.stats)
+        return self.index_changed
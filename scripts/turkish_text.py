@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Arama indeksleri için Türkçe'ye duyarlı metin normalizasyonu.
+
+Python'un str.lower() fonksiyonu 'İ' harfini 'i̇' (i + birleşik nokta), 'I'
+harfini ise 'i' yapar; Türkçe'de doğrusu 'i' ve 'ı'dır. fold_turkish()
+önce Türkçe kurallarıyla küçük harfe çevirir, sonra aksanları atar
+(ç->c, ğ->g, ı->i, ö->o, ş->s, ü->u, é->e ...). Böylece "BİLİŞİM",
+"bilişim" ve "bilisim" aynı biçime iner.
+
+stem_turkish() katlanmış token'dan yaygın çekim eklerini (çoğul, iyelik,
+hal ekleri) atan hafif bir kök bulucudur; "hizmetleri", "hizmetlerin" ve
+"hizmet" aynı köke iner. Tam bir morfolojik çözümleme değildir: aynı
+kurallar indekse ve sorguya uygulandığı sürece tutarlıdır.
+
+İstemci tarafındaki karşılığı src/_helpers/search-helpers.ts'dir; iki
+taraftaki kurallar aynı kalmalıdır. Bu yüzden aksan olarak, iki dilde de
+aynı tanımlı Unicode kategorisi Mn (birleşik işaret; TS'de /\p{Mn}/u)
+atılır.
+
+Kullanım:
+    from turkish_text import fold_turkish, tokenize
+
+    fold_turkish('BİLİŞİM Teknolojileri')   # 'bilisim teknolojileri'
+    tokenize('Ado Bilişim Lab. Ltd. Şti.')  # ['ado', 'bilisim', 'lab', 'ltd', 'sti']
+    stem_turkish('yazilimlarin')            # 'yazilim'
+"""
+
+import re
+import unicodedata
+
+# str.lower()'dan önce uygulanır
+TURKISH_UPPER_TO_LOWER = str.maketrans({'İ': 'i', 'I': 'ı'})
+
+# NFKD ile ayrışmayan harfler
+EXTRA_FOLDS = str.maketrans({'ı': 'i', 'ß': 'ss', 'æ': 'ae', 'ø': 'o', 'đ': 'd', 'ł': 'l'})
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+# Katlanmış (aksansız) biçimde çekim ekleri; uzundan kısaya denenir
+TURKISH_SUFFIXES = (
+    'larinin', 'lerinin', 'larini', 'lerini', 'larinda', 'lerinde', 'larindan', 'lerinden',
+    'larin', 'lerin', 'lari', 'leri', 'lar', 'ler',
+    'ndan', 'nden', 'nin', 'nun', 'dan', 'den', 'tan', 'ten', 'nda', 'nde',
+    'si', 'su', 'in', 'un', 'da', 'de', 'ta', 'te', 'i', 'u',
+)
+TURKISH_SUFFIXES = tuple(sorted(TURKISH_SUFFIXES, key=len, reverse=True))
+
+# Ek atıldıktan sonra kalması gereken en kısa kök ve en fazla atılan ek sayısı
+MIN_STEM_LENGTH = 4
+MAX_SUFFIX_STRIPS = 2
+
+
+def fold_turkish(text):
+    """Türkçe küçük harf + aksansız biçim"""
+    if not text:
+        return ''
+    text = text.translate(TURKISH_UPPER_TO_LOWER).lower()
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(ch for ch in text if unicodedata.category(ch) != 'Mn')
+    return text.translate(EXTRA_FOLDS)
+
+
+def tokenize(text):
+    """Katlanmış metnin harf/rakam dizileri"""
+    return TOKEN_PATTERN.findall(fold_turkish(text))
+
+
+def stem_turkish(token):
+    """Katlanmış token'dan en fazla MAX_SUFFIX_STRIPS çekim eki atar"""
+    if token.isdigit():
+        return token
+    for _ in range(MAX_SUFFIX_STRIPS):
+        for suffix in TURKISH_SUFFIXES:
+            if token.endswith(suffix) and len(token) - len(suffix) >= MIN_STEM_LENGTH:
+                token = token[:-len(suffix)]
+                break
+        else:
+            break
+    return token
+
+
+def trigrams(token):
+    """Token'ın 3'lü karakter dizileri (3'ten kısa token için boş)"""
+    return {token[i:i + 3] for i in range(len(token) - 2)}
@@ -13,6 +13,8 @@ from urllib.parse import urlparse, urljoin
 import requests
 from bs4 import BeautifulSoup
 
+from company_merge import IF_EMPTY, CompanyMerger
+
 # Sosyal medya platformları ve pattern'leri
 SOCIAL_PATTERNS = {
     'linkedin': [
@@ -212,45 +214,42 @@ def extract_social_links(html, base_url):
 
     return social_links
 
+def social_link_proposals(social_links):
+    """Bulunan linklerden company_merge önerileri üretir (mevcut linklere dokunulmaz)"""
+    return [
+        (f'social.{platform}', link, IF_EMPTY)
+        for platform, link in social_links.items()
+        if link
+    ]
+
 def update_company_json(json_path, social_links, dry_run=False):
-    """JSON dosyasını sosyal medya linkleriyle günceller"""
-    try:
-        # JSON dosyasını oku
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+    """JSON dosyasını sosyal medya linkleriyle günceller (CompanyMerger ile tek yazma)"""
+    merger = CompanyMerger()
+    merger.propose(json_path, social_link_proposals(social_links))
+    updates = merger.commit(dry_run=dry_run).get(Path(json_path), [])
 
-        # Mevcut değerleri sakla
-        old_social = data.get('social', {}).copy()
-
-        # Yeni değerleri güncelle (sadece boş olanları - mevcut linklere DOKUNMA)
-        updated = False
-        for platform, link in social_links.items():
-            if link and not old_social.get(platform):
-                data['social'][platform] = link
-                updated = True
-                print(f"  📝 {platform} güncellendi: {link}")
-            elif link and old_social.get(platform):
-                # Mevcut link varsa atla - DOKUNMA
-                print(f"  ✓ {platform} zaten var, korunuyor: {old_social.get(platform)}")
-
-        if not updated:
-            print("  ℹ️  Güncellenecek yeni link bulunamadı")
-            return False
-
-        # Dosyayı kaydet
-        if not dry_run:
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            print(f"✅ Dosya güncellendi: {json_path}")
-        else:
-            print(f"🔍 DRY RUN: Dosya güncellenmedi (--dry-run)")
+    if Path(json_path) in merger.errors:
+        print(f"❌ JSON güncelleme hatası: {merger.errors[Path(json_path)]}")
+        return False
 
-        return True
+    updated_fields = {field for field, _ in updates}
+    for platform, link in social_links.items():
+        if f'social.{platform}' in updated_fields:
+            print(f"  📝 {platform} güncellendi: {link}")
+        elif link:
+            # Mevcut link varsa atla - DOKUNMA
+            print(f"  ✓ {platform} zaten var, korunuyor")
 
-    except Exception as e:
-        print(f"❌ JSON güncelleme hatası: {e}")
+    if not updated_fields:
+        print("  ℹ️  Güncellenecek yeni link bulunamadı")
         return False
 
+    if dry_run:
+        print(f"🔍 DRY RUN: Dosya güncellenmedi (--dry-run)")
+    else:
+        print(f"✅ Dosya güncellendi: {json_path}")
+    return True
+
 def main():
     import argparse
 
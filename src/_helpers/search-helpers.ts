@@ -0,0 +1,178 @@
+// scripts/turkish_text.py ile aynı kurallar: Türkçe küçük harf + aksansız biçim
+// (aksan = Unicode Mn kategorisi, Python'da unicodedata.category(ch) == 'Mn')
+const TURKISH_FOLDS: Record<string, string> = {
+  'ı': 'i',
+  'ß': 'ss',
+  'æ': 'ae',
+  'ø': 'o',
+  'đ': 'd',
+  'ł': 'l',
+};
+
+// turkish_text.TURKISH_SUFFIXES (uzundan kısaya)
+const TURKISH_SUFFIXES = [
+  'larinin', 'lerinin', 'larini', 'lerini', 'larinda', 'lerinde', 'larindan', 'lerinden',
+  'larin', 'lerin', 'lari', 'leri', 'lar', 'ler',
+  'ndan', 'nden', 'nin', 'nun', 'dan', 'den', 'tan', 'ten', 'nda', 'nde',
+  'si', 'su', 'in', 'un', 'da', 'de', 'ta', 'te', 'i', 'u',
+].sort((a, b) => b.length - a.length);
+const MIN_STEM_LENGTH = 4;
+const MAX_SUFFIX_STRIPS = 2;
+
+// search-index.json (generate-companies-list.py)
+export interface CompanySearchIndex {
+  count: number;
+  trigrams: Record<string, number[]>;
+  texts: string[];  // Şirketin katlanmış token'ları, boşlukla birleşik
+}
+
+// Kod trie düğümü: [başlangıç, bitiş, {hane: düğüm}], [başlangıç, bitiş] veya tek satır
+export type CodeTrieNode = number | [number, number] | [number, number, Record<string, CodeTrieNode>];
+
+// sector-codes/search-index.json (scripts/nace_tree.py)
+export interface SectorSearchIndex {
+  count: number;
+  terms: string[];       // Sıralı kökler
+  postings: number[][];  // Fark kodlu satır numaraları
+  codeTrie: CodeTrieNode;
+}
+
+export class SearchHelpers {
+  public static fold(str: string): string {
+    return (str || '')
+      .replace(/İ/g, 'i')
+      .replace(/I/g, 'ı')
+      .toLowerCase()
+      .normalize('NFKD')
+      .replace(/\p{Mn}/gu, '')
+      .replace(/[ıßæøđł]/g, (ch) => TURKISH_FOLDS[ch]);
+  }
+
+  public static tokenize(str: string): string[] {
+    return SearchHelpers.fold(str).match(/[a-z0-9]+/g) || [];
+  }
+
+  // Katlanmış token'dan çekim eklerini atar (turkish_text.stem_turkish)
+  public static stem(token: string): string {
+    if (/^[0-9]+$/.test(token)) {
+      return token;
+    }
+    for (let strip = 0; strip < MAX_SUFFIX_STRIPS; strip++) {
+      const suffix = TURKISH_SUFFIXES.find(
+        (s) => token.endsWith(s) && token.length - s.length >= MIN_STEM_LENGTH
+      );
+      if (!suffix) {
+        break;
+      }
+      token = token.substring(0, token.length - suffix.length);
+    }
+    return token;
+  }
+
+  // Kod önekine ("62.01") uyan satırların [başlangıç, bitiş) aralığı
+  public static lookupCode(index: SectorSearchIndex, code: string): [number, number] {
+    let node: CodeTrieNode = index.codeTrie;
+    for (const digit of code.replace(/\./g, '')) {
+      const children: Record<string, CodeTrieNode> | undefined =
+        Array.isArray(node) && node.length === 3 ? node[2] : undefined;
+      if (!children || children[digit] === undefined) {
+        return [0, 0];
+      }
+      node = children[digit];
+    }
+    return typeof node === 'number' ? [node, node + 1] : [node[0], node[1]];
+  }
+
+  // Açıklamada sorgudaki tüm kelimeleri içeren satırlar (artan sırada).
+  // Son kelime henüz yazılıyor olabileceği için önek olarak da aranır.
+  public static lookupTerms(index: SectorSearchIndex, query: string): number[] {
+    const tokens = SearchHelpers.tokenize(query);
+    let result: number[] | null = null;
+
+    for (let position = 0; position < tokens.length; position++) {
+      const token = tokens[position];
+      const rows = new Set<number>();
+      const addTerm = (i: number) => SearchHelpers.deltaDecode(index.postings[i]).forEach((row) => rows.add(row));
+
+      const stem = SearchHelpers.stem(token);
+      const exact = SearchHelpers.lowerBound(index.terms, stem);
+      if (index.terms[exact] === stem) {
+        addTerm(exact);
+      }
+      if (position === tokens.length - 1) {
+        for (let i = SearchHelpers.lowerBound(index.terms, token); i < index.terms.length && index.terms[i].startsWith(token); i++) {
+          addTerm(i);
+        }
+      }
+
+      const sorted = Array.from(rows).sort((a, b) => a - b);
+      result = result === null ? sorted : SearchHelpers.intersect(result, sorted);
+      if (result.length === 0) {
+        return [];
+      }
+    }
+
+    return result || [];
+  }
+
+  private static deltaDecode(deltas: number[]): number[] {
+    let row = 0;
+    return deltas.map((delta) => (row += delta));
+  }
+
+  private static lowerBound(sorted: string[], value: string): number {
+    let low = 0;
+    let high = sorted.length;
+    while (low < high) {
+      const middle = (low + high) >> 1;
+      if (sorted[middle] < value) {
+        low = middle + 1;
+      } else {
+        high = middle;
+      }
+    }
+    return low;
+  }
+
+  // Sorgudaki her token'ı alt dize olarak içeren şirket numaraları (artan sırada).
+  // Trigram kesişimi sadece aday verir; adaylar texts ile doğrulanır.
+  // Trigram'ı olmayan 1-2 harflik token'lar doğrudan texts üzerinde aranır.
+  public static lookup(index: CompanySearchIndex, query: string): number[] {
+    const tokens = SearchHelpers.tokenize(query);
+    if (tokens.length === 0) {
+      return [];
+    }
+
+    let candidates: number[] | null = null;
+    for (const token of tokens) {
+      for (let i = 0; i + 3 <= token.length; i++) {
+        const list = index.trigrams[token.substring(i, i + 3)] || [];
+        candidates = candidates === null ? list : SearchHelpers.intersect(candidates, list);
+        if (candidates.length === 0) {
+          return [];
+        }
+      }
+    }
+
+    const ids = candidates || Array.from({ length: index.count }, (_, id) => id);
+    return ids.filter((id) => tokens.every((token) => index.texts[id].includes(token)));
+  }
+
+  private static intersect(a: number[], b: number[]): number[] {
+    const out: number[] = [];
+    let i = 0;
+    let j = 0;
+    while (i < a.length && j < b.length) {
+      if (a[i] === b[j]) {
+        out.push(a[i]);
+        i++;
+        j++;
+      } else if (a[i] < b[j]) {
+        i++;
+      } else {
+        j++;
+      }
+    }
+    return out;
+  }
+}
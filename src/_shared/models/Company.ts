@@ -3,7 +3,28 @@ export interface CompanyListItem {
   slug: string;        // Dosya adı (ado-bilisim)
   name: string;        // Şirket adı (Ado Bilişim)
   web: string;         // Web sitesi
-  logo: string;        // Logo path
+  logo: string | null; // Logo path (diskte geçerli logo yoksa null)
+  logoWidth: number | null;  // Logo genişliği (px)
+  logoHeight: number | null; // Logo yüksekliği (px)
+}
+
+// data/company-list/manifest.json: sayfalı şirket listesi
+export interface CompanyListPage {
+  file: string;        // page-1.json
+  count: number;       // Sayfadaki şirket sayısı
+  sha1: string;        // İçerik hash'i (önbellek anahtarı)
+  first: string;       // İlk şirketin slug'ı
+  last: string;        // Son şirketin slug'ı
+}
+
+export interface CompanyListManifest {
+  total: number;
+  pageSize: number;
+  pages: CompanyListPage[];
+  searchIndex: {       // Arama indeksi (search-index.json)
+    file: string;
+    sha1: string;
+  };
 }
 
 export class Company {
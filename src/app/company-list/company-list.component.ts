@@ -1,9 +1,12 @@
-import { Component, OnInit, ViewEncapsulation } from '@angular/core';
+import { Component, HostListener, OnInit, ViewEncapsulation } from '@angular/core';
 import { HttpClient } from '@angular/common/http';
 import { CommonModule } from '@angular/common';
 import { RouterModule } from '@angular/router';
 import { FormsModule } from '@angular/forms';
-import { CompanyListItem } from '../../_shared/models/Company';
+import { forkJoin, Observable, of } from 'rxjs';
+import { map, shareReplay, switchMap, tap } from 'rxjs/operators';
+import { CompanySearchIndex, SearchHelpers } from '../../_helpers/search-helpers';
+import { CompanyListItem, CompanyListManifest, CompanyListPage } from '../../_shared/models/Company';
 import { SeoService } from '../../_shared/services/seo.service';
 
 @Component({
@@ -18,6 +21,19 @@ export class CompanyListComponent implements OnInit {
   companies: CompanyListItem[] = [];
   filteredCompanies: CompanyListItem[] = [];
   searchTerm: string = '';
+  totalCount: number = 0;
+  matchCount: number = 0;
+
+  // Sayfalı yükleme: manifest, sayfa önbelleği ve sırayla gösterilen sayfa sayısı
+  private manifest?: CompanyListManifest;
+  private pageData: CompanyListItem[][] = [];
+  private pageRequests = new Map<number, Observable<CompanyListItem[]>>();
+  private loadedPages = 0;
+  private loading = false;
+
+  // Arama: search-index.json ilk aramada bir kez yüklenir
+  private searchIndex$?: Observable<CompanySearchIndex>;
+  private searchRequest = 0;
 
   constructor(
     private http: HttpClient,
@@ -28,25 +44,88 @@ export class CompanyListComponent implements OnInit {
     // SEO ayarları
     this.seoService.setCompanyListPage();
 
-    this.http.get<CompanyListItem[]>('/data/companies.json').subscribe((data) => {
-      this.companies = data;
-      this.filteredCompanies = data;
+    // Önce manifest ve ilk sayfa; kalan sayfalar kaydırma veya aramada yüklenir
+    this.http.get<CompanyListManifest>('/data/company-list/manifest.json').subscribe((manifest) => {
+      this.manifest = manifest;
+      this.totalCount = manifest.total;
+      this.loadNextPage();
+    });
+  }
+
+  @HostListener('window:scroll')
+  onScroll() {
+    const nearBottom = window.innerHeight + window.scrollY >= document.body.offsetHeight - 800;
+    if (nearBottom && !this.searchTerm.trim()) {
+      this.loadNextPage();
+    }
+  }
+
+  // Sayfa numarası (0'dan) -> şirketler; her sayfa en fazla bir kez istenir
+  private getPage(number: number): Observable<CompanyListItem[]> {
+    let request = this.pageRequests.get(number);
+    if (!request) {
+      const page: CompanyListPage = this.manifest!.pages[number];
+      request = this.http.get<CompanyListItem[]>(`/data/company-list/${page.file}?v=${page.sha1}`).pipe(
+        tap((data) => this.pageData[number] = data),
+        shareReplay(1)
+      );
+      this.pageRequests.set(number, request);
+    }
+    return request;
+  }
+
+  private loadNextPage() {
+    if (!this.manifest || this.loading || this.loadedPages >= this.manifest.pages.length) {
+      return;
+    }
+
+    this.loading = true;
+    this.getPage(this.loadedPages).subscribe((data) => {
+      this.companies = this.companies.concat(data);
+      this.loadedPages++;
+      this.loading = false;
+      if (!this.searchTerm.trim()) {
+        this.filteredCompanies = this.companies;
+      }
     });
   }
 
+  private getSearchIndex(): Observable<CompanySearchIndex> {
+    if (!this.searchIndex$) {
+      const file = this.manifest!.searchIndex;
+      this.searchIndex$ = this.http.get<CompanySearchIndex>(`/data/company-list/${file.file}?v=${file.sha1}`).pipe(
+        shareReplay(1)
+      );
+    }
+    return this.searchIndex$;
+  }
+
   filterCompanies() {
-    const term = this.searchTerm.toLowerCase().trim();
+    const term = this.searchTerm.trim();
+    const request = ++this.searchRequest;
 
-    if (!term) {
+    if (!term || !this.manifest) {
       this.filteredCompanies = this.companies;
       return;
     }
 
-    this.filteredCompanies = this.companies.filter(company =>
-      company.name.toLowerCase().includes(term) ||
-      company.web?.toLowerCase().includes(term) ||
-      company.slug.toLowerCase().includes(term)
-    );
+    // İndeksten eşleşen şirket numaraları, sonra sadece o numaraların sayfaları
+    const pageSize = this.manifest.pageSize;
+    this.getSearchIndex().pipe(
+      switchMap((index) => {
+        const ids = SearchHelpers.lookup(index, term);
+        const pages = Array.from(new Set(ids.map((id) => Math.floor(id / pageSize))));
+        const pagesLoaded = pages.length ? forkJoin(pages.map((number) => this.getPage(number))) : of([]);
+        return pagesLoaded.pipe(map(() => ids));
+      })
+    ).subscribe((ids) => {
+      // Bu arada yeni bir arama başladıysa sonucu kullanma
+      if (request !== this.searchRequest) {
+        return;
+      }
+      this.matchCount = ids.length;
+      this.filteredCompanies = ids.map((id) => this.pageData[Math.floor(id / pageSize)][id % pageSize]);
+    });
   }
 
   clearSearch() {
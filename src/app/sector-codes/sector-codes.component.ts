@@ -2,6 +2,9 @@ import { Component, OnInit } from '@angular/core';
 import { CommonModule } from '@angular/common';
 import { FormsModule } from '@angular/forms';
 import { HttpClient } from '@angular/common/http';
+import { forkJoin, Observable } from 'rxjs';
+import { map, shareReplay } from 'rxjs/operators';
+import { SearchHelpers, SectorSearchIndex } from '../../_helpers/search-helpers';
 import { SeoService } from '../../_shared/services/seo.service';
 
 interface Sector {
@@ -13,6 +16,39 @@ interface SectorData {
   sectors: Sector[];
 }
 
+// data/sector-codes/tree.json (scripts/nace_tree.py)
+interface NaceClass {
+  code: string;
+  count: number;
+  offset: number;      // Bölüm dosyasındaki byte aralığı
+  length: number;
+}
+
+interface NaceGroup extends NaceClass {
+  classes: NaceClass[];
+}
+
+interface NaceDivision {
+  code: string;
+  count: number;
+  file: string;        // division-46.jsonl
+  bytes: number;
+  sha1: string;
+  groups: NaceGroup[];
+}
+
+interface NaceSection {
+  code: string;        // A..U
+  name: string;
+  count: number;
+  divisions: NaceDivision[];
+}
+
+interface NaceTree {
+  total: number;
+  sections: NaceSection[];
+}
+
 @Component({
   selector: 'app-sector-codes',
   standalone: true,
@@ -28,6 +64,15 @@ export class SectorCodesComponent implements OnInit {
   error: string = '';
   totalSectors: number = 0;
 
+  // Gezinme: ağaç bir kez, bölümler açıldıkça tek tek yüklenir
+  tree?: NaceTree;
+  openDivision: string = '';
+  divisionSectors: Record<string, Sector[]> = {};
+
+  // Tam liste ve arama indeksi sadece arama ve indirme için istenir
+  private allSectors$?: Observable<Sector[]>;
+  private searchIndex$?: Observable<SectorSearchIndex>;
+
   constructor(
     private http: HttpClient,
     private seoService: SeoService
@@ -46,11 +91,10 @@ export class SectorCodesComponent implements OnInit {
     this.loading = true;
     this.error = '';
 
-    this.http.get<SectorData>('/data/SektorKodlari.json').subscribe({
-      next: (data) => {
-        this.sectors = data.sectors || [];
-        this.filteredSectors = [...this.sectors];
-        this.totalSectors = this.sectors.length;
+    this.http.get<NaceTree>('/data/sector-codes/tree.json').subscribe({
+      next: (tree) => {
+        this.tree = tree;
+        this.totalSectors = tree.total;
         this.loading = false;
       },
       error: (err) => {
@@ -61,20 +105,82 @@ export class SectorCodesComponent implements OnInit {
     });
   }
 
+  toggleDivision(division: NaceDivision): void {
+    if (this.openDivision === division.code) {
+      this.openDivision = '';
+      return;
+    }
+
+    this.openDivision = division.code;
+    if (this.divisionSectors[division.code]) {
+      return;
+    }
+
+    // Satır başına bir {"code", "name"} (JSON Lines)
+    this.http.get(`/data/sector-codes/${division.file}?v=${division.sha1}`, { responseType: 'text' }).subscribe({
+      next: (text) => {
+        this.divisionSectors[division.code] = text
+          .split('\n')
+          .filter((line) => line)
+          .map((line) => JSON.parse(line) as Sector);
+      },
+      error: (err) => {
+        console.error('Sektör bölümü yüklenemedi:', err);
+        this.openDivision = '';
+      }
+    });
+  }
+
+  private loadAllSectors(): Observable<Sector[]> {
+    if (!this.allSectors$) {
+      this.allSectors$ = this.http.get<SectorData>('/data/SektorKodlari.json').pipe(
+        map((data) => data.sectors || []),
+        shareReplay(1)
+      );
+    }
+    return this.allSectors$;
+  }
+
+  private loadSearchIndex(): Observable<SectorSearchIndex> {
+    if (!this.searchIndex$) {
+      this.searchIndex$ = this.http.get<SectorSearchIndex>('/data/sector-codes/search-index.json').pipe(
+        shareReplay(1)
+      );
+    }
+    return this.searchIndex$;
+  }
+
   onSearchChange(): void {
     if (!this.searchText || this.searchText.trim() === '') {
-      this.filteredSectors = [...this.sectors];
+      this.filteredSectors = [];
       return;
     }
 
-    const searchLower = this.searchText.toLowerCase().trim();
-    this.filteredSectors = this.sectors.filter(sector =>
-      sector.code.toLowerCase().includes(searchLower) ||
-      sector.name.toLowerCase().includes(searchLower)
-    );
+    forkJoin([this.loadAllSectors(), this.loadSearchIndex()]).subscribe(([sectors, index]) => {
+      this.sectors = sectors;
+      const query = this.searchText.trim();
+      if (!query) {
+        return;
+      }
+
+      // "62.01" gibi sorgular kod trie'sinden, kelimeler açıklama indeksinden
+      if (/^[0-9.]+$/.test(query)) {
+        const [start, end] = SearchHelpers.lookupCode(index, query);
+        this.filteredSectors = this.sectors.slice(start, end);
+      } else {
+        this.filteredSectors = SearchHelpers.lookupTerms(index, query).map((row) => this.sectors[row]);
+      }
+    });
   }
 
   downloadJson(): void {
+    this.loadAllSectors().subscribe((sectors) => {
+      this.sectors = sectors;
+      this.saveJson();
+    });
+  }
+
+  private saveJson(): void {
     try {
       const dataToDownload = {
         title: "NACE Sektör Kodları - Tüm Veriler",